@@ -0,0 +1,196 @@
+"""
+Cache de respostas de leitura (boards, colunas, tarefas) com invalidação por versão
+
+Cada entidade (projeto, board, coluna) tem uma chave de versão. As respostas
+em cache incluem a versão atual na chave, então as escritas só precisam
+incrementar a versão (INCR) para invalidar todas as leituras daquela entidade;
+as entradas antigas expiram pelo TTL.
+
+Backends (settings.CACHE_BACKEND):
+- "none": cache desligado
+- "memory": dicionário em memória com a mesma semântica do Redis (testes/dev)
+- "redis": Redis compartilhado entre workers (settings.REDIS_URL)
+"""
+
+import logging
+import time
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
+from uuid import UUID
+import orjson
+from app.core.config import settings
+from app.utils.fast_json import json_dumps
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "kanban:cache"
+
+
+def _canonical_id(entity_id: Any) -> str:
+    # IDs chegam como str do path ou UUID dos models: a chave precisa ser a mesma
+    try:
+        return str(UUID(str(entity_id)))
+    except ValueError:
+        return str(entity_id)
+
+
+class CacheSlot(NamedTuple):
+    key: str
+    metric: str
+
+
+class MemoryCacheBackend:
+    """
+    Backend em memória com a interface mínima de Redis usada pelo cache
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[Optional[float], str]] = {}
+
+    def _alive(self, key: str) -> Optional[str]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._alive(key)
+
+    async def set(self, key: str, value: str, ex: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + ex if ex else None
+        self._data[key] = (expires_at, value)
+
+    async def incr(self, key: str) -> int:
+        value = int(self._alive(key) or 0) + 1
+        self._data[key] = (None, str(value))
+        return value
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._data.pop(key, None)
+
+    async def flushdb(self) -> None:
+        self._data.clear()
+
+
+class ResponseCache:
+    """
+    Cache versionado de respostas serializadas em JSON, com métricas de uso
+    """
+
+    def __init__(self, backend=None, ttl_seconds: int = 300):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.saved_seconds = 0.0
+        # Média móvel do tempo de carga no banco (miss) por tipo de resposta
+        self._load_seconds: Dict[str, float] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    @staticmethod
+    def _version_key(scope: str, canonical_id: str) -> str:
+        return f"{KEY_PREFIX}:v:{scope}:{canonical_id}"
+
+    async def lookup(
+        self, scope: str, entity_id: Any, name: str
+    ) -> Tuple[Optional[Any], Optional[CacheSlot]]:
+        """
+        Busca a resposta em cache
+
+        Retorna (valor ou None, slot). O slot fixa a versão lida *antes* da
+        consulta ao banco: se uma escrita incrementar a versão no meio, o
+        store() grava na versão antiga e o dado desatualizado nunca é servido.
+        """
+        if not self.enabled:
+            return None, None
+
+        canonical_id = _canonical_id(entity_id)
+        try:
+            version = await self.backend.get(self._version_key(scope, canonical_id)) or "0"
+            slot = CacheSlot(
+                key=f"{KEY_PREFIX}:{scope}:{canonical_id}:{version}:{name}",
+                metric=f"{scope}:{name}",
+            )
+            raw = await self.backend.get(slot.key)
+        except Exception:
+            self.errors += 1
+            logger.warning("Cache read failed for %s:%s", scope, entity_id, exc_info=True)
+            return None, None
+
+        if raw is None:
+            self.misses += 1
+            return None, slot
+
+        self.hits += 1
+        self.saved_seconds += self._load_seconds.get(slot.metric, 0.0)
+        return orjson.loads(raw), slot
+
+    async def store(self, slot: Optional[CacheSlot], value: Any, load_seconds: float = 0.0) -> None:
+        """
+        Armazena a resposta no slot obtido em lookup()
+
+        O valor é codificado pelo orjson: além dos tipos JSON, aceita UUIDs,
+        datetimes e enums (ex.: linhas de app.utils.fast_json.rows_payload).
+
+        `load_seconds` é o tempo gasto para montá-la a partir do banco, usado na
+        métrica de latência economizada pelos hits.
+        """
+        if slot is None:
+            return
+
+        previous = self._load_seconds.get(slot.metric)
+        self._load_seconds[slot.metric] = (
+            load_seconds if previous is None else previous * 0.9 + load_seconds * 0.1
+        )
+        try:
+            await self.backend.set(slot.key, json_dumps(value).decode(), ex=self.ttl_seconds)
+        except Exception:
+            self.errors += 1
+            logger.warning("Cache write failed for %s", slot.key, exc_info=True)
+
+    async def bump(self, scope: str, *entity_ids: Any) -> None:
+        """Invalida as respostas das entidades incrementando suas versões"""
+        if not self.enabled:
+            return
+        for entity_id in {_canonical_id(entity_id) for entity_id in entity_ids if entity_id}:
+            try:
+                await self.backend.incr(self._version_key(scope, entity_id))
+            except Exception:
+                self.errors += 1
+                logger.warning(
+                    "Cache invalidation failed for %s:%s", scope, entity_id, exc_info=True
+                )
+
+    def stats(self) -> Dict[str, Union[int, float, str]]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": settings.CACHE_BACKEND,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "saved_ms": round(self.saved_seconds * 1000, 2),
+        }
+
+
+def create_backend():
+    """Instancia o backend configurado em settings.CACHE_BACKEND"""
+    if settings.CACHE_BACKEND == "redis":
+        from redis.asyncio import Redis
+
+        return Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    if settings.CACHE_BACKEND == "memory":
+        return MemoryCacheBackend()
+    return None
+
+
+# Instância global do cache de respostas
+response_cache = ResponseCache(backend=create_backend(), ttl_seconds=settings.CACHE_TTL_SECONDS)
@@ -32,12 +32,98 @@ class Settings(BaseSettings):
             return url.replace("postgresql://", "postgresql+asyncpg://")
         return url
 
+    # Pool de conexões por processo (o gunicorn.conf.py ajusta por worker,
+    # respeitando DB_CONNECTION_BUDGET)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    # O schema é gerenciado pelo Alembic; true cria as tabelas faltantes no startup (dev)
+    DB_AUTO_CREATE_TABLES: bool = False
+
     # Security
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-change-this-in-production")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # Hash de senhas: custo do bcrypt (hashes antigos são refeitos no login) e
+    # pool de processos dedicado, para que rajadas de login não travem o worker.
+    # Com mais de PASSWORD_HASH_MAX_PENDING hashes pendentes, register/login
+    # respondem 503 com Retry-After. PASSWORD_HASH_WORKERS=0 usa o threadpool.
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 1
+
+    # Autenticação: como get_current_user resolve o usuário do token
+    # - "db": consulta a tabela users em toda requisição
+    # - "cache": consulta users apenas em cache miss (LRU com TTL, por processo)
+    # - "claims": confia nas claims assinadas (sub/active/su) até o token expirar
+    AUTH_MODE: str = "cache"
+    AUTH_USER_CACHE_SIZE: int = 10000
+    AUTH_USER_CACHE_TTL_SECONDS: int = 60
+
+    # Ordenação de tarefas dentro das colunas
+    # - "position": inteiros contíguos; mover/excluir desloca as tarefas vizinhas
+    # - "rank": ranks lexicográficos; mover/excluir grava apenas a própria tarefa
+    # Em "position" as tarefas novas ficam com rank NULL: antes de mudar para "rank",
+    # rode `python -m app.services.task_ordering --from-position`
+    TASK_ORDERING: str = "position"
+    # Ranks maiores que isso disparam o rebalanceamento da coluna em background
+    TASK_RANK_MAX_LENGTH: int = 32
+
+    # Cache de respostas de leitura: "none" | "memory" | "redis"
+    CACHE_BACKEND: str = "none"
+    CACHE_TTL_SECONDS: int = 300
+    REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+    # Atualizações em tempo real (/ws/boards/{board_id})
+    # - "memory": fan-out no próprio processo (um único worker)
+    # - "redis": pub/sub em REDIS_URL, entregando eventos de qualquer worker
+    REALTIME_BACKEND: str = "memory"
+    # Eventos pendentes por conexão antes de pedir ao cliente um resync do board
+    REALTIME_QUEUE_SIZE: int = 100
+
+    # Log de atividades (activity_logs), gravado em lotes fora do caminho da requisição
+    # - "memory": fila no processo; INSERT de várias linhas a cada ACTIVITY_FLUSH_INTERVAL_MS
+    #   ou ACTIVITY_BATCH_SIZE eventos (o que vier primeiro)
+    # - "redis": stream em REDIS_URL consumido em grupo pelos workers; eventos não
+    #   gravados sobrevivem a restart/crash de um worker
+    # - "none": desativado
+    ACTIVITY_BACKEND: str = "memory"
+    ACTIVITY_BATCH_SIZE: int = 500
+    ACTIVITY_FLUSH_INTERVAL_MS: int = 1000
+    # Eventos pendentes no máximo; com a fila cheia a rota espera até
+    # ACTIVITY_ENQUEUE_TIMEOUT_MS por espaço e então descarta o evento
+    ACTIVITY_QUEUE_SIZE: int = 10000
+    ACTIVITY_ENQUEUE_TIMEOUT_MS: int = 100
+    # Particionamento mensal de activity_logs (python -m app.services.activity_partitions):
+    # partições criadas com ACTIVITY_PARTITION_PREMAKE_MONTHS meses de antecedência e
+    # partições com mais de ACTIVITY_RETENTION_MONTHS meses (0 = manter tudo) removidas
+    # - ACTIVITY_RETENTION_ACTION "archive": exporta antes para ACTIVITY_ARCHIVE_DIR
+    #   (ACTIVITY_ARCHIVE_FORMAT "jsonl" gzip, ou "parquet" se o pyarrow estiver instalado)
+    # - ACTIVITY_RETENTION_ACTION "drop": remove sem exportar
+    ACTIVITY_PARTITION_PREMAKE_MONTHS: int = 3
+    ACTIVITY_RETENTION_MONTHS: int = 12
+    ACTIVITY_RETENTION_ACTION: str = "archive"
+    ACTIVITY_ARCHIVE_DIR: str = "archive/activity_logs"
+    ACTIVITY_ARCHIVE_FORMAT: str = "jsonl"
+
+    # Middlewares HTTP: respostas maiores que GZIP_MINIMUM_SIZE bytes são
+    # comprimidas; requisições acima de SLOW_REQUEST_MS são registradas em log
+    GZIP_MINIMUM_SIZE: int = 1000
+    SLOW_REQUEST_MS: int = 500
+
+    # Observabilidade: GET /metrics (Prometheus) e o header Server-Timing com o
+    # tempo da aplicação e do banco (app;dur=..., db;dur=...;desc="N queries")
+    METRICS_ENABLED: bool = True
+    SERVER_TIMING_ENABLED: bool = True
+
+    # Orçamento de queries das rotas (@query_budget) e detecção de N+1:
+    # "off", "warn" (log) ou "raise" (testes: a requisição levanta QueryBudgetExceeded).
+    # O mesmo SQL executado QUERY_REPEAT_THRESHOLD vezes numa requisição é tratado como N+1
+    QUERY_BUDGET_MODE: str = "off"
+    QUERY_REPEAT_THRESHOLD: int = 3
+
     # Application
     APP_NAME: str = "Leap Tech Kanban"
     APP_VERSION: str = "1.0.0"
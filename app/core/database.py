@@ -1,40 +1,29 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
 )
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
-from typing import Generator, AsyncGenerator
+from typing import Generator, AsyncGenerator, Optional
 from app.core.config import settings
+from app.core.metrics import instrument_engine
 
 # Base para os models
 Base = declarative_base()
 
-# Engine síncrono (para Alembic migrations)
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-)
-
-# Session síncrona
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Engines criados sob demanda: importar a aplicação não abre conexões e cada
+# processo só constrói o engine que realmente usa (a API usa apenas o async)
+_engine: Optional[Engine] = None
+_async_engine: Optional[AsyncEngine] = None
 
-# Engine assíncrono (para uso na API)
-async_engine = create_async_engine(
-    settings.DATABASE_URL_ASYNC,
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-)
+# Session síncrona (vinculada ao engine em get_engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
 
-# Session assíncrona
+# Session assíncrona (vinculada ao engine em get_async_engine)
 AsyncSessionLocal = async_sessionmaker(
-    async_engine,
     class_=AsyncSession,
     expire_on_commit=False,
     autocommit=False,
@@ -42,11 +31,75 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+def _pool_options(url: str) -> dict:
+    """Limites do pool por processo (o SQLite dos testes usa o pool padrão do dialeto)"""
+    if url.startswith("sqlite"):
+        return {}
+    return {"pool_size": settings.DB_POOL_SIZE, "max_overflow": settings.DB_MAX_OVERFLOW}
+
+
+def get_engine() -> Engine:
+    """
+    Engine síncrono (scripts e utilitários), criado na primeira chamada
+    """
+    global _engine
+    if _engine is None:
+        _engine = create_engine(
+            settings.DATABASE_URL,
+            echo=settings.DEBUG,
+            pool_pre_ping=True,
+            **_pool_options(settings.DATABASE_URL),
+        )
+        instrument_engine(_engine, "sync")
+        SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Engine assíncrono da API, criado no lifespan (ou na primeira sessão)
+    """
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            settings.DATABASE_URL_ASYNC,
+            echo=settings.DEBUG,
+            pool_pre_ping=True,
+            **_pool_options(settings.DATABASE_URL_ASYNC),
+        )
+        instrument_engine(_async_engine.sync_engine, "async")
+        AsyncSessionLocal.configure(bind=_async_engine)
+    return _async_engine
+
+
+async def dispose_engines() -> None:
+    """Fecha os pools de conexão (shutdown da aplicação)"""
+    global _engine, _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+    if _engine is not None:
+        _engine.dispose()
+        _engine = None
+
+
+def reset_engines_after_fork() -> None:
+    """
+    Descarta pools herdados de um processo pai sem fechar as conexões dele
+    (gunicorn post_fork com preload_app)
+    """
+    if _engine is not None:
+        _engine.dispose(close=False)
+    if _async_engine is not None:
+        _async_engine.sync_engine.dispose(close=False)
+
+
 # Dependency para obter session do banco (síncrono)
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency que fornece uma sessão do banco de dados
     """
+    get_engine()
     db = SessionLocal()
     try:
         yield db
@@ -59,6 +112,7 @@ async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency que fornece uma sessão assíncrona do banco de dados
     """
+    get_async_engine()
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -72,7 +126,7 @@ def create_tables():
     Cria todas as tabelas no banco de dados
     Usar apenas em desenvolvimento - em produção use Alembic migrations
     """
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
 
 
 # Função para deletar todas as tabelas (útil para testes)
@@ -81,4 +135,4 @@ def drop_tables():
     Remove todas as tabelas do banco de dados
     CUIDADO: Use apenas em desenvolvimento/testes
     """
-    Base.metadata.drop_all(bind=engine)
+    Base.metadata.drop_all(bind=get_engine())
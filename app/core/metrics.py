@@ -0,0 +1,153 @@
+"""
+Métricas Prometheus da API (GET /metrics)
+
+- http_request_duration_seconds{method, route, status}: latência por template de rota
+- http_request_db_queries{route}: queries SQL por requisição (histograma, mostra N+1)
+- db_queries_total{route} e db_query_duration_seconds_total{route}: queries e tempo de banco
+- db_pool_size / db_pool_checked_out / db_pool_overflow{engine}: estado do pool de conexões
+
+As queries são medidas pelos eventos before/after_cursor_execute dos engines
+(instrument_engine, chamado em app.core.database) e somadas na RequestStats da
+requisição corrente, aberta pelo TimingMiddleware em request_stats_var. Queries
+fora de requisições (activity writer, scripts) entram com route="background".
+
+Com vários workers (gunicorn), defina PROMETHEUS_MULTIPROC_DIR: cada processo
+grava as métricas no diretório e o /metrics de qualquer worker agrega todos.
+"""
+
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+# Rota de queries que não pertencem a uma requisição HTTP
+BACKGROUND_ROUTE = "background"
+# Requisições que não casaram com nenhuma rota (404): um único rótulo, sem o path
+UNMATCHED_ROUTE = "unmatched"
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Latência das requisições HTTP por template de rota",
+    ["method", "route", "status"],
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Queries SQL executadas por requisição",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100),
+)
+DB_QUERIES = Counter("db_queries", "Queries SQL executadas", ["route"])
+DB_QUERY_SECONDS = Counter("db_query_duration_seconds", "Tempo gasto em queries SQL", ["route"])
+POOL_SIZE = Gauge(
+    "db_pool_size", "Conexões mantidas pelo pool", ["engine"], multiprocess_mode="livesum"
+)
+POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Conexões do pool em uso", ["engine"], multiprocess_mode="livesum"
+)
+POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Conexões abertas além de pool_size (max_overflow)",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+
+
+@dataclass
+class RequestStats:
+    """Queries e tempo de banco acumulados durante uma requisição"""
+
+    queries: int = 0
+    db_seconds: float = 0.0
+    # SQL executados, na ordem; só gravados quando não é None (QueryBudgetMiddleware)
+    statements: Optional[List[str]] = None
+
+
+# Estatísticas da requisição atual (None fora de requisições HTTP)
+request_stats_var: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+# Pools instrumentados, por nome do engine ("sync"/"async")
+_pools: Dict[str, Pool] = {}
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    stats = request_stats_var.get()
+    if stats is None:
+        DB_QUERIES.labels(BACKGROUND_ROUTE).inc()
+        DB_QUERY_SECONDS.labels(BACKGROUND_ROUTE).inc(elapsed)
+        return
+    stats.queries += 1
+    stats.db_seconds += elapsed
+    if stats.statements is not None:
+        stats.statements.append(statement)
+
+
+def _handle_error(exception_context) -> None:
+    # Query que falhou: descarta o início registrado em before_cursor_execute
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started"):
+        connection.info["query_started"].pop()
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """
+    Mede as queries do engine e expõe o estado do pool (engines async: passe
+    engine.sync_engine)
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+    _pools[name] = engine.pool
+    refresh_pool_gauges()
+
+
+def refresh_pool_gauges() -> None:
+    for name, pool in _pools.items():
+        # NullPool/StaticPool (SQLite) não têm contadores
+        if not hasattr(pool, "checkedout"):
+            continue
+        POOL_SIZE.labels(name).set(pool.size())
+        POOL_CHECKED_OUT.labels(name).set(pool.checkedout())
+        # overflow() é negativo enquanto o pool ainda não abriu pool_size conexões
+        POOL_OVERFLOW.labels(name).set(max(pool.overflow(), 0))
+
+
+def observe_request(
+    method: str, route: Optional[str], status_code: int, seconds: float, stats: RequestStats
+) -> None:
+    route = route or UNMATCHED_ROUTE
+    REQUEST_DURATION.labels(method, route, str(status_code)).observe(seconds)
+    REQUEST_QUERIES.labels(route).observe(stats.queries)
+    if stats.queries:
+        DB_QUERIES.labels(route).inc(stats.queries)
+        DB_QUERY_SECONDS.labels(route).inc(stats.db_seconds)
+    refresh_pool_gauges()
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Corpo e content type do GET /metrics"""
+    refresh_pool_gauges()
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
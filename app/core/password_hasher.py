@@ -0,0 +1,93 @@
+"""
+Execução do bcrypt em um pool de processos dedicado, com controle de admissão
+
+bcrypt consome ~250 ms de CPU por operação (custo 12). Rodando no threadpool
+do worker, uma rajada de logins disputa o GIL com o event loop e atrasa todas
+as outras rotas. Aqui os hashes rodam em processos separados e o número de
+operações pendentes é limitado: acima do limite a requisição é recusada na
+hora com 503 + Retry-After, em vez de esperar em uma fila sem fim.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_password
+
+
+class PasswordHasher:
+    """
+    Fachada assíncrona para hash/verificação de senhas
+    """
+
+    def __init__(self, workers: int, max_pending: int, retry_after_seconds: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.retry_after_seconds = retry_after_seconds
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def start(self) -> None:
+        """Cria o pool (chamado no startup; também criado sob demanda)"""
+        if self.workers > 0 and self._executor is None:
+            # "spawn": o worker da API já tem threads, e fork com threads ativas é inseguro
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            # Espera só os hashes em execução (os da fila são cancelados): encerra os
+            # processos filhos antes do interpretador, sem vazar semáforos
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service busy, try again later",
+                headers={"Retry-After": str(self.retry_after_seconds)},
+            )
+
+        self.pending += 1
+        try:
+            if self.workers > 0:
+                self.start()
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self._executor, func, *args)
+            else:
+                result = await run_in_threadpool(func, *args)
+        finally:
+            self.pending -= 1
+        self.completed += 1
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, password, hashed_password)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "workers": self.workers,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+
+# Instância global usada pelas rotas de autenticação
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    retry_after_seconds=settings.PASSWORD_HASH_RETRY_AFTER_SECONDS,
+)
@@ -25,13 +25,26 @@ def get_password_hash(password: str) -> str:
     password_bytes = password.encode("utf-8")
 
     # Gerar salt e hash
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
 
     # Retornar como string
     return hashed.decode("utf-8")
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Indica se o hash foi gerado com um custo diferente de settings.BCRYPT_ROUNDS
+
+    Hashes bcrypt têm o formato $2b$<custo>$<salt+hash>.
+    """
+    parts = hashed_password.split("$")
+    try:
+        return int(parts[2]) != settings.BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Cria um token JWT de acesso
@@ -74,6 +87,20 @@ def create_refresh_token(data: dict) -> str:
     return encoded_jwt
 
 
+def user_token_claims(user) -> dict:
+    """
+    Claims de identidade gravadas nos tokens do usuário
+
+    "active" e "su" permitem que AUTH_MODE="claims" autorize a requisição sem
+    consultar o banco enquanto o token for válido
+    """
+    return {
+        "sub": str(user.id),
+        "active": bool(user.is_active),
+        "su": bool(user.is_superuser),
+    }
+
+
 def decode_token(token: str) -> Optional[dict]:
     """
     Decodifica e valida um token JWT
@@ -0,0 +1,104 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Dict, Optional, Tuple, Union
+from uuid import UUID
+import time
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    """
+    Identidade mínima do usuário autenticado
+    Suficiente para autorização nas rotas, sem carregar a linha inteira de users
+    """
+
+    id: UUID
+    is_active: bool
+    is_superuser: bool
+
+
+class UserCache:
+    """
+    Cache LRU em memória de UserPrincipal, limitado por tamanho e TTL
+
+    O cache é por processo: invalidações explícitas valem apenas para o worker
+    atual, e o TTL limita por quanto tempo outros workers enxergam dados antigos.
+    """
+
+    def __init__(
+        self, maxsize: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic
+    ):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        # Relógio das expirações (substituível nos testes)
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, UserPrincipal]]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, user_id: Union[str, UUID]) -> Optional[UserPrincipal]:
+        """Retorna o principal em cache ou None (expirado/ausente)"""
+        key = str(user_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, principal = entry
+            if expires_at < self.clock():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return principal
+
+    def set(self, principal: UserPrincipal) -> None:
+        """Armazena o principal, removendo o menos usado se exceder o tamanho"""
+        if self.maxsize <= 0:
+            return
+
+        key = str(principal.id)
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl_seconds, principal)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, user_id: Union[str, UUID]) -> None:
+        """Remove o usuário do cache (chamar quando ele for alterado/desativado)"""
+        with self._lock:
+            if self._entries.pop(str(user_id), None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Contadores de uso do cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# Instância global do cache de usuários autenticados
+user_cache = UserCache(
+    maxsize=settings.AUTH_USER_CACHE_SIZE,
+    ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,12 @@
+from uvicorn.workers import UvicornWorker
+
+
+class KanbanUvicornWorker(UvicornWorker):
+    """
+    Worker do Gunicorn com event loop e parser HTTP fixos (uvloop + httptools)
+
+    O UvicornWorker padrão usa "auto" e cai silenciosamente para asyncio/h11
+    quando as extensões não estão instaladas; aqui a ausência é um erro de boot.
+    """
+
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "ws": "websockets"}
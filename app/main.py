@@ -1,14 +1,54 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from app.core.cache import response_cache
 from app.core.config import settings
-from app.routes import auth, tasks, projects, boards, columns, documentation
+from app.core.metrics import render_metrics
+from app.core.password_hasher import password_hasher
+from app.core.user_cache import user_cache
+from app.middleware.query_budget import QueryBudgetMiddleware
+from app.middleware.request_id import RequestIdMiddleware
+from app.middleware.timing import TimingMiddleware
+from app.middleware.trailing_slash import TrailingSlashMiddleware
+from app.routes import auth, tasks, projects, boards, columns, comments, tags, documentation, ws
+from app.services.activity import activity_writer
+from app.services.realtime import board_broker
+
+from app.core.database import Base, dispose_engines, get_async_engine
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Startup/shutdown da aplicação
+
+    O schema é responsabilidade do Alembic (`alembic upgrade head`); com
+    DB_AUTO_CREATE_TABLES=true as tabelas que faltarem são criadas aqui, no
+    startup, e não mais ao importar app.main.
+    """
+    print(f"🚀 Starting {settings.APP_NAME} v{settings.APP_VERSION}")
+    db_info = settings.DATABASE_URL.split("@")[-1] if "@" in settings.DATABASE_URL else "Localhost"
+    print(f"📊 Database: {db_info}")
+    print(f"🌍 Environment: {'Development' if settings.DEBUG else 'Production'}")
+
+    engine = get_async_engine()
+    if settings.DB_AUTO_CREATE_TABLES:
+        # Os models já foram registrados no metadata pelos imports das rotas
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+    password_hasher.start()
+    activity_writer.start()
 
-# ✅ Importações para criação automática das tabelas
-from app.core.database import engine
-from app.models.base import Base
+    yield
+
+    print("👋 Shutting down application...")
+    await board_broker.close()
+    # Grava os eventos pendentes do log de atividades antes de fechar o pool
+    await activity_writer.close()
+    password_hasher.shutdown()
+    await dispose_engines()
 
-# ✅ Cria as tabelas no banco de dados se elas não existirem
-Base.metadata.create_all(bind=engine)
 
 # Criar aplicação FastAPI
 app = FastAPI(
@@ -18,6 +58,8 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    redirect_slashes=False,
+    lifespan=lifespan,
 )
 
 # Configurar CORS
@@ -30,31 +72,25 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
-
-# Middleware para remover trailing slash redirect
-@app.middleware("http")
-async def remove_trailing_slash_redirect(request, call_next):
-    """Remove trailing slash redirects que causam 307"""
-    response = await call_next(request)
-    if response.status_code == 307:
-        return await call_next(request)
-    return response
-
-
-# Event handlers
-@app.on_event("startup")
-async def startup_event():
-    """Executado quando a aplicação inicia"""
-    print(f"🚀 Starting {settings.APP_NAME} v{settings.APP_VERSION}")
-    db_info = settings.DATABASE_URL.split("@")[-1] if "@" in settings.DATABASE_URL else "Localhost"
-    print(f"📊 Database: {db_info}")
-    print(f"🌍 Environment: {'Development' if settings.DEBUG else 'Production'}")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Executado quando a aplicação é encerrada"""
-    print("👋 Shutting down application...")
+# Middlewares ASGI puros (sem BaseHTTPMiddleware); o último adicionado é o mais externo
+app.add_middleware(GZipMiddleware, minimum_size=settings.GZIP_MINIMUM_SIZE)
+if settings.QUERY_BUDGET_MODE != "off":
+    # Dentro do TimingMiddleware, que abre a contagem de queries da requisição
+    app.add_middleware(
+        QueryBudgetMiddleware,
+        repeat_threshold=settings.QUERY_REPEAT_THRESHOLD,
+        raise_on_violation=settings.QUERY_BUDGET_MODE == "raise",
+    )
+app.add_middleware(
+    TimingMiddleware,
+    slow_request_ms=settings.SLOW_REQUEST_MS,
+    server_timing=settings.SERVER_TIMING_ENABLED,
+    metrics=settings.METRICS_ENABLED,
+)
+# "/rota/" e "/rota" casam na mesma passada (rotas sem barra final, sem redirect 307);
+# fica fora do TimingMiddleware para que ele veja o scope com a rota encontrada
+app.add_middleware(TrailingSlashMiddleware)
+app.add_middleware(RequestIdMiddleware)
 
 
 # Rota raiz integrada
@@ -65,7 +101,24 @@ app.include_router(documentation.router)
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Verifica se a API está funcionando"""
-    return {"status": "healthy", "service": settings.APP_NAME}
+    return {
+        "status": "healthy",
+        "service": settings.APP_NAME,
+        "auth_cache": user_cache.stats(),
+        "response_cache": response_cache.stats(),
+        "realtime": board_broker.stats(),
+        "password_hasher": password_hasher.stats(),
+        "activity": activity_writer.stats(),
+    }
+
+
+if settings.METRICS_ENABLED:
+
+    @app.get("/metrics", tags=["Health"], include_in_schema=False)
+    async def metrics():
+        """Métricas no formato de exposição do Prometheus"""
+        body, content_type = render_metrics()
+        return Response(content=body, media_type=content_type)
 
 
 # Registrar rotas
@@ -74,3 +127,6 @@ app.include_router(projects.router, prefix="/api/projects", tags=["Projects"])
 app.include_router(boards.router, prefix="/api/boards", tags=["Boards"])
 app.include_router(columns.router, prefix="/api/columns", tags=["Columns"])
 app.include_router(tasks.router, prefix="/api/tasks", tags=["Tasks"])
+app.include_router(comments.router, prefix="/api/comments", tags=["Comments"])
+app.include_router(tags.router, prefix="/api/tags", tags=["Tags"])
+app.include_router(ws.router, tags=["Realtime"])
@@ -1,23 +1,51 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.database import get_async_db
 from app.core.security import decode_token
+from app.core.user_cache import UserPrincipal, user_cache
 from app.models.user import User
 from typing import Optional
+from uuid import UUID
 
 security = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> User:
+async def load_user_principal(db: AsyncSession, user_id: UUID) -> Optional[UserPrincipal]:
     """
-    Dependency que extrai o usuário atual do token JWT
+    Busca apenas as colunas de autorização do usuário no banco
+    """
+    result = await db.execute(
+        select(User.id, User.is_active, User.is_superuser).where(User.id == user_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+    return UserPrincipal(id=row.id, is_active=row.is_active, is_superuser=row.is_superuser)
+
+
+def principal_from_claims(payload: dict, user_id: UUID) -> Optional[UserPrincipal]:
     """
-    token = credentials.credentials
+    Monta o principal a partir das claims assinadas (tokens antigos sem "active" retornam None)
+    """
+    if "active" not in payload:
+        return None
+    return UserPrincipal(
+        id=user_id,
+        is_active=bool(payload["active"]),
+        is_superuser=bool(payload.get("su", False)),
+    )
+
+
+async def authenticate_token(token: str, db: AsyncSession) -> UserPrincipal:
+    """
+    Valida o token JWT e resolve o usuário (rotas HTTP e WebSocket)
 
+    Conforme settings.AUTH_MODE, o usuário vem das claims do token, do cache
+    em memória ou do banco (ver app/core/config.py)
+    """
     # Decodificar token
     payload = decode_token(token)
     if payload is None:
@@ -28,16 +56,28 @@ async def get_current_user(
         )
 
     # Extrair user_id do payload
-    user_id: Optional[str] = payload.get("sub")
-    if user_id is None:
+    subject: Optional[str] = payload.get("sub")
+    try:
+        user_id = UUID(str(subject))
+    except ValueError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    user = None
+    if settings.AUTH_MODE == "claims":
+        user = principal_from_claims(payload, user_id)
+    elif settings.AUTH_MODE == "cache":
+        user = user_cache.get(user_id)
+
     # Buscar usuário no banco
-    user = db.query(User).filter(User.id == user_id).first()
+    if user is None:
+        user = await load_user_principal(db, user_id)
+        if user is not None and settings.AUTH_MODE == "cache":
+            user_cache.set(user)
+
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -46,16 +86,24 @@ async def get_current_user(
         )
 
     if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user"
-        )
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user")
 
     return user
 
 
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db),
+) -> UserPrincipal:
+    """
+    Dependency que extrai o usuário atual do token JWT
+    """
+    return await authenticate_token(credentials.credentials, db)
+
+
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: UserPrincipal = Depends(get_current_user),
+) -> UserPrincipal:
     """
     Dependency que verifica se o usuário está ativo
     """
@@ -65,8 +113,8 @@ async def get_current_active_user(
 
 
 async def get_current_superuser(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: UserPrincipal = Depends(get_current_user),
+) -> UserPrincipal:
     """
     Dependency que verifica se o usuário é superusuário
     """
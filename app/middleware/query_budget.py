@@ -0,0 +1,40 @@
+import logging
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.core.metrics import request_stats_var
+from app.utils.query_budget import QueryBudgetExceeded, budget_for, budget_violations
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetMiddleware:
+    """
+    Confere o orçamento de queries (@query_budget) e procura N+1 em cada requisição
+
+    Precisa ficar dentro do TimingMiddleware, que abre a RequestStats. Com
+    `raise_on_violation` a violação é levantada como QueryBudgetExceeded depois
+    da resposta (nos testes o cliente ASGI repassa a exceção); senão vai para o log.
+    """
+
+    def __init__(self, app: ASGIApp, repeat_threshold: int = 3, raise_on_violation: bool = False):
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+        self.raise_on_violation = raise_on_violation
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        stats = request_stats_var.get()
+        if scope["type"] != "http" or stats is None:
+            await self.app(scope, receive, send)
+            return
+
+        stats.statements = []
+        await self.app(scope, receive, send)
+
+        violations = budget_violations(
+            stats.statements, budget_for(scope.get("endpoint")), self.repeat_threshold
+        )
+        if not violations:
+            return
+        message = f"{scope['method']} {scope['path']}: " + "; ".join(violations)
+        if self.raise_on_violation:
+            raise QueryBudgetExceeded(message)
+        logger.warning("Query budget: %s", message)
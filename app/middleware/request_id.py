@@ -0,0 +1,57 @@
+import uuid
+from contextvars import ContextVar
+from typing import Optional
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# ID da requisição atual, disponível para logs e serviços durante o processamento
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+def get_request_id() -> Optional[str]:
+    return request_id_var.get()
+
+
+def _valid(value: str) -> bool:
+    return 0 < len(value) <= 128 and value.isprintable()
+
+
+class RequestIdMiddleware:
+    """
+    Propaga o X-Request-ID recebido (ou gera um) e o devolve na resposta
+
+    O ID fica em scope["state"]["request_id"] (request.state.request_id) e em
+    request_id_var.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.header = REQUEST_ID_HEADER.lower().encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == self.header:
+                request_id = value.decode("latin-1")
+                break
+        if request_id is None or not _valid(request_id):
+            request_id = uuid.uuid4().hex
+
+        scope.setdefault("state", {})["request_id"] = request_id
+        token = request_id_var.set(request_id)
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
@@ -0,0 +1,76 @@
+import logging
+import time
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.metrics import RequestStats, observe_request, request_stats_var
+from app.middleware.request_id import get_request_id
+
+logger = logging.getLogger(__name__)
+
+
+class TimingMiddleware:
+    """
+    Mede o tempo de processamento das requisições HTTP
+
+    Abre a RequestStats da requisição (queries e tempo de banco, ver
+    app.core.metrics), registra latência e queries por template de rota nas
+    métricas e, com `server_timing`, adiciona o header Server-Timing
+    (app;dur=<ms> até o início da resposta, db;dur=<ms>;desc="<n> queries").
+    Requisições que passam de `slow_request_ms` no total são registradas em log.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        slow_request_ms: float = 500,
+        server_timing: bool = True,
+        metrics: bool = True,
+    ):
+        self.app = app
+        self.slow_request_ms = slow_request_ms
+        self.server_timing = server_timing
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+        stats = RequestStats()
+        token = request_stats_var.set(stats)
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    duration_ms = (time.perf_counter() - started) * 1000
+                    MutableHeaders(scope=message).append(
+                        "Server-Timing",
+                        f"app;dur={duration_ms:.1f}, "
+                        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries"',
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_stats_var.reset(token)
+            total = time.perf_counter() - started
+            if self.metrics:
+                # O roteador do FastAPI grava a rota encontrada no scope
+                route = getattr(scope.get("route"), "path", None)
+                observe_request(scope["method"], route, status_code, total, stats)
+            if total * 1000 >= self.slow_request_ms:
+                logger.warning(
+                    "Slow request %s %s -> %s in %.1f ms, %d queries in %.1f ms (request_id=%s)",
+                    scope["method"],
+                    scope["path"],
+                    status_code,
+                    total * 1000,
+                    stats.queries,
+                    stats.db_seconds * 1000,
+                    get_request_id(),
+                )
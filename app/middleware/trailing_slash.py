@@ -0,0 +1,26 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class TrailingSlashMiddleware:
+    """
+    Normaliza o path antes do roteamento: "/api/projects/" vira "/api/projects"
+
+    As rotas são declaradas sem barra final e o roteador roda com
+    redirect_slashes=False, então as duas formas casam na mesma passada, sem
+    307 e sem reprocessar a requisição (o corpo de POSTs é lido uma única vez).
+    Middleware ASGI puro: não envolve request/response como o BaseHTTPMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket"):
+            path = scope["path"]
+            if len(path) > 1 and path.endswith("/"):
+                scope = dict(scope)
+                scope["path"] = path.rstrip("/") or "/"
+                raw_path = scope.get("raw_path")
+                if raw_path:
+                    scope["raw_path"] = raw_path.rstrip(b"/") or b"/"
+        await self.app(scope, receive, send)
@@ -1,10 +1,17 @@
-from sqlalchemy import Column, Text, ForeignKey, Enum
+from sqlalchemy import DDL, Column, DateTime, Text, ForeignKey, Enum, Index, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
+from datetime import datetime
 import uuid
 import enum
 from app.models.base import BaseModel
 
+# Partição que recebe linhas fora das partições mensais (ver app/services/activity_partitions.py)
+ACTIVITY_DEFAULT_PARTITION = "activity_logs_default"
+ACTIVITY_DEFAULT_PARTITION_DDL = (
+    f"CREATE TABLE {ACTIVITY_DEFAULT_PARTITION} PARTITION OF activity_logs DEFAULT"
+)
+
 
 class ActivityAction(enum.Enum):
     """Enum para tipos de ações no sistema"""
@@ -23,22 +30,52 @@ class ActivityLog(BaseModel):
     """
     Model de Log de Atividades
     Registra todas as ações importantes no sistema
+
+    No PostgreSQL a tabela é particionada por mês em created_at (por isso a chave
+    primária inclui created_at): partições futuras são criadas e as expiradas
+    arquivadas/removidas por app.services.activity_partitions.
     """
 
     __tablename__ = "activity_logs"
+    __table_args__ = (
+        Index("ix_activity_logs_task_id_created_at", "task_id", "created_at"),
+        Index("ix_activity_logs_board_id_created_at", "board_id", "created_at", "id"),
+        Index("ix_activity_logs_project_id_created_at", "project_id", "created_at", "id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    created_at = Column(DateTime, primary_key=True, default=datetime.utcnow, nullable=False)
     action = Column(Enum(ActivityAction), nullable=False)
     description = Column(Text, nullable=True)
     meta_data = Column(Text, nullable=True)
 
     # Foreign Keys
-    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id"), nullable=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), nullable=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    # Board/projeto da tarefa no momento do evento (desnormalizados): os feeds de
+    # board e projeto filtram direto por eles, sem join por tasks → columns → boards
+    board_id = Column(
+        UUID(as_uuid=True), ForeignKey("boards.id", ondelete="CASCADE"), nullable=True
+    )
+    project_id = Column(
+        UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=True
+    )
 
     # Relacionamentos
     task = relationship("Task", back_populates="activity_logs")
     user = relationship("User", back_populates="activity_logs")
+    board = relationship("Board", back_populates="activity_logs")
+    project = relationship("Project", back_populates="activity_logs")
 
     def __repr__(self):
         return f"<ActivityLog {self.action} by User {self.user_id}>"
+
+
+# Tabelas criadas por create_all (dev) recebem só a partição default; as mensais
+# vêm da migração e do comando de manutenção
+event.listen(
+    ActivityLog.__table__,
+    "after_create",
+    DDL(ACTIVITY_DEFAULT_PARTITION_DDL).execute_if(dialect="postgresql"),
+)
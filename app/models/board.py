@@ -15,11 +15,20 @@ class Board(BaseModel):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(255), nullable=False)
-    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False)
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False, index=True)
 
     # Relacionamentos
     project = relationship("Project", back_populates="boards")
-    columns = relationship("Column", back_populates="board", cascade="all, delete-orphan")
+    columns = relationship(
+        "Column",
+        back_populates="board",
+        cascade="all, delete-orphan",
+        order_by="Column.position",
+    )
+    # Removidos pelo ON DELETE CASCADE do banco, sem carregar o log no ORM
+    activity_logs = relationship(
+        "ActivityLog", back_populates="board", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     def __repr__(self):
         return f"<Board {self.name}>"
@@ -1,8 +1,9 @@
-from sqlalchemy import Column, String, Integer, ForeignKey
+from sqlalchemy import Column, String, Integer, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
 from app.models.base import BaseModel
+from app.models.task import task_ordering
 
 
 class Column(BaseModel):
@@ -11,6 +12,7 @@ class Column(BaseModel):
     """
 
     __tablename__ = "columns"
+    __table_args__ = (Index("ix_columns_board_id_position", "board_id", "position"),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String(100), nullable=False)
@@ -20,7 +22,12 @@ class Column(BaseModel):
 
     # Relacionamentos
     board = relationship("Board", back_populates="columns")
-    tasks = relationship("Task", back_populates="column", cascade="all, delete-orphan")
+    tasks = relationship(
+        "Task",
+        back_populates="column",
+        cascade="all, delete-orphan",
+        order_by=task_ordering,
+    )
 
     def __repr__(self):
         return f"<Column {self.title}>"
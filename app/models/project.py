@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, ForeignKey
+from sqlalchemy import Column, String, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -12,6 +12,7 @@ class Project(BaseModel):
     """
 
     __tablename__ = "projects"
+    __table_args__ = (Index("ix_projects_owner_id_created_at", "owner_id", "created_at"),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(255), nullable=False)
@@ -22,6 +23,10 @@ class Project(BaseModel):
     owner = relationship("User", back_populates="owned_projects")
     boards = relationship("Board", back_populates="project", cascade="all, delete-orphan")
     tags = relationship("Tag", back_populates="project", cascade="all, delete-orphan")
+    # Removidos pelo ON DELETE CASCADE do banco, sem carregar o log no ORM
+    activity_logs = relationship(
+        "ActivityLog", back_populates="project", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     def __repr__(self):
         return f"<Project {self.name}>"
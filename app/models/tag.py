@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, Table
+from sqlalchemy import Column, String, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -6,15 +6,6 @@ from app.models.base import BaseModel
 from app.core.database import Base
 
 
-# Tabela de associação Many-to-Many entre Task e Tag
-task_tags = Table(
-    "task_tags",
-    Base.metadata,
-    Column("task_id", UUID(as_uuid=True), ForeignKey("tasks.id"), primary_key=True),
-    Column("tag_id", UUID(as_uuid=True), ForeignKey("tags.id"), primary_key=True),
-)
-
-
 class Tag(BaseModel):
     """
     Model de Tag/Label para categorizar tarefas
@@ -25,11 +16,13 @@ class Tag(BaseModel):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(50), nullable=False)
     color = Column(String(7), nullable=False, default="#3B82F6")
-    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False)
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False, index=True)
 
     # Relacionamentos
     project = relationship("Project", back_populates="tags")
-    tasks = relationship("TaskTag", back_populates="tag")
+    tasks = relationship(
+        "TaskTag", back_populates="tag", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     def __repr__(self):
         return f"<Tag {self.name}>"
@@ -37,16 +30,26 @@ class Tag(BaseModel):
 
 class TaskTag(Base):
     """
-    Model de associação entre Task e Tag
+    Model de associação Many-to-Many entre Task e Tag (única tabela task_tags)
+
+    A chave primária (task_id, tag_id) atende "tags da tarefa"; o índice
+    (tag_id, task_id) atende "tarefas com a tag" (filtros de list_tasks e batch-tag).
     """
 
-    __tablename__ = "task_tags_association"
+    __tablename__ = "task_tags"
+    __table_args__ = (Index("ix_task_tags_tag_id_task_id", "tag_id", "task_id"),)
 
     task_id = Column(
-        UUID(as_uuid=True), ForeignKey("tasks.id"), primary_key=True, nullable=False
+        UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
     )
     tag_id = Column(
-        UUID(as_uuid=True), ForeignKey("tags.id"), primary_key=True, nullable=False
+        UUID(as_uuid=True),
+        ForeignKey("tags.id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
     )
 
     # Relacionamentos
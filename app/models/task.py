@@ -1,8 +1,20 @@
-from sqlalchemy import Column, String, Text, Integer, ForeignKey, DateTime, Enum
+from sqlalchemy import (
+    DDL,
+    Column,
+    String,
+    Text,
+    Integer,
+    ForeignKey,
+    DateTime,
+    Enum,
+    Index,
+    event,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
 import enum
+from app.core.config import settings
 from app.models.base import BaseModel
 
 
@@ -21,20 +33,30 @@ class Task(BaseModel):
     """
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_column_id_position", "column_id", "position"),
+        Index("ix_tasks_column_id_rank", "column_id", "rank"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     position = Column(Integer, nullable=False)
+    # Rank lexicográfico usado quando TASK_ORDERING="rank" (ver app/utils/lexorank.py)
+    # Collation "C" no PostgreSQL: a ordem dos ranks é a ordem dos bytes, independente do locale
+    rank = Column(String(64).with_variant(String(64, collation="C"), "postgresql"), nullable=True)
     priority = Column(
         Enum(TaskPriority), default=TaskPriority.MEDIUM, nullable=False
     )
     due_date = Column(DateTime, nullable=True)
+    # Comentários da tarefa, mantido na mesma transação que insere/remove o comentário
+    # (ver app/routes/comments.py): as listagens trazem a contagem sem outra query
+    comment_count = Column(Integer, default=0, server_default="0", nullable=False)
 
     # Foreign Keys
     column_id = Column(UUID(as_uuid=True), ForeignKey("columns.id"), nullable=False)
-    assignee_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
-    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    assignee_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True)
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
 
     # Relacionamentos
     column = relationship("Column", back_populates="tasks")
@@ -44,13 +66,50 @@ class Task(BaseModel):
     created_by_user = relationship(
         "User", back_populates="created_tasks", foreign_keys=[created_by]
     )
-    tags = relationship("TaskTag", back_populates="task", cascade="all, delete-orphan")
+    # task_tags.task_id é ON DELETE CASCADE: excluir a tarefa não carrega as associações
+    tags = relationship(
+        "TaskTag", back_populates="task", cascade="all, delete-orphan", passive_deletes=True
+    )
+    # comments.task_id e activity_logs.task_id também são ON DELETE CASCADE: excluir
+    # tarefas (inclusive em cascata, ao excluir projeto/board) não carrega cada lista
     comments = relationship(
-        "Comment", back_populates="task", cascade="all, delete-orphan"
+        "Comment", back_populates="task", cascade="all, delete-orphan", passive_deletes=True
     )
     activity_logs = relationship(
-        "ActivityLog", back_populates="task", cascade="all, delete-orphan"
+        "ActivityLog", back_populates="task", cascade="all, delete-orphan", passive_deletes=True
     )
 
     def __repr__(self):
         return f"<Task {self.title}>"
+
+
+# Busca textual (PostgreSQL): coluna gerada `search_vector` (título com peso A,
+# descrição com peso B) e índice GIN. A coluna não é mapeada no model para não
+# ser carregada em todo SELECT de tarefas; as queries de busca a referenciam pelo
+# nome (ver app/services/task_search.py). Criada pela migração 3c1f7a9d2b64 e,
+# com DB_AUTO_CREATE_TABLES, pelos DDLs abaixo.
+TASK_SEARCH_CONFIG = "simple"
+
+TASK_SEARCH_VECTOR_DDL = (
+    "ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+    f"setweight(to_tsvector('{TASK_SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{TASK_SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+    ") STORED"
+)
+TASK_SEARCH_INDEX_DDL = "CREATE INDEX ix_tasks_search_vector ON tasks USING gin (search_vector)"
+
+event.listen(
+    Task.__table__, "after_create", DDL(TASK_SEARCH_VECTOR_DDL).execute_if(dialect="postgresql")
+)
+event.listen(
+    Task.__table__, "after_create", DDL(TASK_SEARCH_INDEX_DDL).execute_if(dialect="postgresql")
+)
+
+
+def task_ordering():
+    """
+    Colunas que definem a ordem das tarefas dentro de uma coluna (ver TASK_ORDERING)
+    """
+    if settings.TASK_ORDERING == "rank":
+        return (Task.rank, Task.id)
+    return (Task.position, Task.id)
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, String, Boolean
+from sqlalchemy import Column, String, Boolean, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
+from app.core.user_cache import user_cache
 from app.models.base import BaseModel
 
 
@@ -35,3 +36,14 @@ class User(BaseModel):
 
     def __repr__(self):
         return f"<User {self.username}>"
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def invalidate_cached_user(mapper, connection, target):
+    """
+    Remove o usuário do cache de autenticação quando ele é alterado ou excluído
+    UPDATEs em massa (update(User)) não disparam este evento: chame
+    user_cache.invalidate() manualmente nesses casos
+    """
+    user_cache.invalidate(target.id)
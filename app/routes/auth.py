@@ -1,12 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_async_db
+from app.core.password_hasher import password_hasher
 from app.core.security import (
-    get_password_hash,
-    verify_password,
+    password_needs_rehash,
     create_access_token,
     create_refresh_token,
+    user_token_claims,
 )
+from app.core.user_cache import UserPrincipal
 from app.models.user import User
 from app.schemas.user import UserCreate, UserResponse, UserLogin, Token
 from app.middleware.auth import get_current_user
@@ -15,12 +18,13 @@ router = APIRouter()
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Registrar novo usuário
     """
     # Verificar se username já existe
-    existing_user = db.query(User).filter(User.username == user_data.username).first()
+    result = await db.execute(select(User).where(User.username == user_data.username))
+    existing_user = result.scalar_one_or_none()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -28,14 +32,15 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
         )
 
     # Verificar se email já existe
-    existing_email = db.query(User).filter(User.email == user_data.email).first()
+    result = await db.execute(select(User).where(User.email == user_data.email))
+    existing_email = result.scalar_one_or_none()
     if existing_email:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered"
         )
 
-    # Criar hash da senha
-    hashed_password = get_password_hash(user_data.password)
+    # Criar hash da senha (bcrypt é CPU-bound, roda no pool de processos)
+    hashed_password = await password_hasher.hash(user_data.password)
 
     # Criar usuário
     new_user = User(
@@ -46,22 +51,23 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     )
 
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
 
     return new_user
 
 
 @router.post("/login", response_model=Token)
-def login(credentials: UserLogin, db: Session = Depends(get_db)):
+async def login(credentials: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """
     Login do usuário e geração de tokens JWT
     """
     # Buscar usuário
-    user = db.query(User).filter(User.username == credentials.username).first()
+    result = await db.execute(select(User).where(User.username == credentials.username))
+    user = result.scalar_one_or_none()
 
     # ✅ CORREÇÃO: Converter Column[str] para str
-    if not user or not verify_password(credentials.password, str(user.password_hash)):
+    if not user or not await password_hasher.verify(credentials.password, str(user.password_hash)):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -72,9 +78,20 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
     if not bool(user.is_active):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user")
 
+    # Custo do bcrypt mudou: regrava o hash com a senha que acabou de ser validada
+    if password_needs_rehash(str(user.password_hash)):
+        try:
+            user.password_hash = await password_hasher.hash(credentials.password)
+        except HTTPException:
+            # Pool saturado: o rehash fica para um próximo login
+            pass
+        else:
+            await db.commit()
+
     # Criar tokens
-    access_token = create_access_token(data={"sub": str(user.id)})
-    refresh_token = create_refresh_token(data={"sub": str(user.id)})
+    claims = user_token_claims(user)
+    access_token = create_access_token(data=claims)
+    refresh_token = create_refresh_token(data=claims)
 
     return {
         "access_token": access_token,
@@ -84,20 +101,27 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserResponse)
-def get_me(current_user: User = Depends(get_current_user)):
+async def get_me(
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+):
     """
     Retorna dados do usuário autenticado
     """
-    return current_user
+    user = await db.get(User, current_user.id)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return user
 
 
 @router.post("/refresh", response_model=Token)
-def refresh_token(current_user: User = Depends(get_current_user)):
+async def refresh_token(current_user: UserPrincipal = Depends(get_current_user)):
     """
     Gera novos tokens usando o refresh token
     """
-    access_token = create_access_token(data={"sub": str(current_user.id)})
-    refresh_token = create_refresh_token(data={"sub": str(current_user.id)})
+    claims = user_token_claims(current_user)
+    access_token = create_access_token(data=claims)
+    refresh_token = create_refresh_token(data=claims)
 
     return {
         "access_token": access_token,
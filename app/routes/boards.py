@@ -1,11 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-from app.core.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import List, Optional
+import time
+from app.core.cache import response_cache
+from app.core.database import get_async_db
 from app.models.board import Board
 from app.models.project import Project
-from app.models.user import User
+from app.core.user_cache import UserPrincipal
 from app.middleware.auth import get_current_user
+from app.schemas.activity import ActivityLogResponse
+from app.schemas.task import TaskResponse
+from app.services.activity import activity_cursor_key, activity_feed_query
+from app.services.board_snapshot import board_snapshot
+from app.utils.fast_json import fast_json_response, response_columns, rows_payload
+from app.utils.pagination import MAX_PAGE_SIZE, set_next_cursor
+from app.utils.query_budget import query_budget
 from pydantic import BaseModel, Field
 from uuid import UUID
 
@@ -27,59 +38,165 @@ class BoardResponse(BaseModel):
         from_attributes = True
 
 
+class TagSummary(BaseModel):
+    id: UUID
+    name: str
+    color: str
+
+    class Config:
+        from_attributes = True
+
+
+class AssigneeSummary(BaseModel):
+    id: UUID
+    username: str
+    full_name: str | None
+
+    class Config:
+        from_attributes = True
+
+
+class BoardTaskSnapshot(TaskResponse):
+    tags: List[TagSummary] = []
+    assignee: Optional[AssigneeSummary] = None
+
+
+class BoardColumnSnapshot(BaseModel):
+    id: UUID
+    title: str
+    position: int
+    wip_limit: int | None
+    tasks: List[BoardTaskSnapshot] = []
+
+    class Config:
+        from_attributes = True
+
+
+class BoardFullResponse(BoardResponse):
+    columns: List[BoardColumnSnapshot] = []
+
+
 @router.get("/project/{project_id}", response_model=List[BoardResponse])
-def list_boards_by_project(
-    project_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+@query_budget(3)
+async def list_boards_by_project(
+    project_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     Listar todos os boards de um projeto
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
+    cached, cache_slot = await response_cache.lookup("project", project_id, "boards")
+    if cached is not None:
+        return fast_json_response(cached)
+    started = time.perf_counter()
+
+    result = await db.execute(select(Project.id).where(Project.id == project_id))
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
 
-    boards = db.query(Board).filter(Board.project_id == project_id).all()
-    return boards
+    result = await db.execute(
+        select(*response_columns(Board, BoardResponse)).where(Board.project_id == project_id)
+    )
+    payload = rows_payload(result.all(), BoardResponse)
+
+    await response_cache.store(cache_slot, payload, time.perf_counter() - started)
+    return fast_json_response(payload)
 
 
-@router.post("/", response_model=BoardResponse, status_code=status.HTTP_201_CREATED)
-def create_board(
+@router.post("", response_model=BoardResponse, status_code=status.HTTP_201_CREATED)
+async def create_board(
     board_data: BoardCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     Criar novo board
     """
-    project = db.query(Project).filter(Project.id == board_data.project_id).first()
+    result = await db.execute(select(Project).where(Project.id == board_data.project_id))
+    project = result.scalar_one_or_none()
     if not project:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
 
     new_board = Board(name=board_data.name, project_id=board_data.project_id)
 
     db.add(new_board)
-    db.commit()
-    db.refresh(new_board)
+    await db.commit()
+    await db.refresh(new_board)
+    await response_cache.bump("project", new_board.project_id)
+
+    return new_board
 
 
 @router.get("/{board_id}", response_model=BoardResponse)
-def get_board(
-    board_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+@query_budget(2)
+async def get_board(
+    board_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     Buscar board por ID
     """
-    board = db.query(Board).filter(Board.id == board_id).first()
-    if not board:
+    # Só boards de projetos do usuário; os de outros usuários também são 404
+    result = await db.execute(
+        select(*response_columns(Board, BoardResponse))
+        .join(Project, Project.id == Board.project_id)
+        .where(Board.id == board_id, Project.owner_id == current_user.id)
+    )
+    board = result.one_or_none()
+    if board is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Board not found")
 
-    # Verificar se o usuário tem acesso ao projeto do board
-    project = db.query(Project).filter(Project.id == board.project_id).first()
-    if not project or project.owner_id != current_user.id:
+    return fast_json_response(rows_payload([board], BoardResponse)[0])
+
+
+@router.get("/{board_id}/full", response_model=BoardFullResponse)
+@query_budget(5)
+async def get_board_full(
+    board_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Snapshot completo do board: colunas ordenadas, tarefas ordenadas, tags e responsável
+
+    O número de queries é fixo (board, colunas, tarefas com responsável e tags),
+    independente do tamanho do board; as tags de cada tarefa vêm por nome.
+    """
+    snapshot = await board_snapshot(db, board_id, current_user.id)
+    # Mesmo critério de acesso de get_board
+    if snapshot is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Board not found")
+
+    return fast_json_response(snapshot)
+
+
+@router.get("/{board_id}/activity", response_model=List[ActivityLogResponse])
+@query_budget(3)
+async def get_board_activity(
+    board_id: UUID,
+    response: Response,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Atividades de todas as tarefas do board, da mais recente à mais antiga
+
+    Paginado por cursor sobre (created_at, id): a próxima página vem no header X-Next-Cursor.
+    """
+    result = await db.execute(
+        select(Board).where(Board.id == board_id).options(joinedload(Board.project))
+    )
+    board = result.scalar_one_or_none()
+
+    # Mesmo critério de acesso de get_board
+    if not board or board.project.owner_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Board not found")
 
-    return board
+    result = await db.execute(activity_feed_query(board, Board.activity_logs, cursor, limit))
+    logs = result.scalars().all()
+    set_next_cursor(response, logs, limit, activity_cursor_key)
+    return logs
@@ -1,11 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.core.database import get_db
+import time
+from app.core.cache import response_cache
+from app.core.database import get_async_db
 from app.models.column import Column
 from app.models.board import Board
-from app.models.user import User
+from app.core.user_cache import UserPrincipal
 from app.middleware.auth import get_current_user
+from app.utils.fast_json import fast_json_response, response_columns, rows_payload
+from app.utils.query_budget import query_budget
 from pydantic import BaseModel, Field
 from uuid import UUID
 
@@ -32,40 +37,48 @@ class ColumnResponse(BaseModel):
 
 
 @router.get("/board/{board_id}", response_model=List[ColumnResponse])
-def list_columns_by_board(
-    board_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+@query_budget(3)
+async def list_columns_by_board(
+    board_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     Listar todas as colunas de um board
     """
-    board = db.query(Board).filter(Board.id == board_id).first()
-    if not board:
+    cached, cache_slot = await response_cache.lookup("board", board_id, "columns")
+    if cached is not None:
+        return fast_json_response(cached)
+    started = time.perf_counter()
+
+    result = await db.execute(select(Board.id).where(Board.id == board_id))
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Board not found"
         )
 
-    columns = (
-        db.query(Column)
-        .filter(Column.board_id == board_id)
+    result = await db.execute(
+        select(*response_columns(Column, ColumnResponse))
+        .where(Column.board_id == board_id)
         .order_by(Column.position)
-        .all()
     )
+    payload = rows_payload(result.all(), ColumnResponse)
 
-    return columns
+    await response_cache.store(cache_slot, payload, time.perf_counter() - started)
+    return fast_json_response(payload)
 
 
-@router.post("/", response_model=ColumnResponse, status_code=status.HTTP_201_CREATED)
-def create_column(
+@router.post("", response_model=ColumnResponse, status_code=status.HTTP_201_CREATED)
+async def create_column(
     column_data: ColumnCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     Criar nova coluna
     """
-    board = db.query(Board).filter(Board.id == column_data.board_id).first()
+    result = await db.execute(select(Board).where(Board.id == column_data.board_id))
+    board = result.scalar_one_or_none()
     if not board:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Board not found"
@@ -79,7 +92,8 @@ def create_column(
     )
 
     db.add(new_column)
-    db.commit()
-    db.refresh(new_column)
+    await db.commit()
+    await db.refresh(new_column)
+    await response_cache.bump("board", new_column.board_id)
 
     return new_column
@@ -0,0 +1,244 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator, List, Optional, Tuple
+from uuid import UUID
+from app.core.cache import response_cache
+from app.core.database import AsyncSessionLocal, get_async_db, get_async_engine
+from app.core.user_cache import UserPrincipal
+from app.middleware.auth import get_current_user
+from app.models.activity_log import ActivityAction
+from app.models.comment import Comment
+from app.models.task import Task
+from app.schemas.comment import CommentCreate, CommentResponse, CommentUpdate
+from app.services.activity import activity_row, activity_writer
+from app.services.realtime import board_broker, board_id_for_column
+from app.utils.fast_json import fast_json_response, json_dumps, response_columns, rows_payload
+from app.utils.pagination import (
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    keyset_after,
+    parse_datetime,
+    set_next_cursor,
+)
+from app.utils.query_budget import query_budget
+
+router = APIRouter()
+
+# Comentários lidos do banco (e enviados) por vez no stream NDJSON
+COMMENT_STREAM_BATCH = 500
+
+
+def _thread(task_id) -> Select:
+    """
+    Colunas de CommentResponse dos comentários da tarefa, em ordem de criação
+    (índice (task_id, created_at))
+    """
+    return (
+        select(*response_columns(Comment, CommentResponse))
+        .where(Comment.task_id == task_id)
+        .order_by(Comment.created_at, Comment.id)
+    )
+
+
+async def _change_comment_count(
+    db: AsyncSession, task_id, delta: int
+) -> Optional[Tuple[int, UUID]]:
+    """
+    Soma `delta` em tasks.comment_count na transação corrente
+
+    O UPDATE trava a linha da tarefa até o commit, então comentários simultâneos
+    na mesma tarefa não perdem incrementos. Devolve (comment_count, column_id),
+    ou None se a tarefa não existe.
+    """
+    result = await db.execute(
+        update(Task)
+        .where(Task.id == task_id)
+        .values(comment_count=Task.comment_count + delta)
+        .returning(Task.comment_count, Task.column_id)
+        .execution_options(synchronize_session=False)
+    )
+    return result.one_or_none()
+
+
+async def _comment_count_changed(db: AsyncSession, task_id, column_id, comment_count: int) -> None:
+    """Invalida as listagens da coluna e avisa o board da nova contagem"""
+    await response_cache.bump("column", column_id)
+    await board_broker.publish(
+        await board_id_for_column(db, column_id),
+        {
+            "type": "task.updated",
+            "task_id": str(task_id),
+            "changes": {"comment_count": comment_count},
+        },
+    )
+
+
+@router.get("/task/{task_id}", response_model=List[CommentResponse])
+@query_budget(3)
+async def list_comments_by_task(
+    task_id: UUID,
+    response: Response,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Listar comentários da tarefa, do mais antigo ao mais recente
+
+    Paginado por cursor sobre (created_at, id): a próxima página vem no header X-Next-Cursor.
+    Threads inteiras podem ser lidas de uma vez em /task/{task_id}/stream.
+    """
+    result = await db.execute(select(Task.id).where(Task.id == task_id))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+
+    query = _thread(task_id)
+    if cursor:
+        values = decode_cursor(cursor, (parse_datetime, UUID))
+        query = query.where(keyset_after((Comment.created_at, Comment.id), values))
+    result = await db.execute(query.limit(limit))
+    rows = result.all()
+    set_next_cursor(response, rows, limit, lambda row: (row.created_at, row.id))
+    return fast_json_response(rows_payload(rows, CommentResponse), response)
+
+
+async def _stream_thread(task_id) -> AsyncIterator[bytes]:
+    # A sessão da requisição é fechada antes do corpo ser enviado: o stream usa a sua
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(_thread(task_id).execution_options(yield_per=COMMENT_STREAM_BATCH))
+        async for rows in result.partitions():
+            yield b"".join(
+                json_dumps(comment) + b"\n" for comment in rows_payload(rows, CommentResponse)
+            )
+
+
+@router.get("/task/{task_id}/stream")
+@query_budget(3)
+async def stream_comments_by_task(
+    task_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Thread completa da tarefa em NDJSON (um CommentResponse por linha)
+
+    As linhas são lidas do banco com cursor no servidor e enviadas em blocos de
+    COMMENT_STREAM_BATCH, sem montar a lista inteira em memória.
+    """
+    result = await db.execute(select(Task.id).where(Task.id == task_id))
+    task = result.scalar_one_or_none()
+    if task is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+
+    return StreamingResponse(_stream_thread(task), media_type="application/x-ndjson")
+
+
+@router.post("", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
+@query_budget(5)
+async def create_comment(
+    comment_data: CommentCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Comentar em uma tarefa
+    """
+    changed = await _change_comment_count(db, comment_data.task_id, 1)
+    if changed is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    comment_count, column_id = changed
+
+    new_comment = Comment(
+        content=comment_data.content,
+        task_id=comment_data.task_id,
+        user_id=current_user.id,
+    )
+    db.add(new_comment)
+    await db.commit()
+    await db.refresh(new_comment)
+
+    await _comment_count_changed(db, new_comment.task_id, column_id, comment_count)
+    await activity_writer.emit(
+        activity_row(
+            ActivityAction.COMMENT_ADDED,
+            current_user.id,
+            new_comment.task_id,
+            column_id,
+            meta={"comment_id": new_comment.id},
+        )
+    )
+
+    return new_comment
+
+
+async def _own_comment(db: AsyncSession, comment_id: UUID, user_id) -> Comment:
+    result = await db.execute(select(Comment).where(Comment.id == comment_id))
+    comment = result.scalar_one_or_none()
+    if not comment:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found")
+    if comment.user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to change this comment",
+        )
+    return comment
+
+
+@router.get("/{comment_id}", response_model=CommentResponse)
+async def get_comment(
+    comment_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Buscar comentário por ID
+    """
+    result = await db.execute(select(Comment).where(Comment.id == comment_id))
+    comment = result.scalar_one_or_none()
+    if not comment:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found")
+
+    return comment
+
+
+@router.put("/{comment_id}", response_model=CommentResponse)
+async def update_comment(
+    comment_id: UUID,
+    comment_data: CommentUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Editar comentário (apenas o autor)
+    """
+    comment = await _own_comment(db, comment_id, current_user.id)
+    comment.content = comment_data.content
+    await db.commit()
+    await db.refresh(comment)
+
+    return comment
+
+
+@router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_comment(
+    comment_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Remover comentário (apenas o autor)
+    """
+    comment = await _own_comment(db, comment_id, current_user.id)
+    await db.delete(comment)
+    changed = await _change_comment_count(db, comment.task_id, -1)
+    await db.commit()
+
+    if changed is not None:
+        comment_count, column_id = changed
+        await _comment_count_changed(db, comment.task_id, column_id, comment_count)
+
+    return None
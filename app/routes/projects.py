@@ -1,40 +1,68 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-from app.core.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from uuid import UUID
+from app.core.cache import response_cache
+from app.core.database import get_async_db
+from app.models.board import Board
+from app.models.column import Column
 from app.models.project import Project
-from app.models.user import User
+from app.core.user_cache import UserPrincipal
+from app.schemas.activity import ActivityLogResponse
 from app.schemas.project import ProjectCreate, ProjectResponse  # ✅ Remove ProjectUpdate não usado
 from app.middleware.auth import get_current_user
+from app.services.activity import activity_cursor_key, activity_feed_query
+from app.utils.fast_json import fast_json_response, response_columns, rows_payload
+from app.utils.pagination import (
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    keyset_after,
+    parse_datetime,
+    set_next_cursor,
+)
+from app.utils.query_budget import query_budget
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[ProjectResponse])
-def list_projects(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+@router.get("", response_model=List[ProjectResponse])
+@query_budget(2)
+async def list_projects(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     Listar todos os projetos do usuário
+
+    Ordenados por (created_at, id); paginação por `cursor` (keyset) ou `skip`/`limit`
     """
-    projects = (
-        db.query(Project)
-        .filter(Project.owner_id == current_user.id)
-        .offset(skip)
-        .limit(limit)
-        .all()
+    query = select(*response_columns(Project, ProjectResponse)).where(
+        Project.owner_id == current_user.id
     )
-    return projects
 
+    if cursor:
+        values = decode_cursor(cursor, (parse_datetime, UUID))
+        query = query.where(keyset_after((Project.created_at, Project.id), values))
+    elif skip:
+        query = query.offset(skip)
+
+    result = await db.execute(query.order_by(Project.created_at, Project.id).limit(limit))
+    rows = result.all()
+
+    set_next_cursor(response, rows, limit, lambda row: (row.created_at, row.id))
+    return fast_json_response(rows_payload(rows, ProjectResponse), response)
 
-@router.post("/", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
-def create_project(
+
+@router.post("", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
+async def create_project(
     project_data: ProjectCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     Criar novo projeto
@@ -46,22 +74,24 @@ def create_project(
     )
 
     db.add(new_project)
-    db.commit()
-    db.refresh(new_project)
+    await db.commit()
+    await db.refresh(new_project)
 
     return new_project
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
-def get_project(
-    project_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+@query_budget(2)
+async def get_project(
+    project_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     Buscar projeto por ID
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    result = await db.execute(select(Project).where(Project.id == project_id))
+    project = result.scalar_one_or_none()
     if not project:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
 
@@ -75,16 +105,50 @@ def get_project(
     return project
 
 
+@router.get("/{project_id}/activity", response_model=List[ActivityLogResponse])
+@query_budget(3)
+async def get_project_activity(
+    project_id: UUID,
+    response: Response,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Atividades de todos os boards do projeto, da mais recente à mais antiga
+
+    Paginado por cursor sobre (created_at, id): a próxima página vem no header X-Next-Cursor.
+    """
+    result = await db.execute(select(Project).where(Project.id == project_id))
+    project = result.scalar_one_or_none()
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+
+    # Mesmo critério de acesso de get_project
+    if str(project.owner_id) != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this project",
+        )
+
+    result = await db.execute(activity_feed_query(project, Project.activity_logs, cursor, limit))
+    logs = result.scalars().all()
+    set_next_cursor(response, logs, limit, activity_cursor_key)
+    return logs
+
+
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_project(
-    project_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+async def delete_project(
+    project_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     Excluir projeto
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    result = await db.execute(select(Project).where(Project.id == project_id))
+    project = result.scalar_one_or_none()
     if not project:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
 
@@ -95,8 +159,19 @@ def delete_project(
             detail="Not authorized to delete this project",
         )
 
+    # Boards e colunas excluídos em cascata também têm listagens em cache
+    result = await db.execute(
+        select(Board.id, Column.id)
+        .outerjoin(Column, Column.board_id == Board.id)
+        .where(Board.project_id == project.id)
+    )
+    cascaded = result.all()
+
     # O cascade no model já cuida de excluir boards, colunas e tasks relacionados
-    db.delete(project)
-    db.commit()
+    await db.delete(project)
+    await db.commit()
+    await response_cache.bump("project", project.id)
+    await response_cache.bump("board", *(board_id for board_id, _ in cascaded))
+    await response_cache.bump("column", *(column_id for _, column_id in cascaded))
 
     return None
@@ -0,0 +1,132 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import List
+from uuid import UUID
+from app.core.database import get_async_db
+from app.core.user_cache import UserPrincipal
+from app.middleware.auth import get_current_user
+from app.models.project import Project
+from app.models.tag import Tag
+from app.schemas.tag import TagCreate, TagResponse, TagUpdate
+from app.utils.fast_json import fast_json_response, response_columns, rows_payload
+from app.utils.query_budget import query_budget
+
+router = APIRouter()
+
+
+async def _own_project(db: AsyncSession, project_id, user_id) -> Project:
+    result = await db.execute(select(Project).where(Project.id == project_id))
+    project = result.scalar_one_or_none()
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+    if str(project.owner_id) != str(user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this project",
+        )
+    return project
+
+
+async def _own_tag(db: AsyncSession, tag_id: UUID, user_id) -> Tag:
+    result = await db.execute(select(Tag).options(joinedload(Tag.project)).where(Tag.id == tag_id))
+    tag = result.scalar_one_or_none()
+    if not tag:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tag not found")
+    if str(tag.project.owner_id) != str(user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this tag",
+        )
+    return tag
+
+
+@router.get("/project/{project_id}", response_model=List[TagResponse])
+@query_budget(3)
+async def list_tags_by_project(
+    project_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Listar as tags de um projeto, em ordem alfabética
+    """
+    await _own_project(db, project_id, current_user.id)
+
+    result = await db.execute(
+        select(*response_columns(Tag, TagResponse))
+        .where(Tag.project_id == project_id)
+        .order_by(Tag.name, Tag.id)
+    )
+    return fast_json_response(rows_payload(result.all(), TagResponse))
+
+
+@router.post("", response_model=TagResponse, status_code=status.HTTP_201_CREATED)
+async def create_tag(
+    tag_data: TagCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Criar tag no projeto
+    """
+    await _own_project(db, tag_data.project_id, current_user.id)
+
+    new_tag = Tag(name=tag_data.name, color=tag_data.color, project_id=tag_data.project_id)
+
+    db.add(new_tag)
+    await db.commit()
+    await db.refresh(new_tag)
+
+    return new_tag
+
+
+@router.get("/{tag_id}", response_model=TagResponse)
+async def get_tag(
+    tag_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Buscar tag por ID
+    """
+    return await _own_tag(db, tag_id, current_user.id)
+
+
+@router.put("/{tag_id}", response_model=TagResponse)
+async def update_tag(
+    tag_id: UUID,
+    tag_data: TagUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Atualizar nome e/ou cor da tag
+    """
+    tag = await _own_tag(db, tag_id, current_user.id)
+
+    for field, value in tag_data.model_dump(exclude_unset=True).items():
+        if value is not None:
+            setattr(tag, field, value)
+
+    await db.commit()
+    await db.refresh(tag)
+
+    return tag
+
+
+@router.delete("/{tag_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_tag(
+    tag_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Excluir tag (as associações em task_tags são removidas em cascata pelo banco)
+    """
+    tag = await _own_tag(db, tag_id, current_user.id)
+    await db.delete(tag)
+    await db.commit()
+
+    return None
@@ -1,38 +1,98 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from app.core.database import get_db
-from app.models.task import Task
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status, Query
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal, Optional
+from uuid import UUID
+import time
+from app.core.cache import response_cache
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.models.activity_log import ActivityAction
+from app.models.task import Task, task_ordering
 from app.models.column import Column
-from app.models.user import User
-from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskMove
+from app.core.user_cache import UserPrincipal
+from app.models.project import Project
+from app.models.tag import Tag
+from app.schemas.activity import ActivityLogResponse
+from app.schemas.tag import TaskBatchTagRequest, TaskBatchTagResponse
+from app.schemas.task import (
+    TaskBatchRequest,
+    TaskBatchResponse,
+    TaskCreate,
+    TaskMove,
+    TaskResponse,
+    TaskSearchResult,
+    TaskUpdate,
+)
 from app.middleware.auth import get_current_user
+from app.services.activity import (
+    activity_cursor_key,
+    activity_feed_query,
+    activity_row,
+    activity_writer,
+    task_moved_activity,
+    task_update_activity,
+)
+from app.services.realtime import board_broker, board_id_for_column
+from app.services.task_batch import apply_task_batch
+from app.services.task_ordering import (
+    needs_rebalance,
+    next_slot,
+    rank_for_index,
+    rebalance_column,
+)
+from app.services.task_search import search_tasks, search_terms
+from app.services.task_tags import tag_tasks, task_columns, tasks_with_tags, untag_tasks
+from app.utils.fast_json import fast_json_response, response_columns, rows_payload
+from app.utils.pagination import MAX_PAGE_SIZE, decode_cursor, keyset_after, set_next_cursor
+from app.utils.query_budget import query_budget
+
+# Tamanho máximo de página da busca (cada linha calcula os trechos destacados)
+MAX_SEARCH_PAGE_SIZE = 100
 
 router = APIRouter()
 
 
-@router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
-def create_task(
+async def publish_task_moved(db: AsyncSession, task: Task, old_column_id, board_id) -> None:
+    """
+    Evento de movimento: no modo "position" o cliente desloca as vizinhas localmente
+    """
+    event = {
+        "type": "task.moved",
+        "task_id": str(task.id),
+        "from_column_id": str(old_column_id),
+        "column_id": str(task.column_id),
+        "position": task.position,
+        "rank": task.rank,
+    }
+    await board_broker.publish(board_id, event)
+
+    # Movimento entre boards: o board de origem também precisa remover a tarefa
+    if old_column_id != task.column_id:
+        old_board_id = await board_id_for_column(db, old_column_id)
+        if old_board_id is not None and old_board_id != board_id:
+            await board_broker.publish(old_board_id, event)
+
+
+@router.post("", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
+async def create_task(
     task_data: TaskCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     Criar nova tarefa
     """
     # Verificar se a coluna existe
-    column = db.query(Column).filter(Column.id == task_data.column_id).first()
+    result = await db.execute(select(Column).where(Column.id == task_data.column_id))
+    column = result.scalar_one_or_none()
     if not column:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Column not found")
 
-    # Calcular posição (última posição + 1)
-    last_task = (
-        db.query(Task)
-        .filter(Task.column_id == task_data.column_id)
-        .order_by(Task.position.desc())
-        .first()
-    )
-    position = (last_task.position + 1) if last_task else 0
+    # Calcular posição (última posição + 1) e, no modo rank, o rank após o último
+    position, rank = await next_slot(db, task_data.column_id)
+    use_rank = settings.TASK_ORDERING == "rank"
 
     # Criar nova tarefa
     new_task = Task(
@@ -44,70 +104,271 @@ def create_task(
         assignee_id=task_data.assignee_id,
         created_by=current_user.id,
         position=position,  # type: ignore[attr-defined]
+        rank=rank if use_rank else None,
     )
 
     db.add(new_task)
-    db.commit()
-    db.refresh(new_task)
+    await db.commit()
+    await db.refresh(new_task)
+    await response_cache.bump("column", new_task.column_id)
+    await board_broker.publish(
+        column.board_id,
+        {
+            "type": "task.created",
+            "task": TaskResponse.model_validate(new_task).model_dump(mode="json"),
+        },
+    )
+
+    await activity_writer.emit(
+        activity_row(
+            ActivityAction.TASK_CREATED,
+            current_user.id,
+            new_task.id,
+            new_task.column_id,
+            meta={"title": new_task.title},
+        )
+    )
+
+    if use_rank and needs_rebalance(rank):
+        background_tasks.add_task(rebalance_column, task_data.column_id)
 
     return new_task
 
 
-@router.get("/", response_model=List[TaskResponse])
-def list_tasks(
-    column_id: Optional[str] = Query(None, description="Filter by column ID"),
+@router.post("/batch", response_model=TaskBatchResponse)
+@query_budget(8)
+async def batch_tasks(
+    batch: TaskBatchRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Criar, atualizar, mover e excluir várias tarefas em uma única transação
+
+    Cada item do resultado traz o status da operação correspondente (201, 200,
+    204 ou 404); operações com 404 são ignoradas e as demais aplicadas.
+    """
+    outcome = await apply_task_batch(db, batch.operations, current_user.id)
+    await db.commit()
+
+    await response_cache.bump("column", *outcome.column_ids)
+    for board_id, column_ids in outcome.boards.items():
+        await board_broker.publish(
+            board_id,
+            {"type": "tasks.batch", "column_ids": sorted(str(column) for column in column_ids)},
+        )
+    await activity_writer.emit(*outcome.activity)
+    for column_id in outcome.rebalance:
+        background_tasks.add_task(rebalance_column, column_id)
+
+    return {"results": outcome.results}
+
+
+@router.post("/batch-tag", response_model=TaskBatchTagResponse)
+@query_budget(4)
+async def batch_tag_tasks(
+    batch: TaskBatchTagRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Adicionar (add) ou remover (remove) tags de várias tarefas de uma vez
+
+    Todos os pares (tarefa, tag) são gravados em um único INSERT ... SELECT ou
+    DELETE. Pares já existentes (add) ou ausentes (remove) e tarefas de outro
+    projeto são ignorados; `changed` conta os pares realmente alterados.
+    """
+    tag_ids = set(batch.tag_ids)
+    result = await db.execute(
+        select(Tag.id, Project.owner_id)
+        .join(Project, Project.id == Tag.project_id)
+        .where(Tag.id.in_(tag_ids))
+    )
+    owners = result.all()
+    if len(owners) != len(tag_ids):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tag not found")
+    if any(str(owner_id) != str(current_user.id) for _, owner_id in owners):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this tag",
+        )
+
+    if batch.action == "add":
+        changed = await tag_tasks(db, batch.task_ids, tag_ids)
+        action = ActivityAction.TAG_ADDED
+    else:
+        changed = await untag_tasks(db, batch.task_ids, tag_ids)
+        action = ActivityAction.TAG_REMOVED
+    columns = await task_columns(db, set(changed))
+    await db.commit()
+
+    await activity_writer.emit(
+        *(
+            activity_row(
+                action, current_user.id, task_id, columns.get(task_id), meta={"tag_ids": ids}
+            )
+            for task_id, ids in changed.items()
+        )
+    )
+
+    return {
+        "action": batch.action,
+        "changed": sum(len(ids) for ids in changed.values()),
+        "task_ids": list(changed),
+    }
+
+
+@router.get("", response_model=List[TaskResponse])
+@query_budget(2)
+async def list_tasks(
+    response: Response,
+    column_id: Optional[UUID] = Query(None, description="Filter by column ID"),
     priority: Optional[str] = Query(None, description="Filter by priority"),
-    assignee_id: Optional[str] = Query(None, description="Filter by assignee"),
+    assignee_id: Optional[UUID] = Query(None, description="Filter by assignee"),
+    tag_id: Optional[List[UUID]] = Query(None, description="Filter by tags (repeatable)"),
+    tag_match: Literal["any", "all"] = Query(
+        "any", description="Tasks with any or with all of the given tags"
+    ),
     skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=100),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     Listar tarefas com filtros opcionais
+
+    Paginação por `cursor` (keyset, custo constante por página) ou, para
+    clientes antigos, por `skip`/`limit`. O cursor da próxima página vem no
+    header X-Next-Cursor. `tag_id` pode ser repetido; `tag_match=all` exige
+    todas as tags.
     """
-    query = db.query(Task)
+    ordering = task_ordering()
+    query = select(*response_columns(Task, TaskResponse, ordering[0]))
 
     if column_id:
-        query = query.filter(Task.column_id == column_id)
+        query = query.where(Task.column_id == column_id)
     if priority:
-        query = query.filter(Task.priority == priority)
+        query = query.where(Task.priority == priority)
     if assignee_id:
-        query = query.filter(Task.assignee_id == assignee_id)
+        query = query.where(Task.assignee_id == assignee_id)
+    if tag_id:
+        query = query.where(Task.id.in_(tasks_with_tags(tag_id, tag_match)))
+
+    if cursor:
+        sort_type = str if settings.TASK_ORDERING == "rank" else int
+        query = query.where(keyset_after(ordering, decode_cursor(cursor, (sort_type, UUID))))
+    elif skip:
+        query = query.offset(skip)
+
+    result = await db.execute(query.order_by(*ordering).limit(limit))
+    rows = result.all()
+
+    sort_key = ordering[0].key
+    set_next_cursor(response, rows, limit, lambda row: (getattr(row, sort_key), row.id))
+    return fast_json_response(rows_payload(rows, TaskResponse), response)
+
+
+@router.get("/search", response_model=List[TaskSearchResult])
+@query_budget(2)
+async def search_tasks_route(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="Search terms"),
+    project_id: Optional[UUID] = Query(None, description="Search in a project"),
+    board_id: Optional[UUID] = Query(None, description="Search in a board"),
+    limit: int = Query(20, ge=1, le=MAX_SEARCH_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Buscar tarefas por título e descrição em um projeto ou board
+
+    Todos os termos precisam aparecer (palavras inteiras). Resultados do mais para o
+    menos relevante, com os termos destacados em <mark> em `title_highlight` e
+    `snippet` (o texto não é escapado: o cliente deve tratar o HTML). O cursor
+    da próxima página vem no header X-Next-Cursor.
+    """
+    if project_id is None and board_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="project_id or board_id is required",
+        )
 
-    query = query.order_by(Task.position)
-    tasks = query.offset(skip).limit(limit).all()
+    after = tuple(decode_cursor(cursor, (float, UUID))) if cursor else None
+    hits = await search_tasks(
+        db, current_user.id, search_terms(q), project_id, board_id, after, limit
+    )
 
-    return tasks
+    set_next_cursor(response, hits, limit, lambda hit: (hit.rank, hit.task.id))
+    return [
+        TaskSearchResult(
+            **TaskResponse.model_validate(hit.task).model_dump(),
+            rank=hit.rank,
+            title_highlight=hit.title_highlight,
+            snippet=hit.snippet,
+        )
+        for hit in hits
+    ]
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
-def get_task(
-    task_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+@query_budget(2)
+async def get_task(
+    task_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     Buscar tarefa por ID
     """
-    task = db.query(Task).filter(Task.id == task_id).first()
+    result = await db.execute(select(Task).where(Task.id == task_id))
+    task = result.scalar_one_or_none()
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
 
     return task
 
 
+@router.get("/{task_id}/activity", response_model=List[ActivityLogResponse])
+@query_budget(3)
+async def get_task_activity(
+    task_id: UUID,
+    response: Response,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    """
+    Histórico de atividades da tarefa, do mais recente ao mais antigo
+
+    Paginado por cursor sobre (created_at, id): a próxima página vem no header X-Next-Cursor.
+    """
+    result = await db.execute(select(Task).where(Task.id == task_id))
+    task = result.scalar_one_or_none()
+    if not task:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+
+    result = await db.execute(activity_feed_query(task, Task.activity_logs, cursor, limit))
+    logs = result.scalars().all()
+    set_next_cursor(response, logs, limit, activity_cursor_key)
+    return logs
+
+
 @router.put("/{task_id}", response_model=TaskResponse)
-def update_task(
-    task_id: str,
+async def update_task(
+    task_id: UUID,
     task_data: TaskUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     Atualizar tarefa existente
     """
-    task = db.query(Task).filter(Task.id == task_id).first()
+    result = await db.execute(select(Task).where(Task.id == task_id))
+    task = result.scalar_one_or_none()
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
 
@@ -116,94 +377,175 @@ def update_task(
     for field, value in update_data.items():
         setattr(task, field, value)
 
-    db.commit()
-    db.refresh(task)
+    await db.commit()
+    await db.refresh(task)
+    await response_cache.bump("column", task.column_id)
+
+    # Apenas os campos alterados (e updated_at) vão no evento
+    changes = TaskResponse.model_validate(task).model_dump(
+        mode="json", include={*update_data, "updated_at"}
+    )
+    await board_broker.publish(
+        await board_id_for_column(db, task.column_id),
+        {"type": "task.updated", "task_id": str(task.id), "changes": changes},
+    )
+    await activity_writer.emit(
+        *task_update_activity(task.id, task.column_id, update_data, current_user.id)
+    )
 
     return task
 
 
 @router.patch("/{task_id}/move", response_model=TaskResponse)
-def move_task(
-    task_id: str,
+async def move_task(
+    task_id: UUID,
     move_data: TaskMove,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     Mover tarefa para outra coluna e/ou posição
     """
-    task = db.query(Task).filter(Task.id == task_id).first()
+    result = await db.execute(select(Task).where(Task.id == task_id))
+    task = result.scalar_one_or_none()
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
 
     # Verificar se a nova coluna existe
-    column = db.query(Column).filter(Column.id == move_data.column_id).first()
+    result = await db.execute(select(Column).where(Column.id == move_data.column_id))
+    column = result.scalar_one_or_none()
     if not column:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Column not found")
 
     old_column_id = task.column_id
     old_position = task.position
 
+    if settings.TASK_ORDERING == "rank":
+        # Apenas a linha da tarefa é regravada: o novo rank fica entre os vizinhos
+        # Posições além do fim da coluna viram o fim (rank e `position` da resposta)
+        rank, position, rebalance = await rank_for_index(
+            db, move_data.column_id, move_data.position, exclude_id=task.id
+        )
+        task.column_id = move_data.column_id  # type: ignore[attr-defined]
+        task.position = position  # type: ignore[attr-defined]
+        task.rank = rank  # type: ignore[attr-defined]
+
+        await db.commit()
+        await db.refresh(task)
+        await response_cache.bump("column", old_column_id, task.column_id)
+        await publish_task_moved(db, task, old_column_id, column.board_id)
+        await activity_writer.emit(
+            task_moved_activity(
+                task.id, old_column_id, task.column_id, task.position, current_user.id
+            )
+        )
+
+        if rebalance:
+            background_tasks.add_task(rebalance_column, move_data.column_id)
+        return task
+
     # Atualizar coluna e posição
     task.column_id = move_data.column_id  # type: ignore[attr-defined]
     task.position = move_data.position  # type: ignore[attr-defined]
 
     # Reorganizar posições na coluna antiga, se a tarefa mudou de coluna
     if str(old_column_id) != str(move_data.column_id):
-        db.query(Task).filter(Task.column_id == old_column_id, Task.position > old_position).update(
-            {Task.position: Task.position - 1}
+        await db.execute(
+            update(Task)
+            .where(Task.column_id == old_column_id, Task.position > old_position)
+            .values(position=Task.position - 1)
         )
 
     # Reorganizar posições na nova coluna
-    db.query(Task).filter(
-        Task.column_id == move_data.column_id,
-        Task.position >= move_data.position,
-        Task.id != task_id,
-    ).update({Task.position: Task.position + 1})
+    await db.execute(
+        update(Task)
+        .where(
+            Task.column_id == move_data.column_id,
+            Task.position >= move_data.position,
+            Task.id != task.id,
+        )
+        .values(position=Task.position + 1)
+    )
 
-    db.commit()
-    db.refresh(task)
+    await db.commit()
+    await db.refresh(task)
+    await response_cache.bump("column", old_column_id, task.column_id)
+    await publish_task_moved(db, task, old_column_id, column.board_id)
+    await activity_writer.emit(
+        task_moved_activity(task.id, old_column_id, task.column_id, task.position, current_user.id)
+    )
 
     return task
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_task(
-    task_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+async def delete_task(
+    task_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     Deletar tarefa existente
     """
-    task = db.query(Task).filter(Task.id == task_id).first()
+    result = await db.execute(select(Task).where(Task.id == task_id))
+    task = result.scalar_one_or_none()
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
 
-    # Reorganizar posições das tarefas restantes na mesma coluna
-    db.query(Task).filter(Task.column_id == task.column_id, Task.position > task.position).update(
-        {Task.position: Task.position - 1}
-    )
+    # Reorganizar posições das tarefas restantes na mesma coluna (desnecessário com ranks)
+    if settings.TASK_ORDERING != "rank":
+        await db.execute(
+            update(Task)
+            .where(Task.column_id == task.column_id, Task.position > task.position)
+            .values(position=Task.position - 1)
+        )
 
-    db.delete(task)
-    db.commit()
+    await db.delete(task)
+    await db.commit()
+    await response_cache.bump("column", task.column_id)
+    await board_broker.publish(
+        await board_id_for_column(db, task.column_id),
+        {"type": "task.deleted", "task_id": str(task.id), "column_id": str(task.column_id)},
+    )
+    # A tarefa não existe mais: o id vai em meta_data (task_id fica nulo)
+    await activity_writer.emit(
+        activity_row(
+            ActivityAction.TASK_DELETED,
+            current_user.id,
+            column_id=task.column_id,
+            meta={"task_id": task.id, "title": task.title},
+        )
+    )
 
     return None
 
 
 @router.get("/{column_id}/tasks", response_model=List[TaskResponse])
-def get_tasks_by_column(
-    column_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+@query_budget(3)
+async def get_tasks_by_column(
+    column_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     Buscar todas as tarefas de uma coluna específica
     """
-    column = db.query(Column).filter(Column.id == column_id).first()
-    if not column:
+    cached, cache_slot = await response_cache.lookup("column", column_id, "tasks")
+    if cached is not None:
+        return fast_json_response(cached)
+    started = time.perf_counter()
+
+    result = await db.execute(select(Column.id).where(Column.id == column_id))
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Column not found")
 
-    tasks = db.query(Task).filter(Task.column_id == column_id).order_by(Task.position).all()
+    result = await db.execute(
+        select(*response_columns(Task, TaskResponse))
+        .where(Task.column_id == column_id)
+        .order_by(*task_ordering())
+    )
+    payload = rows_payload(result.all(), TaskResponse)
 
-    return tasks
+    await response_cache.store(cache_slot, payload, time.perf_counter() - started)
+    return fast_json_response(payload)
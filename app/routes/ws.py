@@ -0,0 +1,69 @@
+import asyncio
+from uuid import UUID
+from fastapi import APIRouter, HTTPException, Query, WebSocket, status
+from sqlalchemy import select
+from app.core.database import AsyncSessionLocal
+from app.middleware.auth import authenticate_token
+from app.models.board import Board
+from app.models.project import Project
+from app.services.realtime import board_broker
+
+router = APIRouter()
+
+
+@router.websocket("/ws/boards/{board_id}")
+async def board_updates(
+    websocket: WebSocket,
+    board_id: UUID,
+    token: str = Query(..., description="Access token JWT"),
+):
+    """
+    Eventos em tempo real das tarefas de um board
+
+    Mensagens (JSON): {"type": "subscribed"} na conexão, depois "task.created",
+    "task.updated", "task.moved", "task.deleted", "tasks.batch" (recarregar as
+    colunas listadas) e "resync" (recarregar o board).
+    """
+    # Sessão curta: conexões ociosas não podem segurar conexões do pool
+    async with AsyncSessionLocal() as db:
+        try:
+            user = await authenticate_token(token, db)
+        except HTTPException:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
+
+        result = await db.execute(
+            select(Board.id)
+            .join(Project, Project.id == Board.project_id)
+            .where(Board.id == board_id, Project.owner_id == user.id)
+        )
+        board = result.scalar_one_or_none()
+
+    if board is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    subscription = board_broker.subscribe(board)
+
+    async def forward():
+        try:
+            while True:
+                await websocket.send_text(await subscription.get())
+        except Exception:
+            # Conexão encerrada durante o envio: o loop de leitura recebe o disconnect
+            return
+
+    sender = None
+    try:
+        await websocket.send_json({"type": "subscribed", "board_id": str(board)})
+        sender = asyncio.create_task(forward())
+        # Mensagens do cliente são ignoradas; o loop só detecta a desconexão
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+    finally:
+        board_broker.unsubscribe(subscription)
+        if sender is not None:
+            sender.cancel()
@@ -24,6 +24,21 @@ from app.schemas.task import (
     TaskMove,
     TaskResponse,
 )
+from app.schemas.comment import (
+    CommentBase,
+    CommentCreate,
+    CommentUpdate,
+    CommentResponse,
+)
+from app.schemas.tag import (
+    TagBase,
+    TagCreate,
+    TagUpdate,
+    TagResponse,
+    TaskBatchTagRequest,
+    TaskBatchTagResponse,
+)
+from app.schemas.activity import ActivityLogResponse
 
 __all__ = [
     # User
@@ -45,4 +60,18 @@ __all__ = [
     "TaskUpdate",
     "TaskMove",
     "TaskResponse",
+    # Comment
+    "CommentBase",
+    "CommentCreate",
+    "CommentUpdate",
+    "CommentResponse",
+    # Tag
+    "TagBase",
+    "TagCreate",
+    "TagUpdate",
+    "TagResponse",
+    "TaskBatchTagRequest",
+    "TaskBatchTagResponse",
+    # Activity
+    "ActivityLogResponse",
 ]
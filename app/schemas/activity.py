@@ -0,0 +1,29 @@
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+import json
+from app.models.activity_log import ActivityAction
+
+
+# Schema de resposta dos feeds de atividade (tarefa, board e projeto)
+class ActivityLogResponse(BaseModel):
+    id: UUID
+    action: ActivityAction
+    description: Optional[str] = None
+    meta: Optional[Dict[str, Any]] = Field(None, validation_alias="meta_data")
+    task_id: Optional[UUID] = None
+    board_id: Optional[UUID] = None
+    project_id: Optional[UUID] = None
+    user_id: UUID
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator("meta", mode="before")
+    @classmethod
+    def parse_meta(cls, value):
+        # meta_data é gravado como texto JSON
+        if isinstance(value, str):
+            return json.loads(value)
+        return value
@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field, ConfigDict
+from datetime import datetime
+from uuid import UUID
+
+
+# Schema base de comentário
+class CommentBase(BaseModel):
+    content: str = Field(..., min_length=1, max_length=10000)
+
+
+# Schema para criar comentário
+class CommentCreate(CommentBase):
+    task_id: UUID
+
+
+# Schema para editar comentário
+class CommentUpdate(CommentBase):
+    pass
+
+
+# Schema de resposta do comentário
+class CommentResponse(CommentBase):
+    id: UUID
+    task_id: UUID
+    user_id: UUID
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
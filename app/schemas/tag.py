@@ -0,0 +1,52 @@
+from pydantic import BaseModel, Field, ConfigDict
+from datetime import datetime
+from typing import List, Literal, Optional
+from uuid import UUID
+
+# Máximo de tarefas e de tags por requisição de POST /api/tasks/batch-tag
+MAX_BATCH_TAG_TASKS = 500
+MAX_BATCH_TAG_TAGS = 50
+
+TAG_COLOR_PATTERN = r"^#[0-9A-Fa-f]{6}$"
+
+
+# Schema base de tag
+class TagBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=50)
+    color: str = Field("#3B82F6", pattern=TAG_COLOR_PATTERN)
+
+
+# Schema para criar tag
+class TagCreate(TagBase):
+    project_id: UUID
+
+
+# Schema para atualizar tag
+class TagUpdate(BaseModel):
+    name: Optional[str] = Field(None, min_length=1, max_length=50)
+    color: Optional[str] = Field(None, pattern=TAG_COLOR_PATTERN)
+
+
+# Schema de resposta da tag
+class TagResponse(TagBase):
+    id: UUID
+    project_id: UUID
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Adicionar/remover tags de várias tarefas (POST /api/tasks/batch-tag)
+class TaskBatchTagRequest(BaseModel):
+    action: Literal["add", "remove"]
+    task_ids: List[UUID] = Field(..., min_length=1, max_length=MAX_BATCH_TAG_TASKS)
+    tag_ids: List[UUID] = Field(..., min_length=1, max_length=MAX_BATCH_TAG_TAGS)
+
+
+class TaskBatchTagResponse(BaseModel):
+    action: str
+    # Pares (tarefa, tag) efetivamente inseridos ou removidos
+    changed: int
+    # Tarefas que ganharam ou perderam alguma tag
+    task_ids: List[UUID]
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, List, Literal, Optional, Union
 from uuid import UUID
 from app.models.task import TaskPriority
 
@@ -41,7 +41,61 @@ class TaskResponse(TaskBase):
     column_id: UUID
     assignee_id: Optional[UUID] = None
     created_by: UUID
+    comment_count: int = 0
     created_at: datetime
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# Operações em lote (POST /api/tasks/batch)
+MAX_BATCH_OPERATIONS = 500
+
+
+class TaskBatchCreate(TaskCreate):
+    op: Literal["create"]
+
+
+class TaskBatchUpdate(TaskUpdate):
+    op: Literal["update"]
+    task_id: UUID
+
+
+class TaskBatchMove(TaskMove):
+    op: Literal["move"]
+    task_id: UUID
+
+
+class TaskBatchDelete(BaseModel):
+    op: Literal["delete"]
+    task_id: UUID
+
+
+TaskBatchOperation = Annotated[
+    Union[TaskBatchCreate, TaskBatchUpdate, TaskBatchMove, TaskBatchDelete],
+    Field(discriminator="op"),
+]
+
+
+class TaskBatchRequest(BaseModel):
+    operations: List[TaskBatchOperation] = Field(..., min_length=1, max_length=MAX_BATCH_OPERATIONS)
+
+
+# Resultado de cada operação, na mesma ordem da requisição
+class TaskBatchItemResult(BaseModel):
+    index: int
+    op: str
+    status: int
+    task: Optional[TaskResponse] = None
+    detail: Optional[str] = None
+
+
+class TaskBatchResponse(BaseModel):
+    results: List[TaskBatchItemResult]
+
+
+# Resultado da busca textual (GET /api/tasks/search): trechos com os termos em <mark>
+class TaskSearchResult(TaskResponse):
+    rank: float
+    title_highlight: str
+    snippet: Optional[str] = None
@@ -0,0 +1,438 @@
+"""
+Gravação do log de atividades (activity_logs) em lotes, fora do caminho da requisição
+
+As rotas registram eventos com `await activity_writer.emit(activity_row(...))`
+depois do commit. O evento vai para uma fila e uma task em background grava a
+fila com um único INSERT de várias linhas a cada ACTIVITY_FLUSH_INTERVAL_MS
+(ou antes, quando acumula ACTIVITY_BATCH_SIZE eventos), em uma sessão própria.
+O board e o projeto de cada evento (colunas desnormalizadas usadas pelos
+feeds) são resolvidos a partir da coluna da tarefa no flush, com uma query
+por lote, e não na rota.
+
+Backpressure: a fila tem no máximo ACTIVITY_QUEUE_SIZE eventos. Com ela cheia,
+emit espera até ACTIVITY_ENQUEUE_TIMEOUT_MS por espaço e então descarta o
+evento (contado em stats()["dropped"]): o log nunca derruba nem trava a rota.
+
+Backends (settings.ACTIVITY_BACKEND):
+- "memory": fila no processo; o que estiver pendente é gravado no shutdown
+- "redis": os eventos vão para o stream kanban:activity e cada worker consome
+  em grupo (XREADGROUP), confirmando (XACK) só depois do INSERT; entradas de um
+  worker que morreu são reivindicadas (XAUTOCLAIM) por outro
+- "none": eventos ignorados
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID, uuid4
+from sqlalchemy import Select, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import with_parent
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, get_async_engine
+from app.models.activity_log import ActivityAction, ActivityLog
+from app.models.board import Board
+from app.models.column import Column
+from app.models.task import Task
+from app.utils.pagination import decode_cursor, keyset_before, parse_datetime
+
+logger = logging.getLogger(__name__)
+
+STREAM_KEY = "kanban:activity"
+STREAM_GROUP = "activity-writers"
+# Entradas pendentes há mais que isso (worker morto ou INSERT falhou) são reivindicadas
+STREAM_CLAIM_IDLE_MS = 60000
+# Linhas por INSERT: 10 parâmetros por linha, abaixo do limite de 32767 do asyncpg
+MAX_INSERT_ROWS = 3000
+
+
+def activity_row(
+    action: ActivityAction,
+    user_id: Any,
+    task_id: Any = None,
+    column_id: Any = None,
+    description: Optional[str] = None,
+    meta: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Evento de activity_logs com o horário do evento (não o do flush)
+
+    `column_id` é a coluna da tarefa: no flush vira board_id/project_id.
+    """
+    now = datetime.utcnow()
+    return {
+        "id": uuid4(),
+        "action": action,
+        "description": description,
+        "meta_data": json.dumps(meta, default=str) if meta else None,
+        "task_id": task_id,
+        "column_id": column_id,
+        "user_id": user_id,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def task_update_activity(
+    task_id: Any, column_id: Any, changes: Dict[str, Any], user_id: Any
+) -> List[Dict]:
+    """TASK_UPDATED com os campos alterados (e TASK_ASSIGNED se o responsável mudou)"""
+    rows = [
+        activity_row(
+            ActivityAction.TASK_UPDATED,
+            user_id,
+            task_id,
+            column_id,
+            meta={"fields": sorted(changes)},
+        )
+    ]
+    if "assignee_id" in changes:
+        rows.append(
+            activity_row(
+                ActivityAction.TASK_ASSIGNED,
+                user_id,
+                task_id,
+                column_id,
+                meta={"assignee_id": changes["assignee_id"]},
+            )
+        )
+    return rows
+
+
+def task_moved_activity(
+    task_id: Any, from_column_id: Any, to_column_id: Any, position: int, user_id: Any
+) -> Dict[str, Any]:
+    return activity_row(
+        ActivityAction.TASK_MOVED,
+        user_id,
+        task_id,
+        to_column_id,
+        meta={"from_column_id": from_column_id, "column_id": to_column_id, "position": position},
+    )
+
+
+def _without_missing_tasks(rows: List[Dict[str, Any]], existing: set) -> List[Dict[str, Any]]:
+    """
+    Tarefa excluída antes do flush: a atividade é gravada sem task_id (a FK
+    falharia) e o id vai para meta_data
+    """
+    fixed = []
+    for row in rows:
+        if row["task_id"] is not None and row["task_id"] not in existing:
+            meta = json.loads(row["meta_data"]) if row["meta_data"] else {}
+            meta["task_id"] = str(row["task_id"])
+            row = {**row, "task_id": None, "meta_data": json.dumps(meta)}
+        fixed.append(row)
+    return fixed
+
+
+async def _with_scope(db: AsyncSession, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Troca column_id por board_id/project_id (uma query para o lote todo)"""
+    column_ids = {row["column_id"] for row in rows if row.get("column_id") is not None}
+    scopes: Dict[Any, Any] = {}
+    if column_ids:
+        result = await db.execute(
+            select(Column.id, Column.board_id, Board.project_id)
+            .join(Board, Board.id == Column.board_id)
+            .where(Column.id.in_(column_ids))
+        )
+        scopes = {column_id: (board_id, project_id) for column_id, board_id, project_id in result}
+
+    scoped = []
+    for row in rows:
+        row = dict(row)
+        board_id, project_id = scopes.get(row.pop("column_id", None), (None, None))
+        scoped.append({**row, "board_id": board_id, "project_id": project_id})
+    return scoped
+
+
+async def write_activity_rows(rows: List[Dict[str, Any]]) -> None:
+    """Grava as linhas com um INSERT de várias linhas, em uma sessão própria"""
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        rows = await _with_scope(db, rows)
+        try:
+            await db.execute(insert(ActivityLog).values(rows))
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            task_ids = {row["task_id"] for row in rows if row["task_id"] is not None}
+            result = await db.execute(select(Task.id).where(Task.id.in_(task_ids)))
+            rows = _without_missing_tasks(rows, set(result.scalars()))
+            await db.execute(insert(ActivityLog).values(rows))
+            await db.commit()
+
+
+def activity_feed_query(
+    parent: Any, relationship: Any, cursor: Optional[str], limit: int
+) -> Select:
+    """
+    Página do feed de atividades de uma tarefa, board ou projeto (mais recentes primeiro)
+
+    Ex.: activity_feed_query(board, Board.activity_logs, cursor, 50). O filtro é
+    pela coluna desnormalizada (task_id/board_id/project_id), coberta pelos
+    índices ix_activity_logs_<escopo>_id_created_at: cada página lê `limit`
+    entradas do índice a partir do cursor, sem join e sem OFFSET.
+    """
+    query = select(ActivityLog).where(with_parent(parent, relationship))
+    if cursor:
+        values = decode_cursor(cursor, (parse_datetime, UUID))
+        query = query.where(keyset_before((ActivityLog.created_at, ActivityLog.id), values))
+    return query.order_by(ActivityLog.created_at.desc(), ActivityLog.id.desc()).limit(limit)
+
+
+def activity_cursor_key(log: ActivityLog):
+    return (log.created_at, log.id)
+
+
+class ActivityWriter:
+    """
+    Fila de eventos com flush por tamanho ou tempo em uma task em background
+    """
+
+    backend = "memory"
+
+    def __init__(
+        self,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        queue_size: int = 10000,
+        enqueue_timeout: float = 0.1,
+    ):
+        self.batch_size = min(batch_size, MAX_INSERT_ROWS)
+        self.flush_interval = flush_interval
+        self.queue_size = queue_size
+        self.enqueue_timeout = enqueue_timeout
+        self._queue: Optional["asyncio.Queue[Dict[str, Any]]"] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._closing = False
+        self.written = 0
+        self.batches = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        """Inicia a task de flush no event loop atual (lifespan ou primeiro emit)"""
+        if self._flusher is not None and not self._flusher.done():
+            return
+        if self._queue is None or self._flusher is not None:
+            # Fila e evento pertencem ao loop em que são usados
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+            self._wakeup = asyncio.Event()
+        self._closing = False
+        self._flusher = asyncio.create_task(self._run())
+
+    async def emit(self, *rows: Dict[str, Any]) -> None:
+        """Enfileira eventos; com a fila cheia espera enqueue_timeout e descarta"""
+        self.start()
+        for row in rows:
+            try:
+                self._queue.put_nowait(row)
+            except asyncio.QueueFull:
+                try:
+                    await asyncio.wait_for(self._queue.put(row), self.enqueue_timeout)
+                except asyncio.TimeoutError:
+                    self.dropped += 1
+                    if self.dropped % 1000 == 1:
+                        logger.warning("Activity queue full, dropped %s events", self.dropped)
+                    continue
+        if self._queue.qsize() >= self.batch_size:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+        await self.flush()
+
+    def _drain(self, limit: int) -> List[Dict[str, Any]]:
+        rows = []
+        while len(rows) < limit and not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        return rows
+
+    async def _write(self, rows: List[Dict[str, Any]]) -> bool:
+        try:
+            await write_activity_rows(rows)
+        except Exception:
+            self.failed += len(rows)
+            logger.exception("Failed to write %s activity events", len(rows))
+            return False
+        self.written += len(rows)
+        self.batches += 1
+        return True
+
+    async def flush(self) -> None:
+        """Grava tudo o que está na fila, em lotes de batch_size"""
+        if self._queue is None:
+            return
+        while True:
+            rows = self._drain(self.batch_size)
+            if not rows:
+                return
+            await self._write(rows)
+
+    async def close(self) -> None:
+        """Encerra a task de flush gravando os eventos pendentes (shutdown)"""
+        if self._flusher is None or self._flusher.done():
+            await self.flush()
+            return
+        self._closing = True
+        self._wakeup.set()
+        await self._flusher
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+
+class NullActivityWriter(ActivityWriter):
+    """ACTIVITY_BACKEND="none": eventos ignorados"""
+
+    backend = "none"
+
+    def start(self) -> None:
+        return None
+
+    async def emit(self, *rows: Dict[str, Any]) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+
+def _encode_row(row: Dict[str, Any]) -> str:
+    return json.dumps({**row, "action": row["action"].name}, separators=(",", ":"), default=str)
+
+
+def _decode_row(data: str) -> Dict[str, Any]:
+    row = json.loads(data)
+    row["id"] = UUID(row["id"])
+    row["action"] = ActivityAction[row["action"]]
+    row["task_id"] = UUID(row["task_id"]) if row["task_id"] else None
+    row["column_id"] = UUID(row["column_id"]) if row.get("column_id") else None
+    row["user_id"] = UUID(row["user_id"])
+    row["created_at"] = datetime.fromisoformat(row["created_at"])
+    row["updated_at"] = datetime.fromisoformat(row["updated_at"])
+    return row
+
+
+class RedisActivityWriter(ActivityWriter):
+    """
+    Eventos em um stream do Redis, gravados por qualquer worker do grupo
+
+    O stream é limitado (aproximadamente) a queue_size entradas; entradas
+    gravadas são removidas (XACK + XDEL), então o limite só é atingido se
+    nenhum worker estiver consumindo.
+    """
+
+    backend = "redis"
+
+    def __init__(self, redis_url: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        from redis.asyncio import Redis
+
+        self.redis = Redis.from_url(redis_url, decode_responses=True)
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self._group_ready = False
+
+    async def emit(self, *rows: Dict[str, Any]) -> None:
+        self.start()
+        pipeline = self.redis.pipeline(transaction=False)
+        for row in rows:
+            pipeline.xadd(
+                STREAM_KEY, {"row": _encode_row(row)}, maxlen=self.queue_size, approximate=True
+            )
+        try:
+            await asyncio.wait_for(pipeline.execute(), self.enqueue_timeout)
+        except Exception:
+            self.dropped += len(rows)
+            logger.warning("Failed to publish %s activity events", len(rows), exc_info=True)
+
+    async def _ensure_group(self) -> None:
+        if self._group_ready:
+            return
+        try:
+            await self.redis.xgroup_create(STREAM_KEY, STREAM_GROUP, id="0", mkstream=True)
+        except Exception as error:
+            if "BUSYGROUP" not in str(error):
+                raise
+        self._group_ready = True
+
+    async def _consume(self, entries: Sequence) -> None:
+        if not entries:
+            return
+        ids = [entry_id for entry_id, _ in entries]
+        rows = [_decode_row(fields["row"]) for _, fields in entries]
+        # Sem XACK em caso de falha: a entrada fica pendente e é reivindicada depois
+        if await self._write(rows):
+            pipeline = self.redis.pipeline(transaction=False)
+            pipeline.xack(STREAM_KEY, STREAM_GROUP, *ids)
+            pipeline.xdel(STREAM_KEY, *ids)
+            await pipeline.execute()
+
+    async def flush(self) -> None:
+        """Grava as entradas novas do stream e as pendentes há muito tempo"""
+        try:
+            await self._ensure_group()
+            _, claimed, *_ = await self.redis.xautoclaim(
+                STREAM_KEY,
+                STREAM_GROUP,
+                self.consumer,
+                min_idle_time=STREAM_CLAIM_IDLE_MS,
+                start_id="0-0",
+                count=self.batch_size,
+            )
+            await self._consume(claimed)
+            while True:
+                response = await self.redis.xreadgroup(
+                    STREAM_GROUP, self.consumer, {STREAM_KEY: ">"}, count=self.batch_size
+                )
+                entries = response[0][1] if response else []
+                if not entries:
+                    return
+                await self._consume(entries)
+        except Exception:
+            logger.warning("Activity stream consumer failed", exc_info=True)
+
+    async def close(self) -> None:
+        await super().close()
+        await self.redis.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "pending": None, "consumer": self.consumer}
+
+
+def create_activity_writer() -> ActivityWriter:
+    """Instancia o writer configurado em settings.ACTIVITY_BACKEND"""
+    options = {
+        "batch_size": settings.ACTIVITY_BATCH_SIZE,
+        "flush_interval": settings.ACTIVITY_FLUSH_INTERVAL_MS / 1000,
+        "queue_size": settings.ACTIVITY_QUEUE_SIZE,
+        "enqueue_timeout": settings.ACTIVITY_ENQUEUE_TIMEOUT_MS / 1000,
+    }
+    if settings.ACTIVITY_BACKEND == "redis":
+        return RedisActivityWriter(settings.REDIS_URL, **options)
+    if settings.ACTIVITY_BACKEND == "none":
+        return NullActivityWriter(**options)
+    return ActivityWriter(**options)
+
+
+# Instância global do writer do log de atividades
+activity_writer = create_activity_writer()
@@ -0,0 +1,307 @@
+"""
+Manutenção das partições mensais de activity_logs
+
+No PostgreSQL activity_logs é particionada por RANGE (created_at): uma partição
+por mês (activity_logs_AAAA_MM) e a partição default para linhas fora delas.
+Este comando roda no deploy (--premake-only, ver start.sh) e diariamente (cron):
+
+1. cria as partições do mês atual até ACTIVITY_PARTITION_PREMAKE_MONTHS meses à
+   frente; linhas que já tenham caído na default nesses meses são movidas para a
+   nova partição
+2. aplica a retenção: partições inteiramente anteriores aos últimos
+   ACTIVITY_RETENTION_MONTHS meses são exportadas para ACTIVITY_ARCHIVE_DIR
+   (ACTIVITY_RETENTION_ACTION=archive) e removidas com DETACH + DROP. Não há
+   DELETE linha a linha, então o vacuum e os índices ficam restritos às partições
+   vivas
+
+O arquivo é escrito com sufixo .partial e renomeado só depois do fsync; a
+partição só é removida depois disso.
+
+    python -m app.services.activity_partitions
+    python -m app.services.activity_partitions --premake-only
+    python -m app.services.activity_partitions --dry-run
+"""
+
+import argparse
+import gzip
+import os
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.core.config import settings
+from app.core.database import get_engine
+from app.models.activity_log import ACTIVITY_DEFAULT_PARTITION
+
+PARENT_TABLE = "activity_logs"
+# Linhas lidas do banco por vez ao exportar uma partição
+ARCHIVE_BATCH_ROWS = 10000
+ARCHIVE_COLUMNS = [
+    "id",
+    "action",
+    "description",
+    "meta_data",
+    "task_id",
+    "user_id",
+    "board_id",
+    "project_id",
+    "created_at",
+    "updated_at",
+]
+
+_PARTITION_NAME = re.compile(r"^activity_logs_(\d{4})_(\d{2})$")
+
+
+@dataclass
+class Partition:
+    name: str
+    start: date  # inclusivo
+    end: date  # exclusivo
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_partition(day: date) -> Partition:
+    start = day.replace(day=1)
+    return Partition(f"{PARENT_TABLE}_{start:%Y_%m}", start, add_months(start, 1))
+
+
+def list_partitions(connection: Connection) -> List[Partition]:
+    """Partições mensais existentes, da mais antiga para a mais nova"""
+    names = connection.execute(
+        text(
+            "SELECT inhrelid::regclass::text FROM pg_inherits "
+            "WHERE inhparent = CAST(:parent AS regclass)"
+        ),
+        {"parent": PARENT_TABLE},
+    ).scalars()
+    partitions = []
+    for name in names:
+        match = _PARTITION_NAME.match(name)
+        if match:
+            partitions.append(month_partition(date(int(match[1]), int(match[2]), 1)))
+    return sorted(partitions, key=lambda partition: partition.start)
+
+
+def create_partition(connection: Connection, partition: Partition) -> int:
+    """
+    Cria a partição do mês; devolve quantas linhas vieram da partição default
+    """
+    bounds = {"start": partition.start, "end": partition.end}
+    in_range = "created_at >= :start AND created_at < :end"
+    create = (
+        f"CREATE TABLE {partition.name} PARTITION OF {PARENT_TABLE} "
+        f"FOR VALUES FROM ('{partition.start}') TO ('{partition.end}')"
+    )
+    stray = connection.execute(
+        text(f"SELECT count(*) FROM {ACTIVITY_DEFAULT_PARTITION} WHERE {in_range}"), bounds
+    ).scalar_one()
+    if not stray:
+        connection.execute(text(create))
+        return 0
+
+    # O PostgreSQL não cria a partição por cima de linhas da default no mesmo
+    # intervalo: a default é desanexada, as linhas movidas e a default reanexada,
+    # na mesma transação (inserts concorrentes esperam pelo lock da tabela)
+    connection.execute(
+        text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {ACTIVITY_DEFAULT_PARTITION}")
+    )
+    connection.execute(text(create))
+    connection.execute(
+        text(
+            f"INSERT INTO {PARENT_TABLE} "
+            f"SELECT * FROM {ACTIVITY_DEFAULT_PARTITION} WHERE {in_range}"
+        ),
+        bounds,
+    )
+    connection.execute(text(f"DELETE FROM {ACTIVITY_DEFAULT_PARTITION} WHERE {in_range}"), bounds)
+    connection.execute(
+        text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {ACTIVITY_DEFAULT_PARTITION} DEFAULT")
+    )
+    return stray
+
+
+def missing_partitions(connection: Connection, today: date, months_ahead: int) -> List[Partition]:
+    existing = {partition.name for partition in list_partitions(connection)}
+    wanted = [month_partition(add_months(today, offset)) for offset in range(months_ahead + 1)]
+    return [partition for partition in wanted if partition.name not in existing]
+
+
+def expired_partitions(
+    connection: Connection, today: date, retention_months: int
+) -> List[Partition]:
+    """Partições que terminam antes do início da janela de retenção"""
+    cutoff = add_months(today.replace(day=1), -retention_months)
+    return [partition for partition in list_partitions(connection) if partition.end <= cutoff]
+
+
+def _write_jsonl(connection: Connection, partition: Partition, output) -> int:
+    result = connection.execute(
+        text(f"SELECT row_to_json(a)::text FROM {partition.name} AS a"),
+        execution_options={"yield_per": ARCHIVE_BATCH_ROWS},
+    )
+    rows = 0
+    with gzip.GzipFile(fileobj=output, mode="wb") as archive:
+        for (line,) in result:
+            archive.write(line.encode("utf-8") + b"\n")
+            rows += 1
+    return rows
+
+
+def _parquet_modules():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise RuntimeError(
+            "ACTIVITY_ARCHIVE_FORMAT=parquet requer o pacote pyarrow (pip install pyarrow)"
+        )
+    return pyarrow, pyarrow.parquet
+
+
+def _write_parquet(connection: Connection, partition: Partition, output) -> int:
+    pa, pq = _parquet_modules()
+    schema = pa.schema(
+        [
+            (column, pa.timestamp("us") if column.endswith("_at") else pa.string())
+            for column in ARCHIVE_COLUMNS
+        ]
+    )
+    selected = ", ".join(
+        column if column.endswith("_at") else f"{column}::text" for column in ARCHIVE_COLUMNS
+    )
+    result = connection.execute(
+        text(f"SELECT {selected} FROM {partition.name}"),
+        execution_options={"yield_per": ARCHIVE_BATCH_ROWS},
+    )
+    rows = 0
+    with pq.ParquetWriter(output, schema, compression="zstd") as writer:
+        for batch in result.partitions():
+            columns = list(zip(*batch))
+            writer.write_table(
+                pa.Table.from_arrays(
+                    [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                    schema=schema,
+                )
+            )
+            rows += len(batch)
+    return rows
+
+
+def archive_partition(
+    connection: Connection, partition: Partition, archive_dir: str, archive_format: str
+) -> Path:
+    """Exporta a partição para <archive_dir>/<partição>.jsonl.gz (ou .parquet)"""
+    directory = Path(archive_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    suffix, write = (
+        (".parquet", _write_parquet) if archive_format == "parquet" else (".jsonl.gz", _write_jsonl)
+    )
+    path = directory / f"{partition.name}{suffix}"
+    partial = path.with_name(path.name + ".partial")
+
+    with open(partial, "wb") as output:
+        rows = write(connection, partition, output)
+        output.flush()
+        os.fsync(output.fileno())
+    os.replace(partial, path)
+    print(f"archived {partition.name}: {rows} rows -> {path}")
+    return path
+
+
+def drop_partition(connection: Connection, partition: Partition) -> None:
+    connection.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {partition.name}"))
+    connection.execute(text(f"DROP TABLE {partition.name}"))
+
+
+def run_maintenance(
+    connection: Connection,
+    today: date,
+    premake_months: int,
+    retention_months: Optional[int],
+    retention_action: str,
+    archive_dir: str,
+    archive_format: str,
+    dry_run: bool = False,
+) -> None:
+    """
+    Cria as partições futuras e aplica a retenção (retention_months None ou 0 = manter tudo)
+    """
+    for partition in missing_partitions(connection, today, premake_months):
+        if dry_run:
+            print(f"would create {partition.name}")
+            continue
+        moved = create_partition(connection, partition)
+        connection.commit()
+        print(f"created {partition.name} ({moved} rows moved from {ACTIVITY_DEFAULT_PARTITION})")
+
+    if not retention_months:
+        return
+    if retention_action == "archive" and archive_format == "parquet":
+        _parquet_modules()
+
+    for partition in expired_partitions(connection, today, retention_months):
+        if dry_run:
+            print(f"would {retention_action} {partition.name}")
+            continue
+        if retention_action == "archive":
+            archive_partition(connection, partition, archive_dir, archive_format)
+        drop_partition(connection, partition)
+        connection.commit()
+        print(f"dropped {partition.name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--premake-months", type=int, default=settings.ACTIVITY_PARTITION_PREMAKE_MONTHS
+    )
+    parser.add_argument(
+        "--retention-months",
+        type=int,
+        default=settings.ACTIVITY_RETENTION_MONTHS,
+        help="Meses completos mantidos além do atual (0 mantém tudo)",
+    )
+    parser.add_argument(
+        "--retention-action",
+        choices=("archive", "drop"),
+        default=settings.ACTIVITY_RETENTION_ACTION,
+    )
+    parser.add_argument("--archive-dir", default=settings.ACTIVITY_ARCHIVE_DIR)
+    parser.add_argument(
+        "--archive-format", choices=("jsonl", "parquet"), default=settings.ACTIVITY_ARCHIVE_FORMAT
+    )
+    parser.add_argument(
+        "--premake-only", action="store_true", help="Só cria as partições futuras (deploy)"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Só mostra o que seria feito")
+    args = parser.parse_args()
+
+    engine = get_engine()
+    if engine.dialect.name != "postgresql":
+        parser.error("activity_logs só é particionada no PostgreSQL")
+
+    with engine.connect() as connection:
+        run_maintenance(
+            connection,
+            today=datetime.utcnow().date(),
+            premake_months=args.premake_months,
+            retention_months=None if args.premake_only else args.retention_months,
+            retention_action=args.retention_action,
+            archive_dir=args.archive_dir,
+            archive_format=args.archive_format,
+            dry_run=args.dry_run,
+        )
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Snapshot completo do board (GET /api/boards/{board_id}/full) em selects de colunas
+
+Carregar Board -> colunas -> tarefas -> tags/responsável como entidades ORM
+hidratava linhas inteiras (o usuário responsável com hash de senha e flags),
+registrava cada objeto no identity map e validava a árvore no Pydantic objeto a
+objeto, só para serializar e descartar. Aqui cada nível é um SELECT só das
+colunas da resposta, montado em dicts e codificado com orjson
+(app.utils.fast_json):
+
+1. board, se pertence ao usuário
+2. colunas do board, por posição
+3. tarefas do board (colunas de TaskResponse) com o responsável (LEFT JOIN)
+4. tags das tarefas do board, por nome
+
+O número de queries não depende do tamanho do board.
+"""
+
+from typing import Any, Dict, List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.board import Board
+from app.models.column import Column
+from app.models.project import Project
+from app.models.tag import Tag, TaskTag
+from app.models.task import Task, task_ordering
+from app.models.user import User
+from app.schemas.task import TaskResponse
+from app.utils.fast_json import response_columns
+
+TASK_FIELDS = tuple(TaskResponse.model_fields)
+
+
+async def board_snapshot(db: AsyncSession, board_id, owner_id) -> Optional[Dict[str, Any]]:
+    """Board com colunas, tarefas, tags e responsável; None se não existe ou não é do usuário"""
+    result = await db.execute(
+        select(Board.id, Board.name, Board.project_id)
+        .join(Project, Project.id == Board.project_id)
+        .where(Board.id == board_id, Project.owner_id == owner_id)
+    )
+    board = result.one_or_none()
+    if board is None:
+        return None
+
+    result = await db.execute(
+        select(Column.id, Column.title, Column.position, Column.wip_limit)
+        .where(Column.board_id == board.id)
+        .order_by(Column.position, Column.id)
+    )
+    columns = [{**column._asdict(), "tasks": []} for column in result]
+    by_column = {column["id"]: column["tasks"] for column in columns}
+
+    result = await db.execute(
+        select(Tag.id, Tag.name, Tag.color, TaskTag.task_id)
+        .join(TaskTag, TaskTag.tag_id == Tag.id)
+        .join(Task, Task.id == TaskTag.task_id)
+        .join(Column, Column.id == Task.column_id)
+        .where(Column.board_id == board.id)
+        .order_by(Tag.name, Tag.id)
+    )
+    tags: Dict[Any, List[Dict[str, Any]]] = {}
+    for tag_id, name, color, task_id in result:
+        tags.setdefault(task_id, []).append({"id": tag_id, "name": name, "color": color})
+
+    result = await db.execute(
+        select(*response_columns(Task, TaskResponse), User.username, User.full_name)
+        .join(Column, Column.id == Task.column_id)
+        .outerjoin(User, User.id == Task.assignee_id)
+        .where(Column.board_id == board.id)
+        .order_by(*task_ordering())
+    )
+    for row in result:
+        task = dict(zip(TASK_FIELDS, row))
+        task["tags"] = tags.get(task["id"], [])
+        task["assignee"] = (
+            {"id": task["assignee_id"], "username": row.username, "full_name": row.full_name}
+            if task["assignee_id"] is not None
+            else None
+        )
+        by_column[task["column_id"]].append(task)
+
+    return {**board._asdict(), "columns": columns}
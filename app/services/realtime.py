@@ -0,0 +1,195 @@
+"""
+Fan-out de eventos de tarefas para os clientes conectados em /ws/boards/{board_id}
+
+As rotas de tarefas publicam eventos compactos (diffs) após o commit. Cada
+evento é serializado uma única vez e a mesma string é enfileirada para todas
+as conexões inscritas no board.
+
+Backends (settings.REALTIME_BACKEND):
+- "memory": entrega apenas às conexões do próprio processo (um único worker)
+- "redis": publica em um canal por board; cada worker mantém uma conexão de
+  pub/sub (PSUBSCRIBE) e repassa as mensagens às suas conexões locais
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Optional, Set
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.column import Column
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "kanban:board:"
+
+# Enviado no lugar dos eventos descartados quando a fila de uma conexão enche:
+# o cliente deve recarregar o board (GET /api/boards/{board_id}/full)
+RESYNC_MESSAGE = json.dumps({"type": "resync"})
+
+
+def _board_key(board_id: Any) -> str:
+    try:
+        return str(UUID(str(board_id)))
+    except ValueError:
+        return str(board_id)
+
+
+class Subscription:
+    """
+    Fila de mensagens (JSON já serializado) de uma conexão WebSocket
+    """
+
+    def __init__(self, board_id: str, maxsize: int):
+        self.board_id = board_id
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def deliver(self, message: str) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Cliente lento: descarta o backlog e pede um resync em vez de
+            # acumular memória sem limite no servidor
+            self.dropped += self.queue.qsize() + 1
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_MESSAGE)
+
+    async def get(self) -> str:
+        return await self.queue.get()
+
+
+class BoardBroker:
+    """
+    Registro das conexões por board com entrega no próprio processo
+    """
+
+    backend = "memory"
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self.published = 0
+        self.delivered = 0
+        self.errors = 0
+
+    def subscribe(self, board_id: Any) -> Subscription:
+        subscription = Subscription(_board_key(board_id), self.queue_size)
+        self._subscribers.setdefault(subscription.board_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(subscription.board_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.board_id]
+
+    def _dispatch(self, board_id: str, message: str) -> None:
+        for subscription in self._subscribers.get(board_id, ()):
+            subscription.deliver(message)
+            self.delivered += 1
+
+    async def _send(self, board_id: str, message: str) -> None:
+        self._dispatch(board_id, message)
+
+    async def publish(self, board_id: Any, event: Dict[str, Any]) -> None:
+        """Publica um evento para todos os inscritos no board (erros só são logados)"""
+        key = _board_key(board_id)
+        message = json.dumps({"board_id": key, **event}, separators=(",", ":"), default=str)
+        self.published += 1
+        try:
+            await self._send(key, message)
+        except Exception:
+            self.errors += 1
+            logger.warning("Realtime publish failed for board %s", key, exc_info=True)
+
+    async def close(self) -> None:
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "boards": len(self._subscribers),
+            "subscribers": sum(len(subs) for subs in self._subscribers.values()),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": sum(
+                subscription.dropped
+                for subscribers in self._subscribers.values()
+                for subscription in subscribers
+            ),
+            "errors": self.errors,
+        }
+
+
+class RedisBoardBroker(BoardBroker):
+    """
+    Broker para vários workers: publica no Redis e repassa o que chega pelo pub/sub
+    """
+
+    backend = "redis"
+
+    def __init__(self, redis_url: str, queue_size: int = 100):
+        super().__init__(queue_size)
+        from redis.asyncio import Redis
+
+        self.redis = Redis.from_url(redis_url, decode_responses=True)
+        self._listener: Optional[asyncio.Task] = None
+
+    def subscribe(self, board_id: Any) -> Subscription:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        return super().subscribe(board_id)
+
+    async def _send(self, board_id: str, message: str) -> None:
+        await self.redis.publish(CHANNEL_PREFIX + board_id, message)
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.psubscribe(CHANNEL_PREFIX + "*")
+                async for message in pubsub.listen():
+                    if message["type"] != "pmessage":
+                        continue
+                    board_id = message["channel"][len(CHANNEL_PREFIX) :]
+                    self._dispatch(board_id, message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.errors += 1
+                logger.warning("Realtime pub/sub connection lost, reconnecting", exc_info=True)
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+        await self.redis.aclose()
+
+
+async def board_id_for_column(db: AsyncSession, column_id: Any) -> Optional[UUID]:
+    """Board da coluna, usado para endereçar os eventos de tarefas"""
+    result = await db.execute(select(Column.board_id).where(Column.id == column_id))
+    return result.scalar_one_or_none()
+
+
+def create_broker() -> BoardBroker:
+    """Instancia o broker configurado em settings.REALTIME_BACKEND"""
+    if settings.REALTIME_BACKEND == "redis":
+        return RedisBoardBroker(settings.REDIS_URL, settings.REALTIME_QUEUE_SIZE)
+    return BoardBroker(settings.REALTIME_QUEUE_SIZE)
+
+
+# Instância global do broker de eventos dos boards
+board_broker = create_broker()
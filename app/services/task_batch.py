@@ -0,0 +1,274 @@
+"""
+Operações em lote sobre tarefas (POST /api/tasks/batch)
+
+Todas as operações rodam em uma transação. As colunas afetadas são lidas uma
+única vez (apenas id/coluna/posição/rank, com lock), as operações são
+aplicadas na ordem da requisição sobre listas em memória e, no final, as
+posições são recalculadas uma vez por coluna. As escritas saem em poucos
+comandos: um DELETE, um INSERT e um UPDATE em lote (executemany). Tags,
+comentários e atividades das tarefas excluídas saem pelo ON DELETE CASCADE.
+
+Uma operação inválida (tarefa/coluna inexistente) não aborta o lote: ela é
+reportada no resultado com status 404 e as demais são aplicadas.
+"""
+
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.activity_log import ActivityAction
+from app.models.column import Column
+from app.models.task import Task, task_ordering
+from app.schemas.task import TaskBatchOperation, TaskResponse, TaskUpdate
+from app.services.activity import activity_row, task_moved_activity, task_update_activity
+from app.services.task_ordering import needs_rebalance
+from app.utils.lexorank import rank_between
+
+# Colunas editáveis por uma operação "update"
+UPDATABLE_FIELDS = tuple(TaskUpdate.model_fields)
+
+
+@dataclass
+class _TaskSlot:
+    """Posição de uma tarefa durante o processamento do lote"""
+
+    id: UUID
+    column_id: UUID
+    position: int
+    rank: Optional[str]
+    # Colunas editáveis: valores lidos do banco (ou da criação) com as alterações do lote
+    changes: Dict[str, Any] = field(default_factory=dict)
+    created: bool = False
+    dirty: bool = False
+
+
+@dataclass
+class BatchOutcome:
+    results: List[Dict[str, Any]]
+    # Colunas alteradas, agrupadas por board (cache e eventos em tempo real)
+    boards: Dict[UUID, Set[UUID]]
+    rebalance: Set[UUID]
+    # Linhas do log de atividades das operações aplicadas (gravadas após o commit)
+    activity: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def column_ids(self) -> Set[UUID]:
+        return {column_id for columns in self.boards.values() for column_id in columns}
+
+
+def _rank_at(slots: List[_TaskSlot], index: int) -> Tuple[str, bool]:
+    """Rank para a posição `index` da lista (já sem a tarefa) e se é preciso rebalancear"""
+    before = slots[index - 1].rank if index > 0 else None
+    after = slots[index].rank if index < len(slots) else None
+    if before is not None and after is not None and before >= after:
+        return before, True
+    rank = rank_between(before, after)
+    return rank, needs_rebalance(rank)
+
+
+async def apply_task_batch(
+    db: AsyncSession, operations: Sequence[TaskBatchOperation], user_id: UUID
+) -> BatchOutcome:
+    """
+    Aplica as operações sem fazer commit (a rota confirma a transação)
+    """
+    use_rank = settings.TASK_ORDERING == "rank"
+    task_ids = {op.task_id for op in operations if op.op != "create"}
+    column_ids = {op.column_id for op in operations if op.op in ("create", "move")}
+
+    if task_ids:
+        result = await db.execute(select(Task.column_id).where(Task.id.in_(task_ids)).distinct())
+        column_ids.update(result.scalars().all())
+
+    result = await db.execute(select(Column.id, Column.board_id).where(Column.id.in_(column_ids)))
+    board_of = {column_id: board_id for column_id, board_id in result.all()}
+
+    # Estado atual das colunas envolvidas, na ordem de exibição
+    columns: Dict[UUID, List[_TaskSlot]] = {column_id: [] for column_id in board_of}
+    slots: Dict[UUID, _TaskSlot] = {}
+    if board_of:
+        result = await db.execute(
+            select(
+                Task.id,
+                Task.column_id,
+                Task.position,
+                Task.rank,
+                *(getattr(Task, name) for name in UPDATABLE_FIELDS),
+            )
+            .where(Task.column_id.in_(board_of))
+            .order_by(Task.column_id, *task_ordering())
+            .with_for_update()
+        )
+        for task_id, column_id, position, rank, *values in result.all():
+            slot = _TaskSlot(
+                id=task_id,
+                column_id=column_id,
+                position=position,
+                rank=rank,
+                changes=dict(zip(UPDATABLE_FIELDS, values)),
+            )
+            columns[column_id].append(slot)
+            slots[task_id] = slot
+
+    now = datetime.utcnow()
+    results: List[Dict[str, Any]] = []
+    touched: Set[UUID] = set()
+    inserts: List[Dict[str, Any]] = []
+    deleted: List[UUID] = []
+    rebalance: Set[UUID] = set()
+    activity: List[Dict[str, Any]] = []
+
+    for index, op in enumerate(operations):
+        outcome: Dict[str, Any] = {"index": index, "op": op.op}
+        results.append(outcome)
+
+        if op.op == "create":
+            target = columns.get(op.column_id)
+            if target is None:
+                outcome.update(status=404, detail="Column not found")
+                continue
+            rank = None
+            if use_rank:
+                rank, needs = _rank_at(target, len(target))
+                if needs:
+                    rebalance.add(op.column_id)
+            slot = _TaskSlot(
+                id=uuid.uuid4(),
+                column_id=op.column_id,
+                position=len(target),
+                rank=rank,
+                changes=op.model_dump(exclude={"op", "column_id"}),
+                created=True,
+            )
+            target.append(slot)
+            slots[slot.id] = slot
+            outcome.update(status=201, task_id=slot.id)
+            activity.append(
+                activity_row(
+                    ActivityAction.TASK_CREATED,
+                    user_id,
+                    slot.id,
+                    slot.column_id,
+                    meta={"title": op.title},
+                )
+            )
+            continue
+
+        slot = slots.get(op.task_id)
+        if slot is None:
+            outcome.update(status=404, detail="Task not found")
+            continue
+
+        if op.op == "update":
+            changes = op.model_dump(exclude_unset=True, exclude={"op", "task_id"})
+            slot.changes.update(changes)
+            slot.dirty = True
+            outcome.update(status=200, task_id=slot.id)
+            activity.extend(task_update_activity(slot.id, slot.column_id, changes, user_id))
+
+        elif op.op == "move":
+            target = columns.get(op.column_id)
+            if target is None:
+                outcome.update(status=404, detail="Column not found")
+                continue
+            from_column_id = slot.column_id
+            columns[slot.column_id].remove(slot)
+            position = min(op.position, len(target))
+            if use_rank:
+                slot.rank, needs = _rank_at(target, position)
+                if needs:
+                    rebalance.add(op.column_id)
+                slot.position = position
+            target.insert(position, slot)
+            slot.column_id = op.column_id
+            slot.dirty = True
+            outcome.update(status=200, task_id=slot.id)
+            activity.append(
+                task_moved_activity(slot.id, from_column_id, op.column_id, position, user_id)
+            )
+
+        else:
+            columns[slot.column_id].remove(slot)
+            del slots[slot.id]
+            if not slot.created:
+                deleted.append(slot.id)
+            touched.add(slot.column_id)
+            outcome.update(status=204, task_id=slot.id)
+            activity.append(
+                activity_row(
+                    ActivityAction.TASK_DELETED,
+                    user_id,
+                    column_id=slot.column_id,
+                    meta={"task_id": slot.id},
+                )
+            )
+
+    # Posições contíguas recalculadas uma vez por coluna (no modo rank só as
+    # tarefas criadas/movidas são gravadas)
+    if not use_rank:
+        for column_slots in columns.values():
+            for position, slot in enumerate(column_slots):
+                if slot.position != position:
+                    slot.position = position
+                    slot.dirty = True
+
+    updates: List[Dict[str, Any]] = []
+    for slot in slots.values():
+        if slot.created:
+            inserts.append(
+                {
+                    **slot.changes,
+                    "id": slot.id,
+                    "column_id": slot.column_id,
+                    "position": slot.position,
+                    "rank": slot.rank,
+                    "created_by": user_id,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+        elif slot.dirty:
+            # Todas as linhas com as mesmas chaves: um único UPDATE em lote (executemany),
+            # e não um por combinação de campos alterados
+            updates.append(
+                {
+                    **slot.changes,
+                    "id": slot.id,
+                    "column_id": slot.column_id,
+                    "position": slot.position,
+                    "rank": slot.rank,
+                    "updated_at": now,
+                }
+            )
+        else:
+            continue
+        touched.add(slot.column_id)
+
+    if deleted:
+        await db.execute(delete(Task).where(Task.id.in_(deleted)))
+    if inserts:
+        await db.execute(insert(Task), inserts)
+    if updates:
+        await db.execute(update(Task), updates)
+
+    # Tarefas criadas/alteradas voltam completas no resultado
+    returned_ids = [item["task_id"] for item in results if item["status"] in (200, 201)]
+    if returned_ids:
+        result = await db.execute(
+            select(Task).where(Task.id.in_(returned_ids)).execution_options(populate_existing=True)
+        )
+        tasks = {task.id: TaskResponse.model_validate(task) for task in result.scalars()}
+        for item in results:
+            if item["status"] in (200, 201):
+                item["task"] = tasks.get(item["task_id"])
+    for item in results:
+        item.pop("task_id", None)
+
+    boards: Dict[UUID, Set[UUID]] = {}
+    for column_id in touched:
+        boards.setdefault(board_of[column_id], set()).add(column_id)
+    return BatchOutcome(results=results, boards=boards, rebalance=rebalance, activity=activity)
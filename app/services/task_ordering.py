@@ -0,0 +1,152 @@
+"""
+Ordenação de tarefas por rank lexicográfico (TASK_ORDERING="rank")
+
+Com ranks, criar/mover/excluir uma tarefa grava apenas a linha da própria
+tarefa. Quando inserções repetidas no mesmo ponto esgotam o espaço entre
+ranks (rank maior que TASK_RANK_MAX_LENGTH), a coluna é rebalanceada em
+background, regravando ranks igualmente espaçados e posições contíguas.
+
+Conversão de uma base que rodava em TASK_ORDERING="position":
+
+    python -m app.services.task_ordering --from-position
+
+Obrigatória antes de mudar para "rank": a migration do rank só preencheu as
+tarefas que já existiam, e as criadas depois em "position" ficam com rank
+NULL, que quebra a ordem e a paginação por cursor sobre (rank, id).
+"""
+
+import argparse
+import asyncio
+import logging
+from typing import Optional, Tuple
+from uuid import UUID
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import response_cache
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, get_async_engine
+from app.models.task import Task
+from app.utils.lexorank import rank_between, spaced_ranks
+
+logger = logging.getLogger(__name__)
+
+
+def needs_rebalance(rank: str) -> bool:
+    """Indica se o rank ficou longo demais e a coluna deve ser rebalanceada"""
+    return len(rank) > settings.TASK_RANK_MAX_LENGTH
+
+
+async def next_slot(db: AsyncSession, column_id) -> Tuple[int, str]:
+    """
+    Posição e rank para adicionar uma tarefa ao final da coluna (uma query)
+    """
+    result = await db.execute(
+        select(func.max(Task.position), func.max(Task.rank)).where(Task.column_id == column_id)
+    )
+    last_position, last_rank = result.one()
+    position = (last_position + 1) if last_position is not None else 0
+    return position, rank_between(last_rank, None)
+
+
+async def rank_for_index(
+    db: AsyncSession, column_id, index: int, exclude_id=None
+) -> Tuple[str, int, bool]:
+    """
+    Rank que coloca uma tarefa no índice `index` da coluna
+
+    Busca apenas os dois vizinhos (índices index-1 e index), ignorando a
+    própria tarefa quando ela já está na coluna. Um índice além do fim vira o
+    fim da coluna (como em task_batch). Retorna (rank, índice usado, rebalancear).
+    """
+    others = Task.column_id == column_id
+    if exclude_id is not None:
+        others = others & (Task.id != exclude_id)
+    count = (await db.execute(select(func.count()).where(others))).scalar_one()
+    index = min(index, count)
+
+    query = (
+        select(Task.rank)
+        .where(others)
+        .order_by(Task.rank, Task.id)
+        .offset(max(index - 1, 0))
+        .limit(2)
+    )
+    neighbours = (await db.execute(query)).scalars().all()
+    if index == 0:
+        before, after = None, (neighbours[0] if neighbours else None)
+    else:
+        before = neighbours[0] if neighbours else None
+        after = neighbours[1] if len(neighbours) > 1 else None
+
+    if before is not None and after is not None and before >= after:
+        # Ranks duplicados (movimentos concorrentes): só o rebalanceamento separa
+        return before, index, True
+
+    rank = rank_between(before, after)
+    return rank, index, needs_rebalance(rank)
+
+
+async def rebalance_column(column_id, from_position: bool = False) -> int:
+    """
+    Regrava ranks igualmente espaçados e posições contíguas de uma coluna
+
+    Roda com sessão própria (chamado via BackgroundTasks ou pela linha de
+    comando). Com `from_position=True`, a ordem atual vem de Task.position.
+    """
+    if from_position:
+        ordering = (Task.position, Task.id)
+    else:
+        ordering = (Task.rank.asc().nulls_last(), Task.position, Task.id)
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Task.id).where(Task.column_id == column_id).order_by(*ordering).with_for_update()
+        )
+        task_ids = result.scalars().all()
+        if not task_ids:
+            return 0
+
+        ranks = spaced_ranks(len(task_ids))
+        await db.execute(
+            update(Task),
+            [
+                {"id": task_id, "rank": rank, "position": position}
+                for position, (task_id, rank) in enumerate(zip(task_ids, ranks))
+            ],
+        )
+        await db.commit()
+    await response_cache.bump("column", column_id)
+
+    logger.info("Rebalanced %s tasks in column %s", len(task_ids), column_id)
+    return len(task_ids)
+
+
+async def rebalance_all(from_position: bool = False, column_id: Optional[UUID] = None) -> None:
+    """Rebalanceia uma coluna específica ou todas as colunas com tarefas"""
+    if column_id is not None:
+        column_ids = [column_id]
+    else:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(select(Task.column_id).distinct())
+            column_ids = result.scalars().all()
+
+    for current in column_ids:
+        await rebalance_column(current, from_position=from_position)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebalanceia os ranks das tarefas")
+    parser.add_argument("--column", type=UUID, default=None, help="Apenas esta coluna")
+    parser.add_argument(
+        "--from-position",
+        action="store_true",
+        help="Recalcula os ranks a partir de Task.position (troca de modo)",
+    )
+    args = parser.parse_args()
+    get_async_engine()
+    asyncio.run(rebalance_all(from_position=args.from_position, column_id=args.column))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,189 @@
+"""
+Busca textual de tarefas (GET /api/tasks/search)
+
+No PostgreSQL a busca usa a coluna gerada `tasks.search_vector` (ver
+app/models/task.py) e o índice GIN: os termos viram um tsquery `a & b`, os
+resultados são ordenados por ts_rank e os trechos destacados (ts_headline) são
+calculados apenas para as linhas da página. A paginação é por cursor sobre
+(rank, id).
+
+Os termos casam por palavra inteira, não por prefixo (`term:*`): para prefixos
+o PostgreSQL não estima quantas linhas casam e, com termos comuns, escolhe
+planos que percorrem o índice GIN uma vez por coluna do escopo (segundos em
+um corpus de 1M de tarefas, ver benchmarks/search.py). Com palavras inteiras
+as estatísticas do tsvector acertam a estimativa: termos raros usam o índice
+e termos comuns varrem apenas as tarefas do escopo.
+
+Em outros bancos (SQLite nos testes) a busca roda em memória sobre as tarefas
+do escopo, com a mesma semântica de termos e de paginação; a pontuação é uma
+aproximação (acertos no título valem mais que na descrição).
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+from sqlalchemy import Select, and_, func, literal_column, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.board import Board
+from app.models.column import Column
+from app.models.project import Project
+from app.models.task import TASK_SEARCH_CONFIG, Task
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+HEADLINE_OPTIONS = (
+    f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, "
+    'MaxWords=30, MinWords=10, MaxFragments=2, FragmentDelimiter=" … "'
+)
+# Máximo de termos considerados em uma busca
+MAX_SEARCH_TERMS = 8
+# Palavras de contexto no trecho da busca em memória
+SNIPPET_WORDS = 30
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass
+class TaskSearchHit:
+    task: Task
+    rank: float
+    title_highlight: str
+    snippet: Optional[str]
+
+
+def search_terms(q: str) -> List[str]:
+    """Termos da busca: palavras em minúsculas, sem repetição e sem operadores"""
+    terms: List[str] = []
+    for word in _WORD.findall(q.lower()):
+        if word not in terms:
+            terms.append(word)
+    return terms[:MAX_SEARCH_TERMS]
+
+
+def _scoped(query: Select, owner_id: UUID, project_id, board_id) -> Select:
+    """Restringe às tarefas de um projeto/board do usuário"""
+    query = (
+        query.join(Column, Column.id == Task.column_id)
+        .join(Board, Board.id == Column.board_id)
+        .join(Project, Project.id == Board.project_id)
+        .where(Project.owner_id == owner_id)
+    )
+    if project_id is not None:
+        query = query.where(Board.project_id == project_id)
+    if board_id is not None:
+        query = query.where(Column.board_id == board_id)
+    return query
+
+
+async def search_tasks(
+    db: AsyncSession,
+    owner_id: UUID,
+    terms: Sequence[str],
+    project_id: Optional[UUID] = None,
+    board_id: Optional[UUID] = None,
+    after: Optional[Tuple[float, UUID]] = None,
+    limit: int = 20,
+) -> List[TaskSearchHit]:
+    """
+    Tarefas que contêm todos os termos, da mais relevante para a menos
+    """
+    if not terms:
+        return []
+    if db.get_bind().dialect.name == "postgresql":
+        return await _search_postgresql(db, owner_id, terms, project_id, board_id, after, limit)
+    return await _search_in_memory(db, owner_id, terms, project_id, board_id, after, limit)
+
+
+async def _search_postgresql(db, owner_id, terms, project_id, board_id, after, limit):
+    search_vector = literal_column("tasks.search_vector")
+    tsquery = func.to_tsquery(TASK_SEARCH_CONFIG, " & ".join(terms))
+    rank = func.ts_rank(search_vector, tsquery)
+
+    page = _scoped(select(Task.id, rank.label("rank")), owner_id, project_id, board_id).where(
+        search_vector.op("@@")(tsquery)
+    )
+    if after is not None:
+        after_rank, after_id = after
+        page = page.where(or_(rank < after_rank, and_(rank == after_rank, Task.id > after_id)))
+    page = page.order_by(rank.desc(), Task.id).limit(limit).subquery()
+
+    result = await db.execute(
+        select(
+            Task,
+            page.c.rank,
+            func.ts_headline(TASK_SEARCH_CONFIG, Task.title, tsquery, HEADLINE_OPTIONS),
+            func.ts_headline(
+                TASK_SEARCH_CONFIG, func.coalesce(Task.description, ""), tsquery, HEADLINE_OPTIONS
+            ),
+        )
+        .join(page, page.c.id == Task.id)
+        .order_by(page.c.rank.desc(), Task.id)
+    )
+    return [
+        TaskSearchHit(task=task, rank=task_rank, title_highlight=title, snippet=snippet or None)
+        for task, task_rank, title, snippet in result.all()
+    ]
+
+
+def _matches(word: str, terms: Sequence[str]) -> bool:
+    return word.lower() in terms
+
+
+def _highlight(text: str, terms: Sequence[str]) -> str:
+    return _WORD.sub(
+        lambda match: (
+            f"{HIGHLIGHT_START}{match.group(0)}{HIGHLIGHT_STOP}"
+            if _matches(match.group(0), terms)
+            else match.group(0)
+        ),
+        text,
+    )
+
+
+def _snippet(text: str, terms: Sequence[str]) -> str:
+    """Janela de SNIPPET_WORDS palavras a partir do primeiro acerto"""
+    words = text.split()
+    first = next(
+        (
+            index
+            for index, word in enumerate(words)
+            if any(_matches(part, terms) for part in _WORD.findall(word))
+        ),
+        0,
+    )
+    start = max(0, first - SNIPPET_WORDS // 3)
+    return _highlight(" ".join(words[start : start + SNIPPET_WORDS]), terms)
+
+
+async def _search_in_memory(db, owner_id, terms, project_id, board_id, after, limit):
+    result = await db.execute(_scoped(select(Task), owner_id, project_id, board_id))
+
+    hits = []
+    for task in result.scalars():
+        title_words = [word.lower() for word in _WORD.findall(task.title)]
+        description_words = [word.lower() for word in _WORD.findall(task.description or "")]
+        score = 0.0
+        for term in terms:
+            title_hits = title_words.count(term)
+            description_hits = description_words.count(term)
+            if not title_hits and not description_hits:
+                break
+            score += title_hits + 0.4 * description_hits
+        else:
+            hits.append((round(score, 6), task))
+
+    hits.sort(key=lambda hit: (-hit[0], hit[1].id))
+    if after is not None:
+        after_rank, after_id = after
+        hits = [hit for hit in hits if (-hit[0], hit[1].id) > (-after_rank, after_id)]
+
+    return [
+        TaskSearchHit(
+            task=task,
+            rank=score,
+            title_highlight=_highlight(task.title, terms),
+            snippet=_snippet(task.description, terms) if task.description else None,
+        )
+        for score, task in hits[:limit]
+    ]
@@ -0,0 +1,84 @@
+"""
+Associação tarefas x tags (tabela task_tags)
+
+- tasks_with_tags: subquery de tarefas com alguma (any) ou todas (all) as tags,
+  resolvida pelo índice (tag_id, task_id); usada no filtro de list_tasks
+- tag_tasks / untag_tasks: POST /api/tasks/batch-tag, um único INSERT ... SELECT
+  (ON CONFLICT DO NOTHING) ou DELETE para todos os pares (tarefa, tag). Uma tag
+  só é aplicada a tarefas de boards do mesmo projeto da tag
+"""
+
+from typing import Dict, List, Literal, Sequence, Set
+from uuid import UUID
+from sqlalchemy import Select, delete, distinct, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.board import Board
+from app.models.column import Column
+from app.models.tag import Tag, TaskTag
+from app.models.task import Task
+
+_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def tasks_with_tags(tag_ids: Sequence[UUID], match: Literal["any", "all"] = "any") -> Select:
+    """IDs das tarefas com qualquer uma (any) ou todas (all) as tags"""
+    query = select(TaskTag.task_id).where(TaskTag.tag_id.in_(tag_ids))
+    if match == "all":
+        query = query.group_by(TaskTag.task_id).having(
+            func.count(distinct(TaskTag.tag_id)) == len(set(tag_ids))
+        )
+    return query
+
+
+def _by_task(pairs) -> Dict[UUID, List[UUID]]:
+    changed: Dict[UUID, List[UUID]] = {}
+    for task_id, tag_id in pairs:
+        changed.setdefault(task_id, []).append(tag_id)
+    return changed
+
+
+async def tag_tasks(
+    db: AsyncSession, task_ids: Sequence[UUID], tag_ids: Sequence[UUID]
+) -> Dict[UUID, List[UUID]]:
+    """
+    Associa as tags às tarefas sem fazer commit; devolve {tarefa: tags novas}
+
+    Pares que já existem são ignorados, assim como tarefas de outro projeto.
+    """
+    pairs = (
+        select(Task.id, Tag.id)
+        .join(Column, Column.id == Task.column_id)
+        .join(Board, Board.id == Column.board_id)
+        .join(Tag, Tag.project_id == Board.project_id)
+        .where(Task.id.in_(task_ids), Tag.id.in_(tag_ids))
+    )
+    insert = _INSERTS[db.get_bind().dialect.name]
+    result = await db.execute(
+        insert(TaskTag)
+        .from_select(["task_id", "tag_id"], pairs)
+        .on_conflict_do_nothing()
+        .returning(TaskTag.task_id, TaskTag.tag_id)
+    )
+    return _by_task(result.all())
+
+
+async def untag_tasks(
+    db: AsyncSession, task_ids: Sequence[UUID], tag_ids: Sequence[UUID]
+) -> Dict[UUID, List[UUID]]:
+    """Remove as tags das tarefas sem fazer commit; devolve {tarefa: tags removidas}"""
+    result = await db.execute(
+        delete(TaskTag)
+        .where(TaskTag.task_id.in_(task_ids), TaskTag.tag_id.in_(tag_ids))
+        .returning(TaskTag.task_id, TaskTag.tag_id)
+        .execution_options(synchronize_session=False)
+    )
+    return _by_task(result.all())
+
+
+async def task_columns(db: AsyncSession, task_ids: Set[UUID]) -> Dict[UUID, UUID]:
+    """Coluna de cada tarefa (board_id/project_id das atividades)"""
+    if not task_ids:
+        return {}
+    result = await db.execute(select(Task.id, Task.column_id).where(Task.id.in_(task_ids)))
+    return dict(result.all())
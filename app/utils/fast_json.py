@@ -0,0 +1,68 @@
+"""
+Caminho rápido de serialização das listagens grandes (orjson)
+
+Validar cada objeto ORM no schema de resposta (Pydantic, um a um) e depois
+codificar com o módulo json custava mais que a query nas colunas com centenas
+de tarefas. Aqui a rota seleciona só as colunas do schema, como tuplas, e
+devolve as linhas codificadas diretamente pelo orjson:
+
+    rows = (await db.execute(select(*response_columns(Task, TaskResponse)))).all()
+    return fast_json_response(rows_payload(rows, TaskResponse), response)
+
+O corpo é o mesmo do response_model (que continua documentando a rota no
+OpenAPI): campos na ordem do schema, UUIDs como string, enums pelo valor e
+datetimes em ISO 8601. Só vale para schemas em que cada campo é uma coluna do
+model, sem validadores nem campos calculados.
+"""
+
+from typing import Any, Iterable, List, Optional, Sequence, Type
+from uuid import UUID
+import orjson
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+def _default(value: Any) -> Any:
+    # O asyncpg devolve asyncpg.pgproto.UUID, subclasse de UUID que o orjson não codifica
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def json_dumps(content: Any) -> bytes:
+    """JSON compacto em UTF-8 (mesma saída do JSONResponse) com UUIDs, datetimes e enums"""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(ORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
+
+
+def response_columns(
+    model: Type, schema: Type[BaseModel], *extra: InstrumentedAttribute
+) -> List[InstrumentedAttribute]:
+    """
+    Colunas do model com os campos do schema, na ordem do schema, seguidas das
+    `extra` que não fazem parte dele (ex.: a chave de ordenação do cursor)
+    """
+    columns = [getattr(model, name) for name in schema.model_fields]
+    return columns + [column for column in extra if column.key not in schema.model_fields]
+
+
+def rows_payload(rows: Iterable[Sequence[Any]], schema: Type[BaseModel]) -> List[dict]:
+    """Linhas de response_columns() como dicts do schema (colunas extras ficam de fora)"""
+    fields = tuple(schema.model_fields)
+    return [dict(zip(fields, row)) for row in rows]
+
+
+def fast_json_response(content: Any, response: Optional[Response] = None) -> FastJSONResponse:
+    """
+    Resposta codificada pelo orjson, sem passar pelo response_model
+
+    Uma Response devolvida pela rota substitui a injetada nos parâmetros: os
+    headers gravados nela (ex.: X-Next-Cursor) são copiados para a resposta.
+    """
+    return FastJSONResponse(content, headers=response.headers if response is not None else None)
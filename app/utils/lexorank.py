@@ -0,0 +1,82 @@
+"""
+Ranks lexicográficos (estilo LexoRank) para ordenação de tarefas
+
+Um rank é uma string em base 36 ("0-9a-z") interpretada como a parte
+fracionária de um número: "i" = 0.5, "9" = 0.25... Ranks nunca terminam em
+"0", então a ordem alfabética das strings coincide com a ordem numérica e
+sempre existe um rank entre dois ranks distintos: mover uma tarefa só exige
+regravar a própria linha.
+"""
+
+from typing import List, Optional
+
+ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+BASE = len(ALPHABET)
+
+# Inserções no início/fim da coluna avançam um passo fixo nos primeiros
+# RANK_WIDTH dígitos, em vez de dividir o intervalo ao meio
+RANK_WIDTH = 10
+RANK_STEP = BASE**3
+
+_DIGITS = {char: index for index, char in enumerate(ALPHABET)}
+
+
+def _to_int(rank: str) -> int:
+    return int(rank[:RANK_WIDTH].ljust(RANK_WIDTH, "0"), BASE)
+
+
+def _from_int(value: int) -> str:
+    digits = ""
+    while value:
+        value, remainder = divmod(value, BASE)
+        digits = ALPHABET[remainder] + digits
+    return digits.zfill(RANK_WIDTH).rstrip("0")
+
+
+def _midpoint(before: str, after: Optional[str]) -> str:
+    prefix = ""
+    upper_bounded = after is not None
+    index = 0
+
+    while True:
+        low = _DIGITS[before[index]] if index < len(before) else 0
+        high = _DIGITS[after[index]] if upper_bounded and index < len(after) else BASE
+
+        if high - low > 1:
+            # O dígito do meio nunca é "0", preservando a forma canônica
+            return prefix + ALPHABET[(low + high) // 2]
+
+        prefix += ALPHABET[low]
+        if high - low == 1:
+            # O prefixo já é menor que `after`: daqui em diante só há limite inferior
+            upper_bounded = False
+        index += 1
+
+
+def rank_between(before: Optional[str], after: Optional[str]) -> str:
+    """
+    Retorna um rank estritamente entre `before` e `after`
+
+    None significa "sem vizinho" naquele lado (início/fim da coluna).
+    """
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"Invalid rank interval: {before!r} >= {after!r}")
+
+    if before is not None and after is None:
+        value = _to_int(before) + RANK_STEP
+        if value < BASE**RANK_WIDTH:
+            return _from_int(value)
+
+    if before is None and after is not None:
+        value = _to_int(after) - RANK_STEP
+        if value > 0:
+            return _from_int(value)
+
+    return _midpoint(before or "", after)
+
+
+def spaced_ranks(count: int) -> List[str]:
+    """
+    Gera `count` ranks igualmente espaçados por RANK_STEP (usado no rebalanceamento)
+    """
+    return [_from_int((index + 1) * RANK_STEP) for index in range(count)]
@@ -0,0 +1,80 @@
+"""
+Paginação por cursor (keyset)
+
+O cursor é opaco para o cliente: base64 dos valores da chave de ordenação da
+última linha da página. A próxima página filtra `(chave) > (cursor)` em vez de
+usar OFFSET, então o custo de cada página não depende da profundidade.
+O cursor da próxima página é devolvido no header X-Next-Cursor, mantendo o
+corpo das respostas de lista inalterado para clientes antigos.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence
+from uuid import UUID
+from fastapi import HTTPException, Response, status
+from sqlalchemy import tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Tamanho máximo de página das rotas de listagem
+MAX_PAGE_SIZE = 500
+
+
+def _serialize(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Codifica os valores da chave de ordenação em um cursor opaco"""
+    payload = json.dumps([_serialize(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[Callable[[Any], Any]]) -> List[Any]:
+    """
+    Decodifica um cursor, convertendo cada valor com o tipo correspondente
+
+    Ex.: decode_cursor(cursor, (int, UUID)) para a chave (position, id)
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("cursor length mismatch")
+        return [convert(value) for convert, value in zip(types, values)]
+    # Cursores adulterados: UUID(5) levanta AttributeError, não ValueError
+    except (ValueError, TypeError, AttributeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def keyset_after(columns: Sequence[Any], values: Sequence[Any]):
+    """Condição `(col1, col2, ...) > (v1, v2, ...)` para a próxima página"""
+    return tuple_(*columns) > tuple_(*values)
+
+
+def keyset_before(columns: Sequence[Any], values: Sequence[Any]):
+    """Condição `(col1, col2, ...) < (v1, v2, ...)` para listagens em ordem decrescente"""
+    return tuple_(*columns) < tuple_(*values)
+
+
+def set_next_cursor(
+    response: Response, rows: Sequence[Any], limit: int, key: Callable[[Any], Sequence[Any]]
+) -> Optional[str]:
+    """
+    Grava o header X-Next-Cursor quando a página veio cheia (pode haver mais linhas)
+    """
+    if not rows or len(rows) < limit:
+        return None
+    cursor = encode_cursor(key(rows[-1]))
+    response.headers[NEXT_CURSOR_HEADER] = cursor
+    return cursor
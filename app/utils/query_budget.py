@@ -0,0 +1,76 @@
+"""
+Orçamento de queries por rota e detecção de N+1
+
+Cada rota pode declarar quantas queries SQL uma requisição pode executar:
+
+    @router.get("/{board_id}", response_model=BoardResponse)
+    @query_budget(3)
+    async def get_board(...):
+
+Com QUERY_BUDGET_MODE=warn ou raise o QueryBudgetMiddleware grava os SQL da
+requisição (na RequestStats de app.core.metrics) e, ao final, confere o
+orçamento da rota e procura o mesmo SQL executado QUERY_REPEAT_THRESHOLD vezes
+ou mais, mudando só os parâmetros: o padrão de N+1 de relacionamentos lazy
+carregados um a um (ex.: Column.tasks de cada coluna ao serializar a resposta).
+Em `raise` a violação vira QueryBudgetExceeded e o teste falha: tests/conftest.py
+força esse modo em toda a suíte (ver tests/test_query_budget.py).
+"""
+
+import re
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Sequence, TypeVar
+
+Endpoint = TypeVar("Endpoint", bound=Callable)
+
+# Atributo do endpoint com o orçamento declarado
+BUDGET_ATTRIBUTE = "__query_budget__"
+
+_PLACEHOLDER = re.compile(r"\$\d+(?:::[\w\[\]]+)?|%\(\w+\)s|\?|'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\((?:\s*\?\s*,)+\s*\?\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Requisição acima do orçamento de queries da rota ou com padrão N+1"""
+
+
+def query_budget(max_queries: int) -> Callable[[Endpoint], Endpoint]:
+    """Declara o máximo de queries SQL por requisição do endpoint decorado"""
+
+    def decorate(endpoint: Endpoint) -> Endpoint:
+        setattr(endpoint, BUDGET_ATTRIBUTE, max_queries)
+        return endpoint
+
+    return decorate
+
+
+def budget_for(endpoint: Optional[Callable]) -> Optional[int]:
+    return getattr(endpoint, BUDGET_ATTRIBUTE, None)
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    SQL sem os valores: parâmetros e literais viram "?" e listas de IN com
+    qualquer tamanho viram "(?)"
+    """
+    normalized = _PLACEHOLDER.sub("?", statement)
+    normalized = _VALUE_LIST.sub("(?)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def repeated_statements(statements: Sequence[str], threshold: int) -> Dict[str, int]:
+    """SQL normalizados executados `threshold` vezes ou mais (candidatos a N+1)"""
+    counts = Counter(normalize_statement(statement) for statement in statements)
+    return {statement: count for statement, count in counts.items() if count >= threshold}
+
+
+def budget_violations(
+    statements: List[str], budget: Optional[int], repeat_threshold: int
+) -> List[str]:
+    """Mensagens de violação da requisição (lista vazia se está dentro do orçamento)"""
+    violations = []
+    if budget is not None and len(statements) > budget:
+        violations.append(f"{len(statements)} queries, budget is {budget}")
+    for statement, count in repeated_statements(statements, repeat_threshold).items():
+        violations.append(f"possible N+1, {count}x: {statement[:200]}")
+    return violations
@@ -0,0 +1,106 @@
+"""
+Benchmark do log de atividades: INSERT síncrono por evento x writer em lotes
+
+Mede, para N eventos emitidos por C "requisições" concorrentes:
+
+- sync:     cada evento é gravado na hora (sessão + INSERT + COMMIT), como
+            seria feito dentro da rota
+- buffered: ActivityWriter (fila + INSERT de várias linhas em background);
+            o tempo no caminho da requisição é só o do emit, e o total inclui
+            o flush até o último evento estar no banco
+
+Usa o banco de DATABASE_URL e grava linhas COMMENT_ADDED de um usuário
+existente (crie um com /api/auth/register antes).
+
+    python -m benchmarks.activity --events 5000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Dict, List
+
+from sqlalchemy import insert, select
+
+from app.core.database import AsyncSessionLocal, dispose_engines, get_async_engine
+from app.models.activity_log import ActivityAction, ActivityLog
+from app.models.user import User
+from app.services.activity import ActivityWriter, activity_row
+
+
+async def insert_one(row: Dict) -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(ActivityLog).values(row))
+        await db.commit()
+
+
+async def run_mode(mode: str, user_id, events: int, concurrency: int, batch_size: int) -> Dict:
+    writer = ActivityWriter(batch_size=batch_size, flush_interval=0.05, queue_size=events)
+    latencies: List[float] = []
+    per_worker = events // concurrency
+
+    async def worker() -> None:
+        for _ in range(per_worker):
+            row = activity_row(ActivityAction.COMMENT_ADDED, user_id, meta={"bench": mode})
+            started = time.perf_counter()
+            if mode == "sync":
+                await insert_one(row)
+            else:
+                await writer.emit(row)
+            latencies.append(time.perf_counter() - started)
+            await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    if mode == "buffered":
+        await writer.close()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "mode": mode,
+        "events": len(latencies),
+        "events_per_second": round(len(latencies) / elapsed),
+        "request_p50_us": round(statistics.median(latencies) * 1e6, 1),
+        "request_p99_us": round(latencies[int(len(latencies) * 0.99) - 1] * 1e6, 1),
+        "inserts": len(latencies) if mode == "sync" else writer.batches,
+    }
+
+
+async def measure(args: argparse.Namespace) -> List[Dict]:
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        user_id = (await db.execute(select(User.id).limit(1))).scalar_one()
+
+    rows = []
+    for mode in ("sync", "buffered"):
+        rows.append(await run_mode(mode, user_id, args.events, args.concurrency, args.batch_size))
+    await dispose_engines()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--json", dest="json_output", default=None)
+    args = parser.parse_args()
+
+    rows = asyncio.run(measure(args))
+    for row in rows:
+        print(
+            f"{row['mode']:>9}  {row['events_per_second']:>7} events/s  "
+            f"request p50 {row['request_p50_us']:>9} µs  p99 {row['request_p99_us']:>9} µs  "
+            f"inserts {row['inserts']}"
+        )
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as output:
+            json.dump(rows, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Benchmark dos feeds de atividade: board_id desnormalizado x join pelas tarefas
+
+A cada etapa insere --rows-per-task linhas em activity_logs para cada tarefa do
+banco (use o corpus de benchmarks.search, 1M de tarefas) e mede, para uma
+amostra de boards, a latência (p50/p99) da primeira página e de uma página
+profunda (cursor na linha --deep-offset) do feed do board:
+
+- denormalized: filtro por activity_logs.board_id, como em activity_feed_query
+                (índice ix_activity_logs_board_id_created_at)
+- join:         o mesmo feed resolvido pelo join activity_logs -> tasks -> columns,
+                como seria sem as colunas board_id/project_id
+
+Com a coluna desnormalizada a latência não cresce com o tamanho da tabela; o
+join precisa juntar e ordenar todas as atividades do board.
+
+    python -m benchmarks.activity_feed --steps 3 --rows-per-task 1
+    python -m benchmarks.activity_feed --steps 0 --boards 20   # só mede
+"""
+
+import argparse
+import json
+import statistics
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+
+from app.core.config import settings
+
+SEED_ACTIVITY_SQL = """
+    INSERT INTO activity_logs (id, action, description, meta_data, task_id, user_id,
+                               board_id, project_id, created_at, updated_at)
+    SELECT gen_random_uuid(), 'TASK_UPDATED', NULL, '{"bench": true}', task_id, user_id,
+           board_id, project_id, ts, ts
+    FROM (
+        SELECT t.id AS task_id, t.created_by AS user_id, c.board_id, b.project_id,
+               now() - random() * interval '365 days' AS ts
+        FROM tasks AS t
+        JOIN columns AS c ON c.id = t.column_id
+        JOIN boards AS b ON b.id = c.board_id
+        CROSS JOIN generate_series(1, :rows_per_task)
+    ) AS seeded
+"""
+
+FEED_SQL = {
+    "denormalized": """
+        SELECT a.* FROM activity_logs AS a
+        WHERE a.board_id = :board_id {after}
+        ORDER BY a.created_at DESC, a.id DESC
+        LIMIT :limit
+    """,
+    "join": """
+        SELECT a.* FROM activity_logs AS a
+        JOIN tasks AS t ON t.id = a.task_id
+        JOIN columns AS c ON c.id = t.column_id
+        WHERE c.board_id = :board_id {after}
+        ORDER BY a.created_at DESC, a.id DESC
+        LIMIT :limit
+    """,
+}
+
+AFTER_SQL = "AND (a.created_at, a.id) < (:after_created_at, :after_id)"
+
+CURSOR_SQL = """
+    SELECT created_at, id FROM activity_logs
+    WHERE board_id = :board_id
+    ORDER BY created_at DESC, id DESC
+    OFFSET :offset LIMIT 1
+"""
+
+
+def sample_boards(connection: Connection, boards: int) -> List[str]:
+    """Boards com atividades, sorteados"""
+    return [
+        str(board_id)
+        for board_id in connection.execute(
+            text(
+                "SELECT id FROM boards WHERE id IN "
+                "(SELECT DISTINCT board_id FROM columns) ORDER BY random() LIMIT :boards"
+            ),
+            {"boards": boards},
+        ).scalars()
+    ]
+
+
+def timed(connection: Connection, sql: str, params: Dict) -> float:
+    started = time.perf_counter()
+    connection.execute(text(sql), params).all()
+    return (time.perf_counter() - started) * 1000
+
+
+def percentiles(timings: List[float]) -> Dict[str, Optional[float]]:
+    # Sem medições: nenhum board da amostra tem --deep-offset atividades ainda
+    if not timings:
+        return {"p50_ms": None, "p99_ms": None}
+    timings = sorted(timings)
+    return {
+        "p50_ms": round(statistics.median(timings), 3),
+        "p99_ms": round(timings[max(0, int(len(timings) * 0.99) - 1)], 3),
+    }
+
+
+def fmt(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.3f}"
+
+
+def measure(connection: Connection, boards: List[str], args: argparse.Namespace) -> Dict:
+    rows = connection.execute(text("SELECT count(*) FROM activity_logs")).scalar_one()
+    result: Dict = {"activity_rows": rows}
+
+    cursors = {}
+    for board_id in boards:
+        cursors[board_id] = connection.execute(
+            text(CURSOR_SQL), {"board_id": board_id, "offset": args.deep_offset}
+        ).one_or_none()
+
+    for strategy, sql in FEED_SQL.items():
+        first: List[float] = []
+        deep: List[float] = []
+        for _ in range(args.repeat):
+            for board_id in boards:
+                params = {"board_id": board_id, "limit": args.limit}
+                first.append(timed(connection, sql.format(after=""), params))
+                cursor = cursors[board_id]
+                if cursor is not None:
+                    params.update(after_created_at=cursor.created_at, after_id=cursor.id)
+                    deep.append(timed(connection, sql.format(after=AFTER_SQL), params))
+        result[strategy] = {"first_page": percentiles(first), "deep_page": percentiles(deep)}
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--steps", type=int, default=3, help="Etapas de crescimento da tabela")
+    parser.add_argument("--rows-per-task", type=int, default=1)
+    parser.add_argument("--boards", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--deep-offset", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--cleanup", action="store_true", help="Remove as linhas do benchmark ao final"
+    )
+    parser.add_argument("--json", dest="json_output", default=None)
+    args = parser.parse_args()
+
+    engine = create_engine(settings.DATABASE_URL)
+    results = []
+    with engine.connect() as connection:
+        boards = sample_boards(connection, args.boards)
+        for step in range(args.steps + 1):
+            if step:
+                connection.execute(text(SEED_ACTIVITY_SQL), {"rows_per_task": args.rows_per_task})
+                connection.execute(text("ANALYZE activity_logs"))
+                connection.commit()
+            row = measure(connection, boards, args)
+            connection.commit()
+            results.append(row)
+            print(f"activity_logs: {row['activity_rows']} rows")
+            for strategy in FEED_SQL:
+                first, deep = row[strategy]["first_page"], row[strategy]["deep_page"]
+                print(
+                    f"  {strategy:<12} first p50 {fmt(first['p50_ms']):>9} ms  "
+                    f"p99 {fmt(first['p99_ms']):>9} ms  deep p50 {fmt(deep['p50_ms']):>9} ms  "
+                    f"p99 {fmt(deep['p99_ms']):>9} ms"
+                )
+
+        if args.cleanup:
+            connection.execute(
+                text("DELETE FROM activity_logs WHERE meta_data = :meta"),
+                {"meta": '{"bench": true}'},
+            )
+            connection.commit()
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
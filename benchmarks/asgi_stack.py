@@ -0,0 +1,162 @@
+"""
+Benchmark do custo da pilha de middlewares por requisição (/health e listagem de tarefas)
+
+Executa as rotas reais da aplicação, em processo, com pilhas diferentes:
+
+- bare:         sem middlewares (piso)
+- decorator:    pilha antiga (CORS + remove_trailing_slash_redirect) e timing/
+                request-id escritos com @app.middleware("http") (BaseHTTPMiddleware)
+- asgi:         pilha atual de app.main (CORS, barra final, GZip, timing e
+                request-id como middlewares ASGI puros)
+
+A listagem de tarefas usa o banco configurado em DATABASE_URL.
+
+    python -m benchmarks.asgi_stack --requests 3000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from typing import Dict, List, Tuple
+
+import httpx
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from app.core.config import settings
+from app.main import app
+from benchmarks.middleware import call
+
+
+def build_bare() -> FastAPI:
+    bare = FastAPI()
+    bare.router.routes.extend(app.router.routes)
+    return bare
+
+
+def build_decorator() -> FastAPI:
+    legacy = build_bare()
+
+    @legacy.middleware("http")
+    async def remove_trailing_slash_redirect(request, call_next):
+        response = await call_next(request)
+        if response.status_code == 307:
+            return await call_next(request)
+        return response
+
+    @legacy.middleware("http")
+    async def timing(request, call_next):
+        started = time.perf_counter()
+        response = await call_next(request)
+        response.headers["Server-Timing"] = f"app;dur={(time.perf_counter() - started) * 1000:.1f}"
+        return response
+
+    @legacy.middleware("http")
+    async def request_id(request, call_next):
+        value = request.headers.get("x-request-id") or uuid.uuid4().hex
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = value
+        return response
+
+    legacy.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["*"],
+    )
+    return legacy
+
+
+async def prepare() -> Tuple[List[Tuple[bytes, bytes]], bytes]:
+    """Cria usuário, board e tarefas; retorna headers de auth e a query da listagem"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        username = f"bench_{uuid.uuid4().hex[:10]}"
+        credentials = {"username": username, "password": "bench-password"}
+        await client.post(
+            "/api/auth/register", json={**credentials, "email": f"{username}@example.com"}
+        )
+        token = (await client.post("/api/auth/login", json=credentials)).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        project = (
+            await client.post("/api/projects", json={"name": "asgi"}, headers=headers)
+        ).json()
+        board = (
+            await client.post(
+                "/api/boards", json={"name": "asgi", "project_id": project["id"]}, headers=headers
+            )
+        ).json()
+        column = (
+            await client.post(
+                "/api/columns",
+                json={"title": "todo", "position": 0, "board_id": board["id"]},
+                headers=headers,
+            )
+        ).json()
+        operations = [
+            {"op": "create", "title": f"task {index}", "column_id": column["id"]}
+            for index in range(20)
+        ]
+        await client.post("/api/tasks/batch", json={"operations": operations}, headers=headers)
+
+    auth = [(b"authorization", f"Bearer {token}".encode())]
+    return auth, f"column_id={column['id']}".encode()
+
+
+async def measure(stacks: Dict[str, FastAPI], requests: int) -> List[Dict]:
+    auth, task_query = await prepare()
+    endpoints = [
+        ("/health", [], b""),
+        ("/api/tasks", auth, task_query),
+    ]
+
+    rows = []
+    for path, headers, query in endpoints:
+        timings = {}
+        for name, stack in stacks.items():
+            for _ in range(50):  # aquecimento
+                await call(stack, "GET", path, headers=headers, query_string=query)
+            started = time.perf_counter()
+            for _ in range(requests):
+                status = await call(stack, "GET", path, headers=headers, query_string=query)
+            timings[name] = (time.perf_counter() - started) / requests * 1e6
+            assert status == 200, (name, path, status)
+
+        for name, us in timings.items():
+            rows.append(
+                {
+                    "endpoint": path,
+                    "stack": name,
+                    "us_per_request": round(us, 1),
+                    "overhead_us": round(us - timings["bare"], 1),
+                }
+            )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--json", dest="json_output", default=None)
+    args = parser.parse_args()
+
+    stacks = {"bare": build_bare(), "decorator": build_decorator(), "asgi": app}
+    rows = asyncio.run(measure(stacks, args.requests))
+    for row in rows:
+        print(
+            f"{row['endpoint']:<12} {row['stack']:>10}  {row['us_per_request']:>9} µs  "
+            f"overhead {row['overhead_us']:>8} µs"
+        )
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as output:
+            json.dump(rows, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark de operações em lote: N chamadas individuais x um POST /api/tasks/batch
+
+Cria `--tasks` tarefas e depois move todas para outra coluna, primeiro com
+uma requisição por tarefa (POST /api/tasks/ e PATCH /{id}/move) e depois com
+uma única requisição em lote, imprimindo o tempo total de cada abordagem.
+
+    python -m benchmarks.batch --url http://localhost:8000 --tasks 200
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict, List
+
+import httpx
+
+from benchmarks.load import obtain_token
+
+
+async def create_columns(client: httpx.AsyncClient, headers: Dict[str, str]) -> Dict:
+    project = await client.post("/api/projects/", json={"name": "batch bench"}, headers=headers)
+    project.raise_for_status()
+    board = await client.post(
+        "/api/boards/",
+        json={"name": "batch bench", "project_id": project.json()["id"]},
+        headers=headers,
+    )
+    board.raise_for_status()
+    columns = []
+    for position in range(2):
+        column = await client.post(
+            "/api/columns/",
+            json={"title": f"col {position}", "position": position, "board_id": board.json()["id"]},
+            headers=headers,
+        )
+        column.raise_for_status()
+        columns.append(column.json()["id"])
+    return {"project_id": project.json()["id"], "columns": columns}
+
+
+async def single_calls(
+    client: httpx.AsyncClient, headers: Dict[str, str], columns: List[str], count: int
+) -> Dict[str, float]:
+    started = time.perf_counter()
+    task_ids = []
+    for index in range(count):
+        response = await client.post(
+            "/api/tasks/",
+            json={"title": f"single {index}", "column_id": columns[0]},
+            headers=headers,
+        )
+        response.raise_for_status()
+        task_ids.append(response.json()["id"])
+    created = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for task_id in task_ids:
+        response = await client.patch(
+            f"/api/tasks/{task_id}/move",
+            json={"column_id": columns[1], "position": 0},
+            headers=headers,
+        )
+        response.raise_for_status()
+    moved = time.perf_counter() - started
+    return {"create_s": created, "move_s": moved}
+
+
+async def batch_calls(
+    client: httpx.AsyncClient, headers: Dict[str, str], columns: List[str], count: int
+) -> Dict[str, float]:
+    operations = [
+        {"op": "create", "title": f"batch {index}", "column_id": columns[0]}
+        for index in range(count)
+    ]
+    started = time.perf_counter()
+    response = await client.post(
+        "/api/tasks/batch", json={"operations": operations}, headers=headers
+    )
+    response.raise_for_status()
+    created = time.perf_counter() - started
+    task_ids = [item["task"]["id"] for item in response.json()["results"]]
+
+    operations = [
+        {"op": "move", "task_id": task_id, "column_id": columns[1], "position": 0}
+        for task_id in task_ids
+    ]
+    started = time.perf_counter()
+    response = await client.post(
+        "/api/tasks/batch", json={"operations": operations}, headers=headers
+    )
+    response.raise_for_status()
+    moved = time.perf_counter() - started
+    return {"create_s": created, "move_s": moved}
+
+
+async def run(args: argparse.Namespace) -> Dict:
+    async with httpx.AsyncClient(base_url=args.url, timeout=120.0) as client:
+        token = await obtain_token(client)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        single_ids = await create_columns(client, headers)
+        single = await single_calls(client, headers, single_ids["columns"], args.tasks)
+        batch_ids = await create_columns(client, headers)
+        batch = await batch_calls(client, headers, batch_ids["columns"], args.tasks)
+
+        for ids in (single_ids, batch_ids):
+            await client.delete(f"/api/projects/{ids['project_id']}", headers=headers)
+
+    result = {"tasks": args.tasks}
+    for name in ("create_s", "move_s"):
+        result[f"single_{name}"] = round(single[name], 3)
+        result[f"batch_{name}"] = round(batch[name], 3)
+        result[f"speedup_{name[:-2]}"] = round(single[name] / batch[name], 1)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--json", dest="json_output", default=None)
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    print(json.dumps(result, indent=2))
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as output:
+            json.dump(result, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark de cold start: tempo de import de app.main e tempo até a primeira requisição
+
+Para cada alvo (diretório com um checkout da API) mede, em processos novos:
+
+- import: tempo de `import app.main`
+- health: do início do processo uvicorn até o primeiro 200 em /health
+- first_db: até a primeira resposta de GET /api/projects (rota que consulta o banco)
+
+Útil para comparar checkouts, ex. um worktree de um commit antigo com o atual:
+
+    git worktree add /tmp/kanban-old <commit>
+    python -m benchmarks.cold_start --target old=/tmp/kanban-old --target new=. --runs 5
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from typing import Dict, List
+
+import httpx
+
+from app.core.security import create_access_token
+
+IMPORT_SNIPPET = (
+    "import time; started = time.perf_counter(); import app.main; "
+    "print(time.perf_counter() - started)"
+)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def target_env(path: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    env.update(PYTHONPATH=os.path.abspath(path), DEBUG="false", AUTH_MODE="claims")
+    return env
+
+
+def measure_import(path: str) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        cwd=path,
+        env=target_env(path),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def measure_first_requests(path: str, token: str, timeout: float) -> Dict[str, float]:
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=path,
+        env=target_env(path),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(base_url=base_url, timeout=timeout) as client:
+            deadline = started + timeout
+            while True:
+                try:
+                    if client.get("/health").status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                if time.perf_counter() > deadline:
+                    raise TimeoutError(f"{path}: server did not start in {timeout}s")
+                time.sleep(0.01)
+            health = time.perf_counter() - started
+
+            client.get("/api/projects", headers={"Authorization": f"Bearer {token}"})
+            first_db = time.perf_counter() - started
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+    return {"health": health, "first_db": first_db}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target", action="append", default=None, help="label=diretório")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--json", dest="json_output", default=None)
+    args = parser.parse_args()
+
+    # Token aceito em AUTH_MODE=claims sem consultar a tabela users
+    token = create_access_token({"sub": str(uuid.uuid4()), "active": True, "su": False})
+
+    results: List[Dict] = []
+    for target in args.target or ["current=."]:
+        label, _, path = target.partition("=")
+        samples: Dict[str, List[float]] = {"import": [], "health": [], "first_db": []}
+        for _ in range(args.runs):
+            samples["import"].append(measure_import(path))
+            for name, value in measure_first_requests(path, token, args.timeout).items():
+                samples[name].append(value)
+
+        result = {"target": label}
+        for name, values in samples.items():
+            result[f"{name}_median_ms"] = round(statistics.median(values) * 1000, 1)
+            result[f"{name}_max_ms"] = round(max(values) * 1000, 1)
+        results.append(result)
+        print(
+            f"{label:>10}  import {result['import_median_ms']:>8} ms  "
+            f"health {result['health_median_ms']:>8} ms  "
+            f"first_db {result['first_db_median_ms']:>8} ms"
+        )
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
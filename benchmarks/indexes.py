@@ -0,0 +1,215 @@
+"""
+Benchmark de índices: planos e latências das queries das rotas com e sem índices
+
+Popula (opcionalmente) um dataset sintético e roda EXPLAIN ANALYZE das queries
+usadas pelas rotas de listagem. A medição "sem índices" acontece dentro de uma
+transação que faz DROP INDEX e termina em ROLLBACK, então os índices não são
+perdidos, mas as tabelas ficam bloqueadas durante a medição: use apenas em
+bancos de desenvolvimento.
+
+    python -m benchmarks.indexes --seed --projects 20 --tasks-per-column 5000
+    python -m benchmarks.indexes --json bench_indexes.json
+"""
+
+import argparse
+import json
+from typing import Dict, List
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+
+from app.core.config import settings
+
+# Índices criados pela migração 75fb92ced5fa (e o de rank, 9137fe6b5d54)
+INDEXES = [
+    "ix_activity_logs_task_id_created_at",
+    "ix_activity_logs_user_id",
+    "ix_boards_project_id",
+    "ix_columns_board_id_position",
+    "ix_comments_task_id_created_at",
+    "ix_comments_user_id",
+    "ix_projects_owner_id_created_at",
+    "ix_tags_project_id",
+    "ix_tasks_assignee_id",
+    "ix_tasks_column_id_position",
+    "ix_tasks_column_id_rank",
+    "ix_tasks_created_by",
+]
+
+# Queries equivalentes às geradas pelas rotas (parâmetros preenchidos a partir do seed)
+QUERIES = {
+    "list_projects": (
+        "SELECT * FROM projects WHERE owner_id = :owner_id ORDER BY created_at LIMIT 100"
+    ),
+    "list_boards_by_project": "SELECT * FROM boards WHERE project_id = :project_id",
+    "list_columns_by_board": ("SELECT * FROM columns WHERE board_id = :board_id ORDER BY position"),
+    "get_tasks_by_column": (
+        "SELECT * FROM tasks WHERE column_id = :column_id ORDER BY position, id"
+    ),
+    "list_tasks_page": (
+        "SELECT * FROM tasks WHERE column_id = :column_id ORDER BY position, id LIMIT 100"
+    ),
+    "create_task_next_slot": (
+        "SELECT max(position), max(rank) FROM tasks WHERE column_id = :column_id"
+    ),
+    "tasks_by_assignee": "SELECT * FROM tasks WHERE assignee_id = :owner_id LIMIT 100",
+    "comments_by_task": (
+        "SELECT * FROM comments WHERE task_id = :task_id ORDER BY created_at LIMIT 100"
+    ),
+}
+
+
+SEED_SQL = [
+    """
+    INSERT INTO users (id, username, email, password_hash, is_active, is_superuser,
+                       created_at, updated_at)
+    SELECT gen_random_uuid(), 'bench_' || n, 'bench_' || n || '@example.com', 'x', true, false,
+           now(), now()
+    FROM generate_series(1, :users) AS n
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO projects (id, name, owner_id, created_at, updated_at)
+    SELECT gen_random_uuid(), 'Project ' || n, u.id,
+           now() - (n || ' minutes')::interval, now()
+    FROM generate_series(1, :projects) AS n
+    CROSS JOIN LATERAL (
+        SELECT id FROM users WHERE username LIKE 'bench_%'
+        ORDER BY username OFFSET (n % :users) LIMIT 1
+    ) AS u
+    """,
+    """
+    INSERT INTO boards (id, name, project_id, created_at, updated_at)
+    SELECT gen_random_uuid(), 'Board ' || n, p.id, now(), now()
+    FROM projects AS p CROSS JOIN generate_series(1, :boards_per_project) AS n
+    WHERE p.name LIKE 'Project %'
+    """,
+    """
+    INSERT INTO columns (id, title, position, board_id, created_at, updated_at)
+    SELECT gen_random_uuid(), 'Column ' || n, n - 1, b.id, now(), now()
+    FROM boards AS b CROSS JOIN generate_series(1, :columns_per_board) AS n
+    WHERE b.name LIKE 'Board %'
+    """,
+    """
+    INSERT INTO tasks (id, title, description, position, rank, priority, column_id,
+                       assignee_id, created_by, created_at, updated_at)
+    SELECT gen_random_uuid(), 'Task ' || n, repeat('lorem ipsum ', 20), n - 1,
+           rtrim(lpad(to_hex(n), 7, '0'), '0'), 'MEDIUM', c.id, p.owner_id, p.owner_id,
+           now(), now()
+    FROM columns AS c
+    JOIN boards AS b ON b.id = c.board_id
+    JOIN projects AS p ON p.id = b.project_id
+    CROSS JOIN generate_series(1, :tasks_per_column) AS n
+    WHERE c.title LIKE 'Column %'
+    """,
+    "ANALYZE",
+]
+
+
+def seed(connection: Connection, args: argparse.Namespace) -> None:
+    params = {
+        "users": args.users,
+        "projects": args.projects,
+        "boards_per_project": args.boards_per_project,
+        "columns_per_board": args.columns_per_board,
+        "tasks_per_column": args.tasks_per_column,
+    }
+    for statement in SEED_SQL:
+        connection.execute(text(statement), params)
+    connection.commit()
+
+
+def sample_params(connection: Connection) -> Dict[str, str]:
+    """Escolhe ids reais (a partir da tarefa mais recente) para parametrizar as queries"""
+    row = (
+        connection.execute(
+            text(
+                """
+            SELECT t.column_id, c.board_id, b.project_id, p.owner_id, t.id AS task_id
+            FROM tasks AS t
+            JOIN columns AS c ON c.id = t.column_id
+            JOIN boards AS b ON b.id = c.board_id
+            JOIN projects AS p ON p.id = b.project_id
+            ORDER BY t.created_at DESC
+            LIMIT 1
+            """
+            )
+        )
+        .mappings()
+        .one()
+    )
+    return {key: str(value) for key, value in row.items()}
+
+
+def explain(connection: Connection, sql: str, params: Dict[str, str]) -> Dict:
+    plan = connection.execute(
+        text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}"), params
+    ).scalar_one()[0]
+
+    nodes: List[str] = []
+    stack = [plan["Plan"]]
+    while stack:
+        node = stack.pop()
+        label = node["Node Type"]
+        if "Index Name" in node:
+            label += f" using {node['Index Name']}"
+        nodes.append(label)
+        stack.extend(node.get("Plans", []))
+
+    return {"execution_ms": round(plan["Execution Time"], 3), "plan": nodes}
+
+
+def run(connection: Connection, repeat: int) -> Dict[str, Dict]:
+    params = sample_params(connection)
+    results: Dict[str, Dict] = {}
+
+    for name, sql in QUERIES.items():
+        # Primeira execução aquece o cache; mede-se a melhor das demais
+        with_indexes = min(
+            (explain(connection, sql, params) for _ in range(repeat + 1)),
+            key=lambda item: item["execution_ms"],
+        )
+
+        savepoint = connection.begin_nested()
+        for index in INDEXES:
+            connection.execute(text(f"DROP INDEX IF EXISTS {index}"))
+        without_indexes = min(
+            (explain(connection, sql, params) for _ in range(repeat + 1)),
+            key=lambda item: item["execution_ms"],
+        )
+        savepoint.rollback()
+
+        results[name] = {"before": without_indexes, "after": with_indexes}
+        print(
+            f"{name:<24} before {without_indexes['execution_ms']:>10.3f} ms  "
+            f"after {with_indexes['execution_ms']:>10.3f} ms  "
+            f"[{with_indexes['plan'][-1]}]"
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seed", action="store_true", help="Popula o dataset sintético antes")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--boards-per-project", type=int, default=3)
+    parser.add_argument("--columns-per-board", type=int, default=5)
+    parser.add_argument("--tasks-per-column", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", dest="json_output", default=None)
+    args = parser.parse_args()
+
+    engine = create_engine(settings.DATABASE_URL)
+    with engine.connect() as connection:
+        if args.seed:
+            seed(connection, args)
+        results = run(connection, args.repeat)
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
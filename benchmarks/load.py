@@ -0,0 +1,142 @@
+"""
+Benchmark de carga HTTP (requests/s e latências p50/p95/p99)
+
+Dispara requisições concorrentes contra uma ou mais instâncias da API e
+imprime uma linha por alvo, permitindo comparar o caminho antigo (rotas
+síncronas no threadpool) com o novo (rotas async + asyncpg).
+
+Exemplo comparando duas instâncias rodando lado a lado:
+
+    # terminal 1 (commit antigo)   uvicorn app.main:app --port 8001
+    # terminal 2 (commit atual)    uvicorn app.main:app --port 8002
+    python -m benchmarks.load \\
+        --target old=http://localhost:8001 --target new=http://localhost:8002 \\
+        --path /api/projects/ --concurrency 200 --requests 5000
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from typing import Dict, List, Optional
+
+import httpx
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Percentil por interpolação mais próxima (amostras já ordenadas)"""
+    if not samples:
+        return 0.0
+    index = min(len(samples) - 1, max(0, round(pct / 100 * len(samples)) - 1))
+    return samples[index]
+
+
+def summarize(label: str, latencies: List[float], errors: int, elapsed: float) -> Dict:
+    """Consolida latências (em segundos) em métricas legíveis"""
+    ordered = sorted(latencies)
+    return {
+        "target": label,
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 2),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 2),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 2) if ordered else 0.0,
+    }
+
+
+async def obtain_token(client: httpx.AsyncClient) -> str:
+    """Registra um usuário descartável e retorna seu access token"""
+    username = f"bench_{uuid.uuid4().hex[:10]}"
+    password = "bench-password"
+    await client.post(
+        "/api/auth/register",
+        json={"username": username, "email": f"{username}@example.com", "password": password},
+    )
+    response = await client.post(
+        "/api/auth/login", json={"username": username, "password": password}
+    )
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def run_target(
+    label: str,
+    base_url: str,
+    path: str,
+    total: int,
+    concurrency: int,
+    token: Optional[str],
+) -> Dict:
+    """Executa `total` GETs em `path` com `concurrency` workers"""
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        if token is None:
+            token = await obtain_token(client)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        latencies: List[float] = []
+        errors = 0
+        remaining = total
+
+        async def worker():
+            nonlocal remaining, errors
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                try:
+                    response = await client.get(path, headers=headers)
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return summarize(label, latencies, errors, elapsed)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--target",
+        action="append",
+        required=True,
+        help="label=url da instância (pode ser repetido)",
+    )
+    parser.add_argument("--path", default="/api/projects/")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--token", default=None, help="Bearer token (senão cria um usuário)")
+    parser.add_argument("--json", dest="json_output", default=None, help="Arquivo de saída JSON")
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = parse_args()
+    results = []
+    for target in args.target:
+        label, _, url = target.partition("=")
+        result = await run_target(
+            label, url or label, args.path, args.requests, args.concurrency, args.token
+        )
+        results.append(result)
+        print(
+            f"{result['target']:>10}  {result['rps']:>9} req/s  "
+            f"p50 {result['p50_ms']:>8} ms  p95 {result['p95_ms']:>8} ms  "
+            f"p99 {result['p99_ms']:>8} ms  errors {result['errors']}"
+        )
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
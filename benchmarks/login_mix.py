@@ -0,0 +1,118 @@
+"""
+Benchmark de login sob carga mista: vazão de logins x latência das outras rotas
+
+Enquanto `--login-concurrency` clientes fazem login em loop, outros
+`--probe-concurrency` clientes consultam uma rota leve (`--probe-path`).
+Mostra logins/s, logins recusados (503) e p50/p99 da rota leve, para cada alvo:
+
+    # PASSWORD_HASH_WORKERS=0 uvicorn app.main:app --port 8001   (threadpool)
+    # PASSWORD_HASH_WORKERS=2 uvicorn app.main:app --port 8002   (pool de processos)
+    python -m benchmarks.login_mix \\
+        --target threads=http://localhost:8001 --target processes=http://localhost:8002
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from typing import Dict, List
+
+import httpx
+
+from benchmarks.load import percentile
+
+
+async def run_target(label: str, base_url: str, args: argparse.Namespace) -> Dict:
+    limits = httpx.Limits(max_connections=args.login_concurrency + args.probe_concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        username = f"bench_{uuid.uuid4().hex[:10]}"
+        password = "bench-password"
+        await client.post(
+            "/api/auth/register",
+            json={"username": username, "email": f"{username}@example.com", "password": password},
+        )
+        credentials = {"username": username, "password": password}
+        response = await client.post("/api/auth/login", json=credentials)
+        response.raise_for_status()
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        deadline = time.perf_counter() + args.duration
+        login_latencies: List[float] = []
+        probe_latencies: List[float] = []
+        rejected = 0
+        errors = 0
+
+        async def login_worker():
+            nonlocal rejected, errors
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = await client.post("/api/auth/login", json=credentials)
+                if response.status_code == 503:
+                    rejected += 1
+                    await asyncio.sleep(float(response.headers.get("Retry-After", 1)))
+                    continue
+                if response.status_code != 200:
+                    errors += 1
+                    continue
+                login_latencies.append(time.perf_counter() - started)
+
+        async def probe_worker():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = await client.get(args.probe_path, headers=headers)
+                if response.status_code >= 400:
+                    errors += 1
+                probe_latencies.append(time.perf_counter() - started)
+                await asyncio.sleep(args.probe_interval)
+
+        await asyncio.gather(
+            *(login_worker() for _ in range(args.login_concurrency)),
+            *(probe_worker() for _ in range(args.probe_concurrency)),
+        )
+
+    logins = sorted(login_latencies)
+    probes = sorted(probe_latencies)
+    return {
+        "target": label,
+        "logins_per_s": round(len(logins) / args.duration, 2),
+        "login_p50_ms": round(percentile(logins, 50) * 1000, 2),
+        "login_p99_ms": round(percentile(logins, 99) * 1000, 2),
+        "rejected_503": rejected,
+        "errors": errors,
+        "probe_requests": len(probes),
+        "probe_p50_ms": round(percentile(probes, 50) * 1000, 2),
+        "probe_p99_ms": round(percentile(probes, 99) * 1000, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target", action="append", required=True, help="label=url")
+    parser.add_argument("--duration", type=float, default=15.0, help="Segundos por alvo")
+    parser.add_argument("--login-concurrency", type=int, default=50)
+    parser.add_argument("--probe-concurrency", type=int, default=5)
+    parser.add_argument("--probe-interval", type=float, default=0.05)
+    parser.add_argument("--probe-path", default="/api/projects/")
+    parser.add_argument("--json", dest="json_output", default=None)
+    args = parser.parse_args()
+
+    results = []
+    for target in args.target:
+        label, _, url = target.partition("=")
+        result = asyncio.run(run_target(label, url or label, args))
+        results.append(result)
+        print(
+            f"{result['target']:>10}  {result['logins_per_s']:>7} logins/s  "
+            f"login p99 {result['login_p99_ms']:>9} ms  503s {result['rejected_503']:>5}  "
+            f"probe p50 {result['probe_p50_ms']:>8} ms  p99 {result['probe_p99_ms']:>8} ms"
+        )
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
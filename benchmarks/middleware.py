@@ -0,0 +1,143 @@
+"""
+Micro-benchmark do tratamento de barra final: custo por requisição
+
+Compara, em processo (chamadas ASGI diretas, sem rede), uma aplicação mínima:
+
+- none:      sem middleware, redirect_slashes=True (padrão do Starlette: 307)
+- legacy:    o antigo remove_trailing_slash_redirect (BaseHTTPMiddleware que
+             chamava call_next de novo quando a resposta era 307)
+- normalize: TrailingSlashMiddleware + redirect_slashes=False
+
+Para cada caso imprime µs/requisição e status. Um único dispatch por
+requisição, sem 307, é verificado em tests/test_trailing_slash.py.
+
+    python -m benchmarks.middleware --requests 20000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, Request
+
+from app.middleware.trailing_slash import TrailingSlashMiddleware
+
+CASES: List[Tuple[str, str, bytes]] = [
+    ("GET", "/items", b""),
+    ("GET", "/items/", b""),
+    ("POST", "/items/", b'{"name": "x"}'),
+]
+
+
+def build_app(mode: str) -> FastAPI:
+    app = FastAPI(redirect_slashes=mode != "normalize")
+
+    @app.get("/items")
+    async def list_items():
+        return {"ok": True}
+
+    @app.post("/items")
+    async def create_item(request: Request):
+        return await request.json()
+
+    if mode == "legacy":
+
+        @app.middleware("http")
+        async def remove_trailing_slash_redirect(request, call_next):
+            response = await call_next(request)
+            if response.status_code == 307:
+                return await call_next(request)
+            return response
+
+    elif mode == "normalize":
+        app.add_middleware(TrailingSlashMiddleware)
+
+    return app
+
+
+async def call(
+    app,
+    method: str,
+    path: str,
+    body: bytes = b"",
+    headers: Optional[List[Tuple[bytes, bytes]]] = None,
+    query_string: bytes = b"",
+) -> int:
+    """Executa uma requisição HTTP direto na aplicação ASGI e retorna o status"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string,
+        "headers": [(b"host", b"bench"), (b"content-type", b"application/json"), *(headers or [])],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    status = 0
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def measure(mode: str, requests: int) -> List[Dict]:
+    rows = []
+    for method, path, body in CASES:
+        app = build_app(mode)
+        await call(app, method, path, body)  # aquecimento (monta a pilha de middlewares)
+
+        started = time.perf_counter()
+        for _ in range(requests):
+            status = await call(app, method, path, body)
+        elapsed = time.perf_counter() - started
+
+        rows.append(
+            {
+                "mode": mode,
+                "request": f"{method} {path}",
+                "status": status,
+                "us_per_request": round(elapsed / requests * 1e6, 2),
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--json", dest="json_output", default=None)
+    args = parser.parse_args()
+
+    rows = []
+    for mode in ("none", "legacy", "normalize"):
+        rows.extend(asyncio.run(measure(mode, args.requests)))
+    for row in rows:
+        print(
+            f"{row['mode']:>10}  {row['request']:<14} {row['status']}  "
+            f"{row['us_per_request']:>8} µs"
+        )
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as output:
+            json.dump(rows, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+Benchmark das rotas de leitura em colunas grandes: entidades ORM x colunas projetadas
+
+Cria um board temporário com --columns colunas de N tarefas (para cada N de
+--sizes), descrições de --description-bytes, 3 tags por tarefa e metade das
+tarefas com responsável, e compara, em processo (sessão async no banco
+configurado, sem HTTP), os dois caminhos de leitura:
+
+- column_tasks: GET /api/tasks/{column_id}/tasks
+    entities: select(Task) + TaskResponse.model_validate + json.dumps
+    columns:  select(*response_columns(Task, TaskResponse)) + rows_payload + orjson
+- board_full:   GET /api/boards/{board_id}/full
+    entities: Board com selectinload/joinedload de colunas, tarefas, tags e
+              responsável + validação da árvore no Pydantic
+    columns:  app.services.board_snapshot + orjson
+
+Para cada caminho imprime ms e CPU ms por requisição (média de --requests, cada
+uma com sessão nova, como uma requisição) e o pico de memória alocada em uma
+requisição (tracemalloc, medido à parte). O board é removido no final.
+
+    python -m benchmarks.read_paths --sizes 1000 5000 --columns 4
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from typing import Awaitable, Callable, Dict, List
+from uuid import NAMESPACE_URL, uuid5
+
+from pydantic import field_validator
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, dispose_engines, get_async_engine
+from app.models.board import Board
+from app.models.column import Column
+from app.models.tag import TaskTag
+from app.models.task import Task, task_ordering
+from app.routes.boards import BoardColumnSnapshot, BoardFullResponse, BoardTaskSnapshot
+from app.schemas.task import TaskResponse
+from app.services.board_snapshot import board_snapshot
+from app.utils.fast_json import json_dumps, response_columns, rows_payload
+
+# IDs fixos: uma execução interrompida é limpa pela seguinte
+USER_ID, PROJECT_ID, BOARD_ID = (
+    uuid5(NAMESPACE_URL, f"benchmarks.read_paths/{name}") for name in ("user", "project", "board")
+)
+
+SEED_SQL = [
+    """
+    INSERT INTO users (id, username, email, password_hash, full_name, is_active, is_superuser,
+                       created_at, updated_at)
+    VALUES (:user_id, 'read_paths_' || :suffix, 'read_paths_' || :suffix || '@example.com',
+            'x', 'Read Paths', true, false, now(), now())
+    """,
+    """
+    INSERT INTO projects (id, name, owner_id, created_at, updated_at)
+    VALUES (:project_id, 'read paths', :user_id, now(), now())
+    """,
+    """
+    INSERT INTO boards (id, name, project_id, created_at, updated_at)
+    VALUES (:board_id, 'read paths', :project_id, now(), now())
+    """,
+    """
+    INSERT INTO columns (id, title, position, board_id, created_at, updated_at)
+    SELECT gen_random_uuid(), 'Column ' || n, n - 1, :board_id, now(), now()
+    FROM generate_series(1, :columns) AS n
+    """,
+    """
+    INSERT INTO tags (id, name, color, project_id, created_at, updated_at)
+    SELECT gen_random_uuid(), 'tag ' || n, '#3B82F6', :project_id, now(), now()
+    FROM generate_series(1, 8) AS n
+    """,
+    """
+    INSERT INTO tasks (id, title, description, position, rank, priority, column_id,
+                       assignee_id, created_by, created_at, updated_at)
+    SELECT gen_random_uuid(), 'Task ' || n, repeat('lorem ipsum ', :description_bytes / 12),
+           n - 1, rtrim(lpad(to_hex(n), 7, '0'), '0'), 'MEDIUM', c.id,
+           CASE WHEN n % 2 = 0 THEN CAST(:user_id AS uuid) END, :user_id, now(), now()
+    FROM columns AS c
+    CROSS JOIN generate_series(1, :tasks_per_column) AS n
+    WHERE c.board_id = :board_id
+    """,
+    """
+    INSERT INTO task_tags (task_id, tag_id)
+    SELECT t.id, g.id
+    FROM tasks AS t
+    JOIN columns AS c ON c.id = t.column_id
+    CROSS JOIN LATERAL (
+        SELECT id FROM tags WHERE project_id = :project_id
+        ORDER BY md5(t.id::text || name) LIMIT 3
+    ) AS g
+    WHERE c.board_id = :board_id
+    """,
+    "ANALYZE",
+]
+
+CLEAN_SQL = [
+    """
+    DELETE FROM task_tags WHERE task_id IN (
+        SELECT t.id FROM tasks AS t JOIN columns AS c ON c.id = t.column_id
+        WHERE c.board_id = :board_id
+    )
+    """,
+    "DELETE FROM tasks WHERE column_id IN (SELECT id FROM columns WHERE board_id = :board_id)",
+    "DELETE FROM columns WHERE board_id = :board_id",
+    "DELETE FROM tags WHERE project_id = :project_id",
+    "DELETE FROM boards WHERE id = :board_id",
+    "DELETE FROM projects WHERE id = :project_id",
+    "DELETE FROM users WHERE id = :user_id",
+]
+
+
+# Caminho antigo do /full: Task.tags aponta para a associação TaskTag
+class EntityTaskSnapshot(BoardTaskSnapshot):
+    @field_validator("tags", mode="before")
+    @classmethod
+    def unwrap_task_tags(cls, value):
+        return [getattr(item, "tag", item) for item in value]
+
+
+class EntityColumnSnapshot(BoardColumnSnapshot):
+    tasks: List[EntityTaskSnapshot] = []
+
+
+class EntityBoardResponse(BoardFullResponse):
+    columns: List[EntityColumnSnapshot] = []
+
+
+def seed(connection: Connection, params: Dict) -> None:
+    for statement in SEED_SQL:
+        connection.execute(text(statement), params)
+    connection.commit()
+
+
+def clean(connection: Connection, params: Dict) -> None:
+    for statement in CLEAN_SQL:
+        connection.execute(text(statement), params)
+    connection.commit()
+
+
+async def column_tasks_entities(db, params: Dict) -> bytes:
+    result = await db.execute(
+        select(Task).where(Task.column_id == params["column_id"]).order_by(*task_ordering())
+    )
+    payload = [
+        TaskResponse.model_validate(task).model_dump(mode="json") for task in result.scalars()
+    ]
+    # Mesma codificação do JSONResponse do Starlette
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+async def column_tasks_columns(db, params: Dict) -> bytes:
+    result = await db.execute(
+        select(*response_columns(Task, TaskResponse))
+        .where(Task.column_id == params["column_id"])
+        .order_by(*task_ordering())
+    )
+    return json_dumps(rows_payload(result.all(), TaskResponse))
+
+
+async def board_full_entities(db, params: Dict) -> bytes:
+    result = await db.execute(
+        select(Board)
+        .where(Board.id == params["board_id"])
+        .options(
+            joinedload(Board.project),
+            selectinload(Board.columns)
+            .selectinload(Column.tasks)
+            .options(
+                joinedload(Task.assignee),
+                selectinload(Task.tags).joinedload(TaskTag.tag),
+            ),
+        )
+    )
+    board = result.unique().scalar_one()
+    return EntityBoardResponse.model_validate(board).model_dump_json().encode("utf-8")
+
+
+async def board_full_columns(db, params: Dict) -> bytes:
+    return json_dumps(await board_snapshot(db, params["board_id"], params["user_id"]))
+
+
+PATHS: Dict[str, Dict[str, Callable[..., Awaitable[bytes]]]] = {
+    "column_tasks": {"entities": column_tasks_entities, "columns": column_tasks_columns},
+    "board_full": {"entities": board_full_entities, "columns": board_full_columns},
+}
+
+
+async def request(path: Callable[..., Awaitable[bytes]], params: Dict) -> bytes:
+    async with AsyncSessionLocal() as db:
+        return await path(db, params)
+
+
+async def measure(path: Callable[..., Awaitable[bytes]], params: Dict, requests: int) -> Dict:
+    body = await request(path, params)  # aquecimento
+    started, cpu_started = time.perf_counter(), time.process_time()
+    for _ in range(requests):
+        await request(path, params)
+    elapsed, cpu = time.perf_counter() - started, time.process_time() - cpu_started
+
+    tracemalloc.start()
+    await request(path, params)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "ms": round(elapsed / requests * 1000, 2),
+        "cpu_ms": round(cpu / requests * 1000, 2),
+        "peak_kb": round(peak / 1024),
+        "body_bytes": len(body),
+    }
+
+
+async def run(params: Dict, requests: int) -> List[Dict]:
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Column.id).where(Column.board_id == params["board_id"]).order_by(Column.position)
+        )
+        params["column_id"] = result.scalars().first()
+
+    results = []
+    for name, strategies in PATHS.items():
+        for strategy, path in strategies.items():
+            result = await measure(path, params, requests)
+            results.append({"path": name, "strategy": strategy, **result})
+    await dispose_engines()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000], help="Tarefas/coluna")
+    parser.add_argument("--columns", type=int, default=4)
+    parser.add_argument("--description-bytes", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--json", dest="json_output", default=None)
+    args = parser.parse_args()
+
+    engine = create_engine(settings.DATABASE_URL)
+    rows = []
+    for size in args.sizes:
+        params = {
+            "user_id": USER_ID,
+            "project_id": PROJECT_ID,
+            "board_id": BOARD_ID,
+            "suffix": str(size),
+            "columns": args.columns,
+            "tasks_per_column": size,
+            "description_bytes": args.description_bytes,
+        }
+        with engine.connect() as connection:
+            clean(connection, params)
+            seed(connection, params)
+        try:
+            results = asyncio.run(run(params, args.requests))
+        finally:
+            with engine.connect() as connection:
+                clean(connection, params)
+
+        for result in results:
+            result["tasks_per_column"] = size
+            rows.append(result)
+            print(
+                f"{size:>6} tasks/column  {result['path']:>12}  {result['strategy']:>8}  "
+                f"{result['ms']:>9} ms  cpu {result['cpu_ms']:>9} ms  "
+                f"peak {result['peak_kb']:>8} KB  {result['body_bytes']:>10} bytes"
+            )
+    engine.dispose()
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as output:
+            json.dump(rows, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
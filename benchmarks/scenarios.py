@@ -0,0 +1,312 @@
+"""
+Cenários de carga dos fluxos principais sobre o dataset de benchmarks.seed
+
+Roda contra uma API local (apontando para o mesmo banco do seed) os fluxos
+mais frequentes, um de cada vez, com --concurrency clientes e --requests
+requisições por cenário:
+
+- login:          POST /api/auth/login de um usuário do seed
+- board_open:     GET /api/boards/{id}/full (board com colunas, tarefas e tags)
+- task_drag:      PATCH /api/tasks/{id}/move para outra coluna/posição do board
+- task_create:    POST /api/tasks em uma coluna do board
+- list_filtered:  GET /api/tasks filtrando por coluna, prioridade e/ou tag
+
+Boards, colunas, tarefas e tags são sorteados do seed com --seed, então duas
+execuções com os mesmos argumentos fazem as mesmas requisições. O resultado
+(req/s e p50/p95/p99 por cenário, commit, dataset e argumentos) vai para
+--json; com --compare, cada cenário é comparado a um resultado anterior:
+
+    python -m benchmarks.seed --seed 1
+    uvicorn app.main:app --port 8000
+    python -m benchmarks.scenarios --url http://localhost:8000 --json bench_main.json
+    git checkout minha-branch   # reinicie a API
+    python -m benchmarks.scenarios --url http://localhost:8000 --json bench_branch.json \\
+        --compare bench_main.json
+
+task_drag e task_create alteram o dataset: para resultados comparáveis,
+recrie o seed (--clean e seed de novo) entre as execuções.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+
+from app.core.config import settings
+from benchmarks.load import summarize
+from benchmarks.seed import SEED_PASSWORD, seed_id_range
+
+
+@dataclass
+class BoardSample:
+    """Board do seed com o dono (quem pode abri-lo) e alguns IDs para as requisições"""
+
+    board_id: str
+    username: str
+    columns: List[str] = field(default_factory=list)
+    tasks: List[str] = field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+Scenario = Callable[[httpx.AsyncClient, BoardSample, random.Random], Awaitable[httpx.Response]]
+
+SAMPLE_BOARDS_SQL = """
+    SELECT b.id AS board_id, b.project_id, u.username
+    FROM boards AS b
+    JOIN projects AS p ON p.id = b.project_id
+    JOIN users AS u ON u.id = p.owner_id
+    WHERE b.id >= :low AND b.id < :high
+    ORDER BY md5(b.id::text || :seed)
+    LIMIT :boards
+"""
+SAMPLE_COLUMNS_SQL = """
+    SELECT id FROM columns WHERE board_id = :board_id ORDER BY position
+"""
+SAMPLE_TASKS_SQL = """
+    SELECT t.id FROM columns AS c
+    CROSS JOIN LATERAL (
+        SELECT id FROM tasks WHERE column_id = c.id ORDER BY position LIMIT :tasks
+    ) AS t
+    WHERE c.board_id = :board_id
+"""
+SAMPLE_TAGS_SQL = "SELECT id FROM tags WHERE project_id = :project_id ORDER BY name"
+DATASET_TABLES = ["users", "projects", "boards", "columns", "tasks", "comments", "activity_logs"]
+
+
+def sample_boards(connection: Connection, args: argparse.Namespace) -> List[BoardSample]:
+    low, high = seed_id_range(args.seed)
+    rows = connection.execute(
+        text(SAMPLE_BOARDS_SQL),
+        {"low": low, "high": high, "seed": str(args.seed), "boards": args.boards},
+    ).all()
+    if not rows:
+        raise SystemExit(f"seed {args.seed} not found, run python -m benchmarks.seed first")
+
+    samples = []
+    for row in rows:
+        params = {"board_id": row.board_id, "project_id": row.project_id}
+        samples.append(
+            BoardSample(
+                board_id=str(row.board_id),
+                username=row.username,
+                columns=[
+                    str(i) for i in connection.execute(text(SAMPLE_COLUMNS_SQL), params).scalars()
+                ],
+                tasks=[
+                    str(i)
+                    for i in connection.execute(
+                        text(SAMPLE_TASKS_SQL), {**params, "tasks": args.tasks_per_column}
+                    ).scalars()
+                ],
+                tags=[str(i) for i in connection.execute(text(SAMPLE_TAGS_SQL), params).scalars()],
+            )
+        )
+    return samples
+
+
+def dataset_counts(connection: Connection) -> Dict[str, int]:
+    return {
+        table: connection.execute(text(f"SELECT count(*) FROM {table}")).scalar_one()
+        for table in DATASET_TABLES
+    }
+
+
+async def login(client: httpx.AsyncClient, board: BoardSample, rng: random.Random):
+    return await client.post(
+        "/api/auth/login", json={"username": board.username, "password": SEED_PASSWORD}
+    )
+
+
+async def board_open(client: httpx.AsyncClient, board: BoardSample, rng: random.Random):
+    return await client.get(f"/api/boards/{board.board_id}/full", headers=board.headers)
+
+
+async def task_drag(client: httpx.AsyncClient, board: BoardSample, rng: random.Random):
+    return await client.patch(
+        f"/api/tasks/{rng.choice(board.tasks)}/move",
+        json={"column_id": rng.choice(board.columns), "position": rng.randrange(20)},
+        headers=board.headers,
+    )
+
+
+async def task_create(client: httpx.AsyncClient, board: BoardSample, rng: random.Random):
+    return await client.post(
+        "/api/tasks",
+        json={
+            "title": f"scenario task {rng.randrange(1_000_000)}",
+            "column_id": rng.choice(board.columns),
+            "priority": rng.choice(["low", "medium", "high"]),
+        },
+        headers=board.headers,
+    )
+
+
+async def list_filtered(client: httpx.AsyncClient, board: BoardSample, rng: random.Random):
+    params: Dict = {"column_id": rng.choice(board.columns), "limit": 50}
+    roll = rng.random()
+    if roll < 0.4:
+        params["priority"] = "HIGH"
+    elif roll < 0.8 and board.tags:
+        params["tag_id"] = rng.sample(board.tags, min(2, len(board.tags)))
+        params["tag_match"] = rng.choice(["any", "all"])
+    return await client.get("/api/tasks", params=params, headers=board.headers)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "login": login,
+    "board_open": board_open,
+    "task_drag": task_drag,
+    "task_create": task_create,
+    "list_filtered": list_filtered,
+}
+
+
+async def authenticate(client: httpx.AsyncClient, boards: List[BoardSample]) -> None:
+    """Um login por dono de board (fora da medição)"""
+    tokens: Dict[str, str] = {}
+    for board in boards:
+        if board.username not in tokens:
+            response = await client.post(
+                "/api/auth/login", json={"username": board.username, "password": SEED_PASSWORD}
+            )
+            response.raise_for_status()
+            tokens[board.username] = response.json()["access_token"]
+        board.headers = {"Authorization": f"Bearer {tokens[board.username]}"}
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    name: str,
+    boards: List[BoardSample],
+    args: argparse.Namespace,
+) -> Dict:
+    scenario = SCENARIOS[name]
+    latencies: List[float] = []
+    errors = 0
+    remaining = args.warmup + args.requests
+    measure_started: Optional[float] = None
+
+    async def worker(number: int) -> None:
+        nonlocal remaining, errors, measure_started
+        rng = random.Random(f"{args.seed}:{name}:{number}")
+        while remaining > 0:
+            remaining -= 1
+            # As primeiras --warmup requisições não entram no resultado
+            measured = remaining < args.requests
+            started = time.perf_counter()
+            if measured and measure_started is None:
+                measure_started = started
+            try:
+                response = await scenario(client, rng.choice(boards), rng)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            if measured:
+                latencies.append(time.perf_counter() - started)
+                errors += failed
+
+    await asyncio.gather(*(worker(number) for number in range(args.concurrency)))
+    elapsed = time.perf_counter() - measure_started
+
+    result = summarize(name, latencies, errors, elapsed)
+    result["scenario"] = result.pop("target")
+    return result
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: List[Dict], baseline_path: str) -> None:
+    with open(baseline_path, encoding="utf-8") as baseline_file:
+        baseline = {item["scenario"]: item for item in json.load(baseline_file)["scenarios"]}
+
+    def delta(new: float, old: float) -> str:
+        return f"{(new - old) / old * 100:+7.1f}%" if old else "      -"
+
+    print(f"\ncompared to {baseline_path}:")
+    for result in results:
+        old = baseline.get(result["scenario"])
+        if old is None:
+            continue
+        print(
+            f"{result['scenario']:>14}  req/s {delta(result['rps'], old['rps'])}  "
+            f"p50 {delta(result['p50_ms'], old['p50_ms'])}  "
+            f"p95 {delta(result['p95_ms'], old['p95_ms'])}  "
+            f"p99 {delta(result['p99_ms'], old['p99_ms'])}"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--seed", type=int, default=1, help="Seed carregado por benchmarks.seed")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        help="Cenário a rodar (pode ser repetido; padrão: todos)",
+    )
+    parser.add_argument("--requests", type=int, default=2000, help="Requisições por cenário")
+    parser.add_argument("--warmup", type=int, default=100, help="Requisições descartadas antes")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--boards", type=int, default=50, help="Boards sorteados do seed")
+    parser.add_argument("--tasks-per-column", type=int, default=20)
+    parser.add_argument("--json", dest="json_output", default=None)
+    parser.add_argument("--compare", default=None, help="JSON de uma execução anterior")
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = parse_args()
+    engine = create_engine(settings.DATABASE_URL)
+    with engine.connect() as connection:
+        boards = sample_boards(connection, args)
+        dataset = dataset_counts(connection)
+    engine.dispose()
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    results = []
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=60.0) as client:
+        await authenticate(client, boards)
+        for name in args.scenario or list(SCENARIOS):
+            result = await run_scenario(client, name, boards, args)
+            results.append(result)
+            print(
+                f"{result['scenario']:>14}  {result['rps']:>9} req/s  "
+                f"p50 {result['p50_ms']:>8} ms  p95 {result['p95_ms']:>8} ms  "
+                f"p99 {result['p99_ms']:>8} ms  errors {result['errors']}"
+            )
+
+    if args.json_output:
+        report = {
+            "commit": git_commit(),
+            "started_at": datetime.utcnow().isoformat(),
+            "url": args.url,
+            "args": vars(args),
+            "dataset": dataset,
+            "scenarios": results,
+        }
+        with open(args.json_output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,254 @@
+"""
+Benchmark da busca textual de tarefas (tsvector + GIN) em um corpus grande
+
+Popula (opcionalmente) projetos/boards/colunas com o seed de benchmarks.indexes
+e tarefas com títulos e descrições sorteados de um vocabulário (termos comuns
+e termos raros), por padrão 1M de tarefas. Para cada busca mede:
+
+- ilike:   filtro ILIKE '%termo%' em título/descrição (sem índice e sem ranking)
+- no_gin:  a query de app.services.task_search sem o índice GIN (DROP em
+           transação com ROLLBACK, como em benchmarks.indexes)
+- gin:     a mesma query com o índice
+- service: search_tasks() completo (página + ts_headline), em ms por chamada
+
+    python -m benchmarks.search --seed --tasks-per-column 2000   # 20x5x5x2000 = 1M
+    python -m benchmarks.search --json bench_search.json
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict
+from uuid import UUID
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, dispose_engines, get_async_engine
+from app.services.task_search import search_tasks, search_terms
+from benchmarks.indexes import SEED_SQL, explain
+
+# Palavras comuns sorteadas para títulos e descrições; os termos raros são "tok<n>"
+VOCABULARY = [
+    "deploy",
+    "api",
+    "kanban",
+    "board",
+    "bug",
+    "fix",
+    "login",
+    "cache",
+    "banco",
+    "tarefa",
+    "coluna",
+    "projeto",
+    "frontend",
+    "backend",
+    "teste",
+    "docker",
+    "release",
+    "review",
+    "migração",
+    "índice",
+    "busca",
+    "usuário",
+    "senha",
+    "token",
+    "relatório",
+    "cliente",
+    "pagamento",
+    "email",
+    "notificação",
+    "websocket",
+    "layout",
+    "mobile",
+    "performance",
+    "refatorar",
+    "documentação",
+    "permissão",
+    "upload",
+    "arquivo",
+    "dashboard",
+    "métrica",
+]
+
+# Palavra sorteada do vocabulário (correlacionada com n para ser sorteada por linha)
+RANDOM_WORD_SQL = "(CAST(:vocabulary AS text[]))[1 + floor(random() * :size)::int]"
+
+SEED_TASKS_SQL = f"""
+    INSERT INTO tasks (id, title, description, position, rank, priority, column_id,
+                       assignee_id, created_by, created_at, updated_at)
+    SELECT gen_random_uuid(),
+           (SELECT string_agg({RANDOM_WORD_SQL}, ' ') FROM generate_series(1, 3 + (n % 2))),
+           (SELECT string_agg({RANDOM_WORD_SQL}, ' ') FROM generate_series(1, 15 + (n % 10)))
+           || ' tok' || floor(random() * :rare_terms)::int,
+           n - 1, rtrim(lpad(to_hex(n), 7, '0'), '0'), 'MEDIUM', c.id, p.owner_id, p.owner_id,
+           now(), now()
+    FROM columns AS c
+    JOIN boards AS b ON b.id = c.board_id
+    JOIN projects AS p ON p.id = b.project_id
+    CROSS JOIN generate_series(1, :tasks_per_column) AS n
+    WHERE c.title LIKE 'Column %'
+"""
+
+# Mesma forma da página calculada por app.services.task_search (tsquery inline)
+SEARCH_SQL = """
+    SELECT t.id, ts_rank(t.search_vector, to_tsquery('simple', :tsquery)) AS rank
+    FROM tasks AS t
+    JOIN columns AS c ON c.id = t.column_id
+    JOIN boards AS b ON b.id = c.board_id
+    JOIN projects AS p ON p.id = b.project_id
+    WHERE p.owner_id = :owner_id AND b.project_id = :project_id
+      AND t.search_vector @@ to_tsquery('simple', :tsquery)
+    ORDER BY rank DESC, t.id
+    LIMIT 20
+"""
+
+ILIKE_SQL = """
+    SELECT t.id
+    FROM tasks AS t
+    JOIN columns AS c ON c.id = t.column_id
+    JOIN boards AS b ON b.id = c.board_id
+    JOIN projects AS p ON p.id = b.project_id
+    WHERE p.owner_id = :owner_id AND b.project_id = :project_id
+      AND (t.title ILIKE :pattern OR t.description ILIKE :pattern)
+    ORDER BY t.id
+    LIMIT 20
+"""
+
+SEARCHES = {
+    "common": "deploy",
+    "accented": "notificação",
+    "two_terms": "cache banco",
+    "rare": "tok4242",
+}
+
+
+def seed(connection: Connection, args: argparse.Namespace) -> None:
+    params = {
+        "users": args.users,
+        "projects": args.projects,
+        "boards_per_project": args.boards_per_project,
+        "columns_per_board": args.columns_per_board,
+        "tasks_per_column": args.tasks_per_column,
+        "vocabulary": VOCABULARY,
+        "size": len(VOCABULARY),
+        "rare_terms": args.rare_terms,
+    }
+    for statement in [*SEED_SQL[:-2], SEED_TASKS_SQL, "ANALYZE"]:
+        connection.execute(text(statement), params)
+    connection.commit()
+
+
+def sample_scope(connection: Connection) -> Dict[str, str]:
+    """Projeto com mais tarefas (e seu dono) para escopar as buscas"""
+    row = (
+        connection.execute(
+            text(
+                """
+            SELECT b.project_id, p.owner_id, count(*) AS tasks
+            FROM tasks AS t
+            JOIN columns AS c ON c.id = t.column_id
+            JOIN boards AS b ON b.id = c.board_id
+            JOIN projects AS p ON p.id = b.project_id
+            GROUP BY b.project_id, p.owner_id
+            ORDER BY tasks DESC
+            LIMIT 1
+            """
+            )
+        )
+        .mappings()
+        .one()
+    )
+    return {key: str(value) for key, value in row.items()}
+
+
+def best(connection: Connection, sql: str, params: Dict, repeat: int) -> Dict:
+    # Primeira execução aquece o cache; mede-se a melhor das demais
+    return min(
+        (explain(connection, sql, params) for _ in range(repeat + 1)),
+        key=lambda item: item["execution_ms"],
+    )
+
+
+async def measure_service(scope: Dict[str, str], q: str, repeat: int) -> float:
+    get_async_engine()
+    timings = []
+    async with AsyncSessionLocal() as db:
+        for _ in range(repeat + 1):
+            started = time.perf_counter()
+            await search_tasks(
+                db, UUID(scope["owner_id"]), search_terms(q), project_id=UUID(scope["project_id"])
+            )
+            timings.append(time.perf_counter() - started)
+    await dispose_engines()
+    return round(min(timings[1:]) * 1000, 3)
+
+
+def run(connection: Connection, repeat: int) -> Dict[str, Dict]:
+    scope = sample_scope(connection)
+    print(f"project {scope['project_id']} with {scope['tasks']} tasks")
+    results: Dict[str, Dict] = {}
+
+    for name, q in SEARCHES.items():
+        terms = search_terms(q)
+        params = {
+            "owner_id": scope["owner_id"],
+            "project_id": scope["project_id"],
+            "tsquery": " & ".join(terms),
+            "pattern": f"%{q}%",
+        }
+        ilike = best(connection, ILIKE_SQL, params, repeat)
+        gin = best(connection, SEARCH_SQL, params, repeat)
+
+        savepoint = connection.begin_nested()
+        connection.execute(text("DROP INDEX IF EXISTS ix_tasks_search_vector"))
+        no_gin = best(connection, SEARCH_SQL, params, repeat)
+        savepoint.rollback()
+        connection.commit()
+
+        service = asyncio.run(measure_service(scope, q, repeat))
+        results[name] = {
+            "q": q,
+            "ilike": ilike,
+            "no_gin": no_gin,
+            "gin": gin,
+            "service_ms": service,
+        }
+        uses_gin = any("ix_tasks_search_vector" in node for node in gin["plan"])
+        print(
+            f"{name:<10} ilike {ilike['execution_ms']:>10.3f} ms  "
+            f"no_gin {no_gin['execution_ms']:>10.3f} ms  gin {gin['execution_ms']:>9.3f} ms  "
+            f"service {service:>9.3f} ms  gin index used: {uses_gin}"
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seed", action="store_true", help="Popula o corpus sintético antes")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--boards-per-project", type=int, default=5)
+    parser.add_argument("--columns-per-board", type=int, default=5)
+    parser.add_argument("--tasks-per-column", type=int, default=2000)
+    parser.add_argument("--rare-terms", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", dest="json_output", default=None)
+    args = parser.parse_args()
+
+    engine = create_engine(settings.DATABASE_URL)
+    with engine.connect() as connection:
+        if args.seed:
+            seed(connection, args)
+        results = run(connection, args.repeat)
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
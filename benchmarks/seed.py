@@ -0,0 +1,511 @@
+"""
+Seeder de dados sintéticos para os benchmarks e o benchmarks.scenarios
+
+Gera organizações realistas com COPY (sem INSERT linha a linha): cada
+organização tem --users-per-org usuários e --projects-per-org projetos, cada
+projeto --boards-per-project boards com --columns-per-board colunas e
+--tags-per-project tags. --tasks tarefas são distribuídas entre as colunas,
+--comments comentários entre as tarefas (algumas tarefas concentram a maior
+parte, como na vida real) e --activity eventos de atividade nos últimos
+--activity-days dias (nas partições mensais de activity_logs).
+
+A geração é determinística: o mesmo --seed produz os mesmos IDs e conteúdos,
+então resultados de commits diferentes são comparáveis. Os IDs de cada --seed
+ficam em uma faixa própria de UUIDs e os usuários se chamam
+seed<seed>_user_<n> (senha SEED_PASSWORD), o que permite a --clean remover só
+os dados do seed.
+
+    python -m benchmarks.seed --tasks 1000000 --comments 1000000 --activity 2000000
+    python -m benchmarks.seed --orgs 2 --tasks 10000 --comments 5000 --activity 20000
+    python -m benchmarks.seed --clean
+"""
+
+import argparse
+import io
+import random
+import time
+import uuid
+from array import array
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.config import settings
+from app.core.security import get_password_hash
+from app.services.activity_partitions import create_partition, list_partitions, month_partition
+from app.utils.lexorank import spaced_ranks
+from benchmarks.search import VOCABULARY
+
+SEED_PASSWORD = "bench-password"
+
+# Tipos de registro, parte dos UUIDs gerados (ver seed_id)
+KINDS = {
+    "user": 1,
+    "project": 2,
+    "board": 3,
+    "column": 4,
+    "tag": 5,
+    "task": 6,
+    "comment": 7,
+    "activity": 8,
+}
+COLUMN_TITLES = ["Backlog", "To Do", "In Progress", "Review", "Done", "Blocked", "Archived"]
+PRIORITIES = (["LOW"] * 3) + (["MEDIUM"] * 5) + (["HIGH"] * 2)
+TAG_NAMES = ["bug", "feature", "ui", "api", "infra", "docs", "urgent", "tech-debt", "ux", "data"]
+TAG_COLORS = ["#EF4444", "#3B82F6", "#10B981", "#F59E0B", "#8B5CF6", "#EC4899", "#6B7280"]
+# Ações e pesos dos eventos de activity_logs
+ACTIONS = [
+    ("TASK_UPDATED", 40),
+    ("TASK_MOVED", 25),
+    ("TASK_CREATED", 10),
+    ("COMMENT_ADDED", 10),
+    ("TASK_ASSIGNED", 8),
+    ("TAG_ADDED", 5),
+    ("TAG_REMOVED", 2),
+]
+
+# Linhas geradas por leitura do COPY
+COPY_CHUNK_ROWS = 5000
+
+
+def seed_namespace(seed: int) -> int:
+    return 0x5EED0000 | (seed & 0xFFFF)
+
+
+def seed_id(seed: int, kind: str, number: int) -> uuid.UUID:
+    """UUID determinístico: namespace do seed (32 bits), tipo (16 bits), número"""
+    return uuid.UUID(int=(seed_namespace(seed) << 96) | (KINDS[kind] << 80) | number)
+
+
+def seed_id_range(seed: int) -> Tuple[str, str]:
+    """Faixa [início, fim) dos UUIDs do seed, para --clean e benchmarks.scenarios"""
+    namespace = seed_namespace(seed)
+    return str(uuid.UUID(int=namespace << 96)), str(uuid.UUID(int=(namespace + 1) << 96))
+
+
+def seed_username(seed: int, number: int) -> str:
+    return f"seed{seed}_user_{number}"
+
+
+class CopySource(io.RawIOBase):
+    """Arquivo de leitura sobre um gerador de linhas (COPY sem montar o CSV em memória)"""
+
+    def __init__(self, rows: Iterable[str]):
+        self.chunks = self._chunks(iter(rows))
+        self.buffer = b""
+
+    @staticmethod
+    def _chunks(rows: Iterator[str]) -> Iterator[bytes]:
+        batch: List[str] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= COPY_CHUNK_ROWS:
+                yield "".join(batch).encode("utf-8")
+                batch = []
+        if batch:
+            yield "".join(batch).encode("utf-8")
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self.buffer) < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            self.buffer += chunk
+        if size < 0:
+            size = len(self.buffer)
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+
+def copy_rows(engine: Engine, table: str, columns: List[str], rows: Iterable[Tuple]) -> int:
+    """COPY das linhas (None vira NULL) em uma transação própria; devolve quantas"""
+    count = 0
+
+    def lines() -> Iterator[str]:
+        nonlocal count
+        for row in rows:
+            count += 1
+            yield "\t".join("\\N" if value is None else str(value) for value in row) + "\n"
+
+    started = time.perf_counter()
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        cursor.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN", CopySource(lines()), size=65536
+        )
+        raw.commit()
+    finally:
+        raw.close()
+    print(f"  {table:<14} {count:>10} rows in {time.perf_counter() - started:6.1f} s")
+    return count
+
+
+class Dataset:
+    """Formato do dataset e as relações entre os índices de cada tipo de registro"""
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.seed = args.seed
+        self.users = args.orgs * args.users_per_org
+        self.projects = args.orgs * args.projects_per_org
+        self.boards = self.projects * args.boards_per_project
+        self.columns = self.boards * args.columns_per_board
+        self.tags = self.projects * args.tags_per_project
+        # Datas relativas ao início do dia: reexecuções no mesmo dia geram o mesmo dataset
+        self.now = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def id(self, kind: str, number: int) -> uuid.UUID:
+        return seed_id(self.seed, kind, number)
+
+    def rng(self, name: str) -> random.Random:
+        # Um gerador por tabela: mudar uma contagem não altera as outras tabelas
+        return random.Random(f"{self.seed}:{name}")
+
+    def org_of_project(self, project: int) -> int:
+        return project // self.args.projects_per_org
+
+    def project_of_column(self, column: int) -> int:
+        return column // self.args.columns_per_board // self.args.boards_per_project
+
+    def member(self, org: int, rng: random.Random) -> int:
+        return org * self.args.users_per_org + rng.randrange(self.args.users_per_org)
+
+    def column_of_task(self, task: int) -> int:
+        return task * self.columns // self.args.tasks
+
+    def column_start(self, column: int) -> int:
+        """Primeira tarefa da coluna (as tarefas são contíguas por coluna)"""
+        return -(-column * self.args.tasks // self.columns)
+
+    def timestamp(self, rng: random.Random, days: int) -> datetime:
+        return self.now - timedelta(seconds=rng.randrange(days * 86400))
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(VOCABULARY) for _ in range(count))
+
+
+def users(data: Dataset) -> Iterator[Tuple]:
+    password_hash = get_password_hash(SEED_PASSWORD)
+    for number in range(data.users):
+        username = seed_username(data.seed, number)
+        yield (
+            data.id("user", number),
+            username,
+            f"{username}@example.com",
+            password_hash,
+            f"Seed User {number}",
+            True,
+            False,
+            data.now,
+            data.now,
+        )
+
+
+def projects(data: Dataset) -> Iterator[Tuple]:
+    rng = data.rng("projects")
+    for number in range(data.projects):
+        owner = data.member(data.org_of_project(number), rng)
+        yield (
+            data.id("project", number),
+            f"Project {number}",
+            _words(rng, 8),
+            data.id("user", owner),
+            data.now,
+            data.now,
+        )
+
+
+def boards(data: Dataset) -> Iterator[Tuple]:
+    for number in range(data.boards):
+        project = number // data.args.boards_per_project
+        yield (
+            data.id("board", number),
+            f"Board {number}",
+            data.id("project", project),
+            data.now,
+            data.now,
+        )
+
+
+def columns(data: Dataset) -> Iterator[Tuple]:
+    for number in range(data.columns):
+        position = number % data.args.columns_per_board
+        yield (
+            data.id("column", number),
+            COLUMN_TITLES[position % len(COLUMN_TITLES)],
+            position,
+            None,
+            data.id("board", number // data.args.columns_per_board),
+            data.now,
+            data.now,
+        )
+
+
+def tags(data: Dataset) -> Iterator[Tuple]:
+    for number in range(data.tags):
+        index = number % data.args.tags_per_project
+        name = TAG_NAMES[index % len(TAG_NAMES)]
+        if index >= len(TAG_NAMES):
+            name += f"-{index}"
+        yield (
+            data.id("tag", number),
+            name,
+            TAG_COLORS[index % len(TAG_COLORS)],
+            data.id("project", number // data.args.tags_per_project),
+            data.now,
+            data.now,
+        )
+
+
+def comment_counts(data: Dataset) -> array:
+    """Comentários por tarefa; as primeiras tarefas concentram a maior parte"""
+    rng = data.rng("comment_counts")
+    counts = array("I", bytes(4 * data.args.tasks))
+    for _ in range(data.args.comments):
+        counts[int(data.args.tasks * rng.random() ** 2)] += 1
+    return counts
+
+
+def tasks(data: Dataset, counts: array) -> Iterator[Tuple]:
+    rng = data.rng("tasks")
+    ranks: List[str] = []
+    for number in range(data.args.tasks):
+        column = data.column_of_task(number)
+        position = number - data.column_start(column)
+        if position >= len(ranks):
+            ranks = spaced_ranks(max(position + 1, 2 * len(ranks)))
+        org = data.org_of_project(data.project_of_column(column))
+        created_at = data.timestamp(rng, 365)
+        due_date = created_at + timedelta(days=rng.randrange(1, 60)) if rng.random() < 0.3 else None
+        yield (
+            data.id("task", number),
+            _words(rng, rng.randint(3, 7)).capitalize(),
+            _words(rng, rng.randint(10, 40)),
+            position,
+            ranks[position],
+            rng.choice(PRIORITIES),
+            due_date,
+            data.id("column", column),
+            data.id("user", data.member(org, rng)) if rng.random() < 0.8 else None,
+            data.id("user", data.member(org, rng)),
+            created_at,
+            created_at,
+            counts[number],
+        )
+
+
+def task_tags(data: Dataset) -> Iterator[Tuple]:
+    rng = data.rng("task_tags")
+    for number in range(data.args.tasks):
+        if rng.random() >= data.args.tagged_ratio:
+            continue
+        project = data.project_of_column(data.column_of_task(number))
+        first = project * data.args.tags_per_project
+        count = min(rng.randint(1, 3), data.args.tags_per_project)
+        for tag in rng.sample(range(first, first + data.args.tags_per_project), count):
+            yield (data.id("task", number), data.id("tag", tag))
+
+
+def comments(data: Dataset, counts: array) -> Iterator[Tuple]:
+    rng = data.rng("comments")
+    number = 0
+    for task, count in enumerate(counts):
+        if not count:
+            continue
+        org = data.org_of_project(data.project_of_column(data.column_of_task(task)))
+        for _ in range(count):
+            created_at = data.timestamp(rng, 365)
+            yield (
+                data.id("comment", number),
+                _words(rng, rng.randint(5, 30)),
+                data.id("task", task),
+                data.id("user", data.member(org, rng)),
+                created_at,
+                created_at,
+            )
+            number += 1
+
+
+def activity(data: Dataset) -> Iterator[Tuple]:
+    rng = data.rng("activity")
+    actions, weights = zip(*ACTIONS)
+    for number in range(data.args.activity):
+        task = rng.randrange(data.args.tasks)
+        column = data.column_of_task(task)
+        project = data.project_of_column(column)
+        created_at = data.timestamp(rng, data.args.activity_days)
+        yield (
+            data.id("activity", number),
+            rng.choices(actions, weights)[0],
+            None,
+            None,
+            data.id("task", task),
+            data.id("user", data.member(data.org_of_project(project), rng)),
+            data.id("board", column // data.args.columns_per_board),
+            data.id("project", project),
+            created_at,
+            created_at,
+        )
+
+
+TIMESTAMPS = ["created_at", "updated_at"]
+TABLES: List[Tuple[str, List[str], Callable]] = [
+    (
+        "users",
+        ["id", "username", "email", "password_hash", "full_name", "is_active", "is_superuser"]
+        + TIMESTAMPS,
+        users,
+    ),
+    ("projects", ["id", "name", "description", "owner_id"] + TIMESTAMPS, projects),
+    ("boards", ["id", "name", "project_id"] + TIMESTAMPS, boards),
+    ("columns", ["id", "title", "position", "wip_limit", "board_id"] + TIMESTAMPS, columns),
+    ("tags", ["id", "name", "color", "project_id"] + TIMESTAMPS, tags),
+]
+TASK_COLUMNS = [
+    "id",
+    "title",
+    "description",
+    "position",
+    "rank",
+    "priority",
+    "due_date",
+    "column_id",
+    "assignee_id",
+    "created_by",
+    "created_at",
+    "updated_at",
+    "comment_count",
+]
+COMMENT_COLUMNS = ["id", "content", "task_id", "user_id"] + TIMESTAMPS
+ACTIVITY_COLUMNS = [
+    "id",
+    "action",
+    "description",
+    "meta_data",
+    "task_id",
+    "user_id",
+    "board_id",
+    "project_id",
+] + TIMESTAMPS
+
+# Remoção dos dados de um seed, incluindo o que benchmarks.scenarios criou com os
+# usuários do seed (tarefas e atividades com IDs aleatórios)
+CLEAN_SQL = [
+    "DELETE FROM activity_logs WHERE user_id >= :low AND user_id < :high",
+    "DELETE FROM activity_logs WHERE project_id >= :low AND project_id < :high",
+    """
+    DELETE FROM task_tags WHERE task_id IN (
+        SELECT id FROM tasks WHERE created_by >= :low AND created_by < :high
+    )
+    """,
+    "DELETE FROM comments WHERE user_id >= :low AND user_id < :high",
+    "DELETE FROM tasks WHERE created_by >= :low AND created_by < :high",
+    "DELETE FROM tags WHERE id >= :low AND id < :high",
+    "DELETE FROM columns WHERE id >= :low AND id < :high",
+    "DELETE FROM boards WHERE id >= :low AND id < :high",
+    "DELETE FROM projects WHERE id >= :low AND id < :high",
+    "DELETE FROM users WHERE id >= :low AND id < :high",
+]
+
+
+def clean(connection: Connection, seed: int) -> None:
+    low, high = seed_id_range(seed)
+    for statement in CLEAN_SQL:
+        result = connection.execute(text(statement), {"low": low, "high": high})
+        print(f"  {statement.split()[2]:<14} {result.rowcount:>10} rows deleted")
+    connection.commit()
+
+
+def prepare(connection: Connection, data: Dataset) -> None:
+    """Confere se o seed já existe e cria as partições mensais da janela de atividades"""
+    low, high = seed_id_range(data.seed)
+    existing = connection.execute(
+        text("SELECT count(*) FROM users WHERE id >= :low AND id < :high"),
+        {"low": low, "high": high},
+    ).scalar_one()
+    if existing:
+        raise SystemExit(f"seed {data.seed} already loaded, run with --clean first")
+
+    if connection.dialect.name != "postgresql":
+        return
+    partitions = {partition.name for partition in list_partitions(connection)}
+    day = (data.now - timedelta(days=data.args.activity_days)).date()
+    while day <= data.now.date():
+        partition = month_partition(day)
+        if partition.name not in partitions:
+            create_partition(connection, partition)
+            print(f"  created partition {partition.name}")
+        day = partition.end
+    connection.commit()
+
+
+def seed(engine: Engine, data: Dataset) -> Dict[str, int]:
+    with engine.connect() as connection:
+        prepare(connection, data)
+
+    rows = {}
+    for table, names, generate in TABLES:
+        rows[table] = copy_rows(engine, table, names, generate(data))
+
+    counts = comment_counts(data)
+    rows["tasks"] = copy_rows(engine, "tasks", TASK_COLUMNS, tasks(data, counts))
+    rows["task_tags"] = copy_rows(engine, "task_tags", ["task_id", "tag_id"], task_tags(data))
+    rows["comments"] = copy_rows(engine, "comments", COMMENT_COLUMNS, comments(data, counts))
+    rows["activity_logs"] = copy_rows(engine, "activity_logs", ACTIVITY_COLUMNS, activity(data))
+
+    with engine.connect() as connection:
+        connection.execute(text("ANALYZE"))
+        connection.commit()
+    return rows
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seed", type=int, default=1, help="Semente (IDs e conteúdos)")
+    parser.add_argument("--orgs", type=int, default=20)
+    parser.add_argument("--users-per-org", type=int, default=10)
+    parser.add_argument("--projects-per-org", type=int, default=5)
+    parser.add_argument("--boards-per-project", type=int, default=4)
+    parser.add_argument("--columns-per-board", type=int, default=5)
+    parser.add_argument("--tags-per-project", type=int, default=8)
+    parser.add_argument("--tasks", type=int, default=1000000)
+    parser.add_argument(
+        "--tagged-ratio", type=float, default=0.5, help="Fração de tarefas com tags"
+    )
+    parser.add_argument("--comments", type=int, default=1000000)
+    parser.add_argument("--activity", type=int, default=2000000)
+    parser.add_argument("--activity-days", type=int, default=90)
+    parser.add_argument("--clean", action="store_true", help="Remove os dados do --seed e sai")
+    return parser.parse_args(argv)
+
+
+def main() -> None:
+    args = parse_args()
+    engine = create_engine(settings.DATABASE_URL)
+    if args.clean:
+        with engine.connect() as connection:
+            clean(connection, args.seed)
+        return
+
+    data = Dataset(args)
+    if data.columns > args.tasks:
+        raise SystemExit("--tasks must be at least the number of columns")
+    print(
+        f"seed {args.seed}: {args.orgs} orgs, {data.users} users, {data.projects} projects, "
+        f"{data.boards} boards, {data.columns} columns"
+    )
+    started = time.perf_counter()
+    rows = seed(engine, data)
+    print(f"{sum(rows.values())} rows in {time.perf_counter() - started:.1f} s")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Micro-benchmark da serialização das listagens de tarefas: response_model x orjson
+
+Compara, em processo (httpx.ASGITransport, sem rede nem banco), uma rota
+GET com --sizes tarefas por resposta em dois caminhos:
+
+- orm:  objetos Task devolvidos à rota com response_model=List[TaskResponse]
+        (validação Pydantic objeto a objeto e codificação com o módulo json)
+- rows: tuplas com as colunas do schema (app.utils.fast_json.response_columns)
+        codificadas pelo orjson com rows_payload + fast_json_response
+
+Para cada tamanho imprime ms/requisição, tamanho do corpo e ganho do caminho
+rows. Termina com código 1 se os corpos dos dois caminhos forem diferentes
+(verificação de regressão do formato da resposta).
+
+    python -m benchmarks.serialization --sizes 100 1000 10000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+import httpx
+from fastapi import FastAPI
+
+from app.models.task import Task, TaskPriority
+from app.schemas.task import TaskResponse
+from app.utils.fast_json import fast_json_response, rows_payload
+
+FIELDS = tuple(TaskResponse.model_fields)
+
+
+def build_rows(size: int, rng: random.Random) -> List[Tuple]:
+    """Linhas como as de select(*response_columns(Task, TaskResponse))"""
+    column_id, created_by = uuid.uuid4(), uuid.uuid4()
+    base = datetime(2024, 1, 1)
+    rows = []
+    for number in range(size):
+        created_at = base + timedelta(seconds=number, microseconds=rng.randrange(1_000_000))
+        values = {
+            "title": f"Tarefa {number} – revisão",
+            "description": None if number % 3 else 'Descrição com acentuação e "aspas"' * 3,
+            "priority": rng.choice(list(TaskPriority)),
+            "due_date": created_at + timedelta(days=7) if number % 4 == 0 else None,
+            "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+            "position": number,
+            "column_id": column_id,
+            "assignee_id": created_by if number % 2 else None,
+            "created_by": created_by,
+            "comment_count": rng.randrange(20),
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+        rows.append(tuple(values[field] for field in FIELDS))
+    return rows
+
+
+def build_app(rows: List[Tuple]) -> FastAPI:
+    tasks = [Task(**dict(zip(FIELDS, row))) for row in rows]
+    app = FastAPI()
+
+    @app.get("/orm", response_model=List[TaskResponse])
+    async def orm_path():
+        return tasks
+
+    @app.get("/rows", response_model=List[TaskResponse])
+    async def rows_path():
+        return fast_json_response(rows_payload(rows, TaskResponse))
+
+    return app
+
+
+async def measure(size: int, requests: int, seed: int) -> Dict:
+    app = build_app(build_rows(size, random.Random(seed)))
+    transport = httpx.ASGITransport(app=app)
+    result: Dict = {"size": size}
+    bodies = {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for path in ("orm", "rows"):
+            response = await client.get(f"/{path}")  # aquecimento
+            bodies[path] = response.content
+            started = time.perf_counter()
+            for _ in range(requests):
+                await client.get(f"/{path}")
+            elapsed = time.perf_counter() - started
+            result[f"{path}_ms"] = round(elapsed / requests * 1000, 3)
+    result["body_bytes"] = len(bodies["rows"])
+    result["speedup"] = round(result["orm_ms"] / result["rows_ms"], 2)
+    result["identical"] = bodies["orm"] == bodies["rows"]
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument(
+        "--requests", type=int, default=None, help="Requisições por caminho (padrão: ~200k tarefas)"
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", dest="json_output", default=None)
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        requests = args.requests or max(200_000 // size, 5)
+        result = asyncio.run(measure(size, requests, args.seed))
+        results.append(result)
+        print(
+            f"{result['size']:>7} tasks  orm {result['orm_ms']:>9} ms  "
+            f"rows {result['rows_ms']:>9} ms  x{result['speedup']:<5}  "
+            f"{result['body_bytes']:>9} bytes  identical {result['identical']}"
+        )
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2)
+
+    regressions = [result for result in results if not result["identical"]]
+    if regressions:
+        print(f"REGRESSION: response bodies differ for sizes {[r['size'] for r in regressions]}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Benchmark de WebSocket: milhares de inscritos ociosos em um board e latência de fan-out
+
+Abre `--subscribers` conexões em /ws/boards/{board_id}, mantém todas ociosas e
+dispara `--events` atualizações de tarefa via REST, medindo o tempo até cada
+inscrito receber o evento. Com `--server-pid`, também informa o RSS do servidor
+antes e depois das conexões (memória por conexão).
+
+    ulimit -n 65536
+    python -m benchmarks.ws_idle --url http://localhost:8000 --subscribers 5000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict, List, Optional
+
+import httpx
+import websockets
+
+from benchmarks.load import obtain_token, percentile
+
+
+def server_rss_kb(pid: Optional[int]) -> Optional[int]:
+    if pid is None:
+        return None
+    with open(f"/proc/{pid}/status", encoding="ascii") as status_file:
+        for line in status_file:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return None
+
+
+async def create_board(client: httpx.AsyncClient, headers: Dict[str, str]) -> Dict[str, str]:
+    """Cria projeto, board, coluna e uma tarefa para receber as atualizações"""
+    project = await client.post("/api/projects/", json={"name": "ws bench"}, headers=headers)
+    project.raise_for_status()
+    board = await client.post(
+        "/api/boards/",
+        json={"name": "ws bench", "project_id": project.json()["id"]},
+        headers=headers,
+    )
+    board.raise_for_status()
+    column = await client.post(
+        "/api/columns/",
+        json={"title": "todo", "position": 0, "board_id": board.json()["id"]},
+        headers=headers,
+    )
+    column.raise_for_status()
+    task = await client.post(
+        "/api/tasks/", json={"title": "ws bench", "column_id": column.json()["id"]}, headers=headers
+    )
+    task.raise_for_status()
+    return {
+        "project_id": project.json()["id"],
+        "board_id": board.json()["id"],
+        "task_id": task.json()["id"],
+    }
+
+
+async def run(args: argparse.Namespace) -> Dict:
+    async with httpx.AsyncClient(base_url=args.url, timeout=30.0) as client:
+        token = await obtain_token(client)
+        headers = {"Authorization": f"Bearer {token}"}
+        ids = await create_board(client, headers)
+
+        ws_url = args.url.replace("http", "ws", 1)
+        ws_url = f"{ws_url}/ws/boards/{ids['board_id']}?token={token}"
+
+        # arrivals[titulo] = instantes de chegada do evento em cada inscrito
+        arrivals: Dict[str, List[float]] = {}
+        connect_latencies: List[float] = []
+        sockets = []
+        readers = []
+        gate = asyncio.Semaphore(args.connect_concurrency)
+
+        async def read(socket) -> None:
+            async for raw in socket:
+                event = json.loads(raw)
+                if event["type"] == "task.updated":
+                    title = event["changes"].get("title")
+                    arrivals.setdefault(title, []).append(time.perf_counter())
+
+        async def connect() -> None:
+            async with gate:
+                started = time.perf_counter()
+                socket = await websockets.connect(ws_url, open_timeout=60, ping_interval=None)
+                await socket.recv()  # {"type": "subscribed"}
+                connect_latencies.append(time.perf_counter() - started)
+                sockets.append(socket)
+                readers.append(asyncio.create_task(read(socket)))
+
+        rss_before = server_rss_kb(args.server_pid)
+        started = time.perf_counter()
+        await asyncio.gather(*(connect() for _ in range(args.subscribers)))
+        connect_elapsed = time.perf_counter() - started
+        rss_after = server_rss_kb(args.server_pid)
+        print(
+            f"{len(sockets)} subscribers connected in {connect_elapsed:.2f}s "
+            f"(p99 {percentile(sorted(connect_latencies), 99) * 1000:.1f} ms)"
+        )
+
+        await asyncio.sleep(args.idle_seconds)
+
+        fanout: List[float] = []
+        for index in range(args.events):
+            title = f"ws bench {index}"
+            sent = time.perf_counter()
+            response = await client.put(
+                f"/api/tasks/{ids['task_id']}", json={"title": title}, headers=headers
+            )
+            response.raise_for_status()
+            deadline = sent + args.timeout
+            while len(arrivals.get(title, ())) < len(sockets) and time.perf_counter() < deadline:
+                await asyncio.sleep(0.005)
+            received = arrivals.get(title, [])
+            fanout.extend(arrival - sent for arrival in received)
+            last = (max(received) - sent) * 1000 if received else float("nan")
+            print(f"event {index}: {len(received)}/{len(sockets)} delivered, last at {last:.1f} ms")
+
+        for reader in readers:
+            reader.cancel()
+        await asyncio.gather(*(socket.close() for socket in sockets), return_exceptions=True)
+        await client.delete(f"/api/projects/{ids['project_id']}", headers=headers)
+
+    ordered = sorted(fanout)
+    return {
+        "subscribers": len(sockets),
+        "connect_seconds": round(connect_elapsed, 3),
+        "connect_p99_ms": round(percentile(sorted(connect_latencies), 99) * 1000, 2),
+        "server_rss_kb_before": rss_before,
+        "server_rss_kb_after": rss_after,
+        "events": args.events,
+        "deliveries": len(ordered),
+        "expected_deliveries": args.events * len(sockets),
+        "fanout_p50_ms": round(percentile(ordered, 50) * 1000, 2),
+        "fanout_p99_ms": round(percentile(ordered, 99) * 1000, 2),
+        "fanout_max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--subscribers", type=int, default=2000)
+    parser.add_argument("--connect-concurrency", type=int, default=200)
+    parser.add_argument("--events", type=int, default=10)
+    parser.add_argument("--idle-seconds", type=float, default=5.0)
+    parser.add_argument("--timeout", type=float, default=10.0, help="Espera máxima por evento")
+    parser.add_argument("--server-pid", type=int, default=None, help="PID para medir o RSS")
+    parser.add_argument("--json", dest="json_output", default=None)
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    print(json.dumps(result, indent=2))
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as output:
+            json.dump(result, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
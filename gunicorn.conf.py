@@ -0,0 +1,98 @@
+"""
+Configuração do Gunicorn para produção (start.sh / Dockerfile)
+
+    gunicorn -c gunicorn.conf.py app.main:app
+
+Variáveis de ambiente:
+- WEB_CONCURRENCY: nº de workers (padrão: nº de CPUs)
+- PORT / HOST: endereço de escuta (padrão 0.0.0.0:10000)
+- DB_POOL_SIZE / DB_MAX_OVERFLOW: pool de conexões desejado por worker
+- DB_CONNECTION_BUDGET: total de conexões que todos os workers juntos podem
+  abrir (deixe folga abaixo do max_connections do PostgreSQL para migrações,
+  administração e outros serviços). Se workers × (pool + overflow) passar do
+  orçamento, o pool de cada worker é reduzido proporcionalmente.
+- GUNICORN_MAX_REQUESTS: requisições até o worker ser reciclado (0 desliga)
+- PROMETHEUS_MULTIPROC_DIR: diretório onde os workers gravam as métricas para
+  que o GET /metrics agregue todos eles (limpo ao subir o master)
+"""
+
+import multiprocessing
+import os
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '10000')}"
+workers = int(os.getenv("WEB_CONCURRENCY") or multiprocessing.cpu_count())
+worker_class = "app.core.workers.KanbanUvicornWorker"
+
+# Importa a aplicação no master: os workers compartilham o código já carregado
+# (copy-on-write) e um erro de import derruba o deploy antes do fork
+preload_app = True
+
+# Reciclagem gradual dos workers (o jitter evita reiniciar todos ao mesmo tempo)
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "10000"))
+max_requests_jitter = max(max_requests // 10, 0)
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+keepalive = 5
+
+# Heartbeat dos workers em memória (evita bloqueios de disco em containers)
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+
+
+def _pool_per_worker(worker_count: int) -> tuple:
+    pool_size = int(os.getenv("DB_POOL_SIZE", "10"))
+    max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    budget = int(os.getenv("DB_CONNECTION_BUDGET", "90"))
+
+    per_worker = budget // worker_count
+    if per_worker < 1:
+        raise RuntimeError(f"DB_CONNECTION_BUDGET={budget} is too small for {worker_count} workers")
+    if pool_size + max_overflow > per_worker:
+        # Mantém a proporção pool/overflow dentro da fatia de cada worker
+        pool_size = max(1, per_worker * pool_size // (pool_size + max_overflow))
+        max_overflow = per_worker - pool_size
+    return pool_size, max_overflow
+
+
+# Exportado antes do preload: app.core.config lê estes valores ao ser importado
+DB_POOL_SIZE, DB_MAX_OVERFLOW = _pool_per_worker(workers)
+os.environ["DB_POOL_SIZE"] = str(DB_POOL_SIZE)
+os.environ["DB_MAX_OVERFLOW"] = str(DB_MAX_OVERFLOW)
+
+
+def when_ready(server):
+    server.log.info(
+        "%s workers, DB pool %s + %s overflow per worker (max %s connections)",
+        workers,
+        DB_POOL_SIZE,
+        DB_MAX_OVERFLOW,
+        workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW),
+    )
+
+
+def on_starting(server):
+    # Métricas de uma execução anterior não valem mais
+    directory = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        for name in os.listdir(directory):
+            if name.endswith(".db"):
+                os.remove(os.path.join(directory, name))
+
+
+def child_exit(server, worker):
+    # Gauges "live" do worker que saiu deixam de ser somadas
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
+
+
+def post_fork(server, worker):
+    # Os engines são criados no lifespan de cada worker; se algum código do
+    # preload tiver aberto conexões no master, o worker descarta o pool herdado
+    from app.core.database import reset_engines_after_fork
+
+    reset_engines_after_fork()
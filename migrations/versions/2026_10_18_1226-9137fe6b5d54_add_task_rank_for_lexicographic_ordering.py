@@ -0,0 +1,45 @@
+"""add task rank for lexicographic ordering
+
+Revision ID: 9137fe6b5d54
+Revises: 5ecc97b51e0b
+Create Date: 2026-10-18 12:26:41.028190+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9137fe6b5d54'
+down_revision: Union[str, None] = '5ecc97b51e0b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Collation "C": a ordem dos ranks é a ordem dos bytes, independente do locale
+    op.add_column('tasks', sa.Column('rank', sa.String(length=64, collation='C'), nullable=True))
+
+    # Converte as posições inteiras em ranks: a n-ésima tarefa de cada coluna
+    # recebe n em hexadecimal com 7 dígitos, sem zeros à direita (forma canônica
+    # de app/utils/lexorank.py; dígitos 0-f são um subconjunto da base 36)
+    op.execute(
+        """
+        UPDATE tasks
+        SET rank = rtrim(lpad(to_hex(ordered.rn), 7, '0'), '0')
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY column_id ORDER BY position, id) AS rn
+            FROM tasks
+        ) AS ordered
+        WHERE tasks.id = ordered.id
+        """
+    )
+
+    op.create_index('ix_tasks_column_id_rank', 'tasks', ['column_id', 'rank'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_column_id_rank', table_name='tasks')
+    op.drop_column('tasks', 'rank')
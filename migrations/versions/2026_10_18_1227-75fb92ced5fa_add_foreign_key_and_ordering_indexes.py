@@ -0,0 +1,49 @@
+"""add foreign key and ordering indexes
+
+Revision ID: 75fb92ced5fa
+Revises: 9137fe6b5d54
+Create Date: 2026-10-18 12:27:14.517936+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '75fb92ced5fa'
+down_revision: Union[str, None] = '9137fe6b5d54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY não bloqueia escritas nas tabelas; exige rodar fora de transação
+    with op.get_context().autocommit_block():
+        op.create_index('ix_activity_logs_task_id_created_at', 'activity_logs', ['task_id', 'created_at'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_activity_logs_user_id'), 'activity_logs', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_boards_project_id'), 'boards', ['project_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_columns_board_id_position', 'columns', ['board_id', 'position'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_comments_task_id_created_at', 'comments', ['task_id', 'created_at'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_comments_user_id'), 'comments', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_projects_owner_id_created_at', 'projects', ['owner_id', 'created_at'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_tags_project_id'), 'tags', ['project_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_tasks_assignee_id'), 'tasks', ['assignee_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_tasks_column_id_position', 'tasks', ['column_id', 'position'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_tasks_created_by'), 'tasks', ['created_by'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f('ix_tasks_created_by'), table_name='tasks', postgresql_concurrently=True)
+        op.drop_index('ix_tasks_column_id_position', table_name='tasks', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_tasks_assignee_id'), table_name='tasks', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_tags_project_id'), table_name='tags', postgresql_concurrently=True)
+        op.drop_index('ix_projects_owner_id_created_at', table_name='projects', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_comments_user_id'), table_name='comments', postgresql_concurrently=True)
+        op.drop_index('ix_comments_task_id_created_at', table_name='comments', postgresql_concurrently=True)
+        op.drop_index('ix_columns_board_id_position', table_name='columns', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_boards_project_id'), table_name='boards', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_activity_logs_user_id'), table_name='activity_logs', postgresql_concurrently=True)
+        op.drop_index('ix_activity_logs_task_id_created_at', table_name='activity_logs', postgresql_concurrently=True)
@@ -0,0 +1,38 @@
+"""add task search vector
+
+Revision ID: 3c1f7a9d2b64
+Revises: 75fb92ced5fa
+Create Date: 2026-10-18 14:15:02.318544+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f7a9d2b64'
+down_revision: Union[str, None] = '75fb92ced5fa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Coluna gerada (STORED): o PostgreSQL mantém o tsvector a cada INSERT/UPDATE de
+    # título/descrição. Adicionar a coluna reescreve a tabela tasks (lock exclusivo
+    # durante a reescrita); em bases grandes rode em janela de manutenção.
+    op.execute(
+        "ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+        ") STORED"
+    )
+    with op.get_context().autocommit_block():
+        op.create_index('ix_tasks_search_vector', 'tasks', ['search_vector'], unique=False, postgresql_using='gin', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tasks_search_vector', table_name='tasks', postgresql_concurrently=True)
+    op.drop_column('tasks', 'search_vector')
@@ -0,0 +1,63 @@
+"""add activity log board and project
+
+Revision ID: 8e4b2f6c1a93
+Revises: 3c1f7a9d2b64
+Create Date: 2026-10-18 15:10:41.902215+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4b2f6c1a93'
+down_revision: Union[str, None] = '3c1f7a9d2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('activity_logs', sa.Column('board_id', sa.UUID(), nullable=True))
+    op.add_column('activity_logs', sa.Column('project_id', sa.UUID(), nullable=True))
+    op.create_foreign_key(op.f('activity_logs_board_id_fkey'), 'activity_logs', 'boards', ['board_id'], ['id'], ondelete='CASCADE')
+    op.create_foreign_key(op.f('activity_logs_project_id_fkey'), 'activity_logs', 'projects', ['project_id'], ['id'], ondelete='CASCADE')
+
+    # Preenche board/projeto dos registros existentes a partir da tarefa
+    op.execute(
+        """
+        UPDATE activity_logs AS a
+        SET board_id = c.board_id, project_id = b.project_id
+        FROM tasks AS t
+        JOIN columns AS c ON c.id = t.column_id
+        JOIN boards AS b ON b.id = c.board_id
+        WHERE a.task_id = t.id
+        """
+    )
+    # Tarefas já excluídas: a coluna está em meta_data (gravado pelo activity writer)
+    op.execute(
+        """
+        UPDATE activity_logs AS a
+        SET board_id = c.board_id, project_id = b.project_id
+        FROM columns AS c
+        JOIN boards AS b ON b.id = c.board_id
+        WHERE a.task_id IS NULL
+          AND a.meta_data LIKE '{%"column_id"%'
+          AND c.id::text = a.meta_data::jsonb ->> 'column_id'
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index('ix_activity_logs_board_id_created_at', 'activity_logs', ['board_id', 'created_at', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_activity_logs_project_id_created_at', 'activity_logs', ['project_id', 'created_at', 'id'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_activity_logs_project_id_created_at', table_name='activity_logs', postgresql_concurrently=True)
+        op.drop_index('ix_activity_logs_board_id_created_at', table_name='activity_logs', postgresql_concurrently=True)
+    op.drop_constraint(op.f('activity_logs_project_id_fkey'), 'activity_logs', type_='foreignkey')
+    op.drop_constraint(op.f('activity_logs_board_id_fkey'), 'activity_logs', type_='foreignkey')
+    op.drop_column('activity_logs', 'project_id')
+    op.drop_column('activity_logs', 'board_id')
@@ -0,0 +1,113 @@
+"""partition activity logs by month
+
+Revision ID: b7d3e9a4c2f1
+Revises: 8e4b2f6c1a93
+Create Date: 2026-10-18 16:00:12.508311+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3e9a4c2f1'
+down_revision: Union[str, None] = '8e4b2f6c1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Meses criados à frente do atual; depois disso o comando
+# `python -m app.services.activity_partitions` mantém as partições
+PREMAKE_MONTHS = 3
+
+INDEXES = [
+    ('ix_activity_logs_task_id_created_at', ['task_id', 'created_at']),
+    ('ix_activity_logs_user_id', ['user_id']),
+    ('ix_activity_logs_board_id_created_at', ['board_id', 'created_at', 'id']),
+    ('ix_activity_logs_project_id_created_at', ['project_id', 'created_at', 'id']),
+]
+
+COLUMNS = (
+    "id, action, description, meta_data, task_id, user_id, board_id, project_id, "
+    "created_at, updated_at"
+)
+
+
+def _create_activity_logs(primary_key, **kw) -> None:
+    op.create_table('activity_logs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('action', postgresql.ENUM('TASK_CREATED', 'TASK_UPDATED', 'TASK_DELETED', 'TASK_MOVED', 'TASK_ASSIGNED', 'COMMENT_ADDED', 'TAG_ADDED', 'TAG_REMOVED', name='activityaction', create_type=False), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('meta_data', sa.Text(), nullable=True),
+    sa.Column('task_id', sa.UUID(), nullable=True),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('board_id', sa.UUID(), nullable=True),
+    sa.Column('project_id', sa.UUID(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], name='activity_logs_task_id_fkey'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], name='activity_logs_user_id_fkey'),
+    sa.ForeignKeyConstraint(['board_id'], ['boards.id'], name='activity_logs_board_id_fkey', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], name='activity_logs_project_id_fkey', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint(*primary_key, name='activity_logs_pkey'),
+    **kw
+    )
+
+
+def _rename_old_table(name: str) -> None:
+    # Nomes de índices são únicos no schema: os da tabela antiga saem do caminho
+    op.rename_table('activity_logs', name)
+    op.execute(f"ALTER TABLE {name} RENAME CONSTRAINT activity_logs_pkey TO {name}_pkey")
+    for index, _ in INDEXES:
+        op.drop_index(index, table_name=name)
+
+
+def upgrade() -> None:
+    # Copia a tabela inteira com lock exclusivo (o activity writer espera e
+    # grava o lote depois); em bases grandes rode em janela de manutenção
+    _rename_old_table('activity_logs_unpartitioned')
+    _create_activity_logs(['id', 'created_at'], postgresql_partition_by='RANGE (created_at)')
+    op.execute("CREATE TABLE activity_logs_default PARTITION OF activity_logs DEFAULT")
+
+    # Uma partição por mês, do registro mais antigo até PREMAKE_MONTHS à frente
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            month date;
+        BEGIN
+            SELECT date_trunc('month', coalesce(min(created_at), now() at time zone 'utc'))
+            INTO month FROM activity_logs_unpartitioned;
+            WHILE month <= date_trunc('month', now() at time zone 'utc')
+                           + interval '{PREMAKE_MONTHS} months' LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF activity_logs FOR VALUES FROM (%L) TO (%L)',
+                    'activity_logs_' || to_char(month, 'YYYY_MM'), month, month + interval '1 month'
+                );
+                month := month + interval '1 month';
+            END LOOP;
+        END $$
+        """
+    )
+    op.execute(
+        f"INSERT INTO activity_logs ({COLUMNS}) SELECT {COLUMNS} FROM activity_logs_unpartitioned"
+    )
+    op.drop_table('activity_logs_unpartitioned')
+
+    # Índices no pai são criados em cada partição (CONCURRENTLY não é suportado aqui)
+    for index, columns in INDEXES:
+        op.create_index(index, 'activity_logs', columns, unique=False)
+
+
+def downgrade() -> None:
+    _rename_old_table('activity_logs_partitioned')
+    _create_activity_logs(['id'])
+    op.execute(
+        f"INSERT INTO activity_logs ({COLUMNS}) SELECT {COLUMNS} FROM activity_logs_partitioned"
+    )
+    # Remove também todas as partições
+    op.drop_table('activity_logs_partitioned')
+    for index, columns in INDEXES:
+        op.create_index(index, 'activity_logs', columns, unique=False)
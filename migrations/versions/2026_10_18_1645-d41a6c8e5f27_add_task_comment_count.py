@@ -0,0 +1,35 @@
+"""add task comment count
+
+Revision ID: d41a6c8e5f27
+Revises: b7d3e9a4c2f1
+Create Date: 2026-10-18 16:45:03.117624+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41a6c8e5f27'
+down_revision: Union[str, None] = 'b7d3e9a4c2f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Default constante: só altera o catálogo, sem reescrever tasks
+    op.add_column('tasks', sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        """
+        UPDATE tasks
+        SET comment_count = counts.total
+        FROM (SELECT task_id, count(*) AS total FROM comments GROUP BY task_id) AS counts
+        WHERE counts.task_id = tasks.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('tasks', 'comment_count')
@@ -0,0 +1,56 @@
+"""fold task tags association
+
+Revision ID: e5f8a2b9c3d6
+Revises: d41a6c8e5f27
+Create Date: 2026-10-18 17:20:47.660154+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f8a2b9c3d6'
+down_revision: Union[str, None] = 'd41a6c8e5f27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # task_tags passa a ser a única associação: traz os pares gravados pelo model
+    # TaskTag (task_tags_association) e remove a tabela duplicada
+    op.execute(
+        """
+        INSERT INTO task_tags (task_id, tag_id)
+        SELECT task_id, tag_id FROM task_tags_association
+        ON CONFLICT DO NOTHING
+        """
+    )
+    op.drop_table('task_tags_association')
+
+    op.drop_constraint('task_tags_task_id_fkey', 'task_tags', type_='foreignkey')
+    op.drop_constraint('task_tags_tag_id_fkey', 'task_tags', type_='foreignkey')
+    op.create_foreign_key('task_tags_task_id_fkey', 'task_tags', 'tasks', ['task_id'], ['id'], ondelete='CASCADE')
+    op.create_foreign_key('task_tags_tag_id_fkey', 'task_tags', 'tags', ['tag_id'], ['id'], ondelete='CASCADE')
+    with op.get_context().autocommit_block():
+        op.create_index('ix_task_tags_tag_id_task_id', 'task_tags', ['tag_id', 'task_id'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_task_tags_tag_id_task_id', table_name='task_tags', postgresql_concurrently=True)
+    op.drop_constraint('task_tags_tag_id_fkey', 'task_tags', type_='foreignkey')
+    op.drop_constraint('task_tags_task_id_fkey', 'task_tags', type_='foreignkey')
+    op.create_foreign_key('task_tags_tag_id_fkey', 'task_tags', 'tags', ['tag_id'], ['id'])
+    op.create_foreign_key('task_tags_task_id_fkey', 'task_tags', 'tasks', ['task_id'], ['id'])
+
+    op.create_table('task_tags_association',
+    sa.Column('task_id', sa.UUID(), nullable=False),
+    sa.Column('tag_id', sa.UUID(), nullable=False),
+    sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ),
+    sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ),
+    sa.PrimaryKeyConstraint('task_id', 'tag_id')
+    )
+    op.execute("INSERT INTO task_tags_association (task_id, tag_id) SELECT task_id, tag_id FROM task_tags")
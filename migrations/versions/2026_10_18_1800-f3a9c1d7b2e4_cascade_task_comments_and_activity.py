@@ -0,0 +1,34 @@
+"""cascade task comments and activity
+
+Revision ID: f3a9c1d7b2e4
+Revises: e5f8a2b9c3d6
+Create Date: 2026-10-18 18:00:12.418305+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9c1d7b2e4'
+down_revision: Union[str, None] = 'e5f8a2b9c3d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Comentários e atividades saem com a tarefa pelo banco (passive_deletes nos
+    # relacionamentos de Task): excluir projetos/boards não carrega as listas por tarefa.
+    # activity_logs é particionada: a constraint do pai vale para todas as partições
+    op.drop_constraint('comments_task_id_fkey', 'comments', type_='foreignkey')
+    op.create_foreign_key('comments_task_id_fkey', 'comments', 'tasks', ['task_id'], ['id'], ondelete='CASCADE')
+    op.drop_constraint('activity_logs_task_id_fkey', 'activity_logs', type_='foreignkey')
+    op.create_foreign_key('activity_logs_task_id_fkey', 'activity_logs', 'tasks', ['task_id'], ['id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    op.drop_constraint('activity_logs_task_id_fkey', 'activity_logs', type_='foreignkey')
+    op.create_foreign_key('activity_logs_task_id_fkey', 'activity_logs', 'tasks', ['task_id'], ['id'])
+    op.drop_constraint('comments_task_id_fkey', 'comments', type_='foreignkey')
+    op.create_foreign_key('comments_task_id_fkey', 'comments', 'tasks', ['task_id'], ['id'])
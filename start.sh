@@ -7,11 +7,14 @@ echo "🚀 Iniciando processo de deploy..."
 if [ -f "alembic.ini" ]; then
     echo "📂 Rodando migrações do banco de dados..."
     alembic upgrade head
+    echo "🗓️ Criando partições futuras de activity_logs..."
+    python -m app.services.activity_partitions --premake-only
 else
     echo "⚠️ Erro: alembic.ini não encontrado na raiz do projeto!"
     # Você pode optar por sair ou continuar. Vamos continuar para a API subir:
 fi
 
 echo "✅ Pronto para iniciar!"
-echo "📡 Iniciando servidor FastAPI..."
-exec uvicorn app.main:app --host 0.0.0.0 --port 10000
+echo "📡 Iniciando servidor FastAPI (Gunicorn + workers Uvicorn)..."
+# Workers, pool do banco e reciclagem em gunicorn.conf.py (WEB_CONCURRENCY, DB_CONNECTION_BUDGET...)
+exec gunicorn -c gunicorn.conf.py app.main:app
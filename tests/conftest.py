@@ -0,0 +1,12 @@
+"""
+Configuração comum dos testes
+
+Os testes rodam com QUERY_BUDGET_MODE=raise: uma requisição acima do orçamento
+de queries da rota (@query_budget) ou com SQL repetido (N+1) levanta
+QueryBudgetExceeded e o teste falha. Definido antes de app.core.config ser
+importado pelos módulos de teste.
+"""
+
+import os
+
+os.environ["QUERY_BUDGET_MODE"] = "raise"
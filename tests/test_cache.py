@@ -0,0 +1,84 @@
+import uuid
+
+import pytest
+
+from app.core.cache import MemoryCacheBackend, ResponseCache
+
+
+@pytest.fixture
+def cache():
+    return ResponseCache(backend=MemoryCacheBackend(), ttl_seconds=300)
+
+
+@pytest.mark.asyncio
+async def test_bump_invalidates_cached_listing(cache):
+    column_id = uuid.uuid4()
+    listing = [{"id": uuid.uuid4(), "title": "Tarefa", "position": 0}]
+
+    cached, slot = await cache.lookup("column", column_id, "tasks")
+    assert cached is None
+    await cache.store(slot, listing)
+
+    cached, _ = await cache.lookup("column", column_id, "tasks")
+    assert cached == [{**listing[0], "id": str(listing[0]["id"])}]
+
+    # Escrita na coluna: a versão muda e a listagem antiga deixa de ser servida
+    await cache.bump("column", column_id)
+    cached, slot = await cache.lookup("column", column_id, "tasks")
+    assert cached is None
+
+    await cache.store(slot, [])
+    cached, _ = await cache.lookup("column", column_id, "tasks")
+    assert cached == []
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_bump_accepts_str_and_uuid_ids(cache):
+    column_id = uuid.uuid4()
+
+    _, slot = await cache.lookup("column", str(column_id).upper(), "tasks")
+    await cache.store(slot, ["cached"])
+    await cache.bump("column", column_id)
+
+    cached, _ = await cache.lookup("column", str(column_id), "tasks")
+    assert cached is None
+
+
+@pytest.mark.asyncio
+async def test_bump_only_invalidates_its_entity(cache):
+    bumped, other = uuid.uuid4(), uuid.uuid4()
+    for column_id in (bumped, other):
+        _, slot = await cache.lookup("column", column_id, "tasks")
+        await cache.store(slot, [str(column_id)])
+    _, slot = await cache.lookup("board", bumped, "columns")
+    await cache.store(slot, ["board"])
+
+    await cache.bump("column", bumped)
+
+    assert (await cache.lookup("column", bumped, "tasks"))[0] is None
+    assert (await cache.lookup("column", other, "tasks"))[0] == [str(other)]
+    assert (await cache.lookup("board", bumped, "columns"))[0] == ["board"]
+
+
+@pytest.mark.asyncio
+async def test_store_after_concurrent_write_is_never_served(cache):
+    column_id = uuid.uuid4()
+
+    # A leitura fixa a versão antes da query; uma escrita termina no meio
+    _, slot = await cache.lookup("column", column_id, "tasks")
+    await cache.bump("column", column_id)
+    await cache.store(slot, ["stale"])
+
+    cached, _ = await cache.lookup("column", column_id, "tasks")
+    assert cached is None
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_is_a_no_op():
+    cache = ResponseCache(backend=None)
+
+    assert await cache.lookup("column", uuid.uuid4(), "tasks") == (None, None)
+    await cache.store(None, ["ignored"])
+    await cache.bump("column", uuid.uuid4())
+    assert cache.stats()["hits"] == 0
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from app.utils.lexorank import ALPHABET, RANK_STEP, RANK_WIDTH, _to_int, rank_between, spaced_ranks
+
+
+def assert_canonical(rank):
+    assert rank and set(rank) <= set(ALPHABET)
+    assert not rank.endswith("0")
+
+
+def test_rank_between_without_neighbours():
+    rank = rank_between(None, None)
+
+    assert_canonical(rank)
+
+
+def test_rank_between_open_bounds():
+    assert rank_between(None, "i") < "i"
+    assert rank_between("i", None) > "i"
+    # Início/fim da coluna avançam um passo fixo, sem dividir o intervalo ao meio
+    assert _to_int(rank_between("i", None)) - _to_int("i") == RANK_STEP
+    assert _to_int("i") - _to_int(rank_between(None, "i")) == RANK_STEP
+
+
+def test_rank_between_open_bounds_near_the_limits():
+    last = "z" * RANK_WIDTH
+    first = "0" * (RANK_WIDTH - 1) + "1"
+
+    assert rank_between(last, None) > last
+    assert "" < rank_between(None, first) < first
+
+
+@pytest.mark.parametrize(
+    "before,after",
+    [("a", "b"), ("a", "a1"), ("0001", "0002"), ("h", "hzzz1"), ("i", "i00001")],
+)
+def test_adjacent_ranks_get_more_digits(before, after):
+    rank = rank_between(before, after)
+
+    assert before < rank < after
+    assert len(rank) > min(len(before), len(after))
+    assert_canonical(rank)
+
+
+@pytest.mark.parametrize("before,after", [("b", "a"), ("a", "a")])
+def test_invalid_interval(before, after):
+    with pytest.raises(ValueError):
+        rank_between(before, after)
+
+
+def test_random_inserts_sort_as_strings():
+    rng = random.Random(7)
+    ranks = []
+    for _ in range(2000):
+        index = rng.randint(0, len(ranks))
+        before = ranks[index - 1] if index > 0 else None
+        after = ranks[index] if index < len(ranks) else None
+        rank = rank_between(before, after)
+        assert_canonical(rank)
+        ranks.insert(index, rank)
+
+    assert ranks == sorted(ranks)
+    assert len(set(ranks)) == len(ranks)
+
+
+def test_repeated_inserts_at_the_same_point_keep_order():
+    # Sempre logo após o primeiro: o intervalo é dividido ao meio a cada inserção
+    ranks = ["i", "j"]
+    for _ in range(50):
+        ranks.insert(1, rank_between(ranks[0], ranks[1]))
+
+    assert ranks == sorted(ranks)
+    assert len(set(ranks)) == len(ranks)
+
+
+def test_spaced_ranks_are_evenly_spaced():
+    ranks = spaced_ranks(100)
+
+    assert len(ranks) == 100
+    assert ranks == sorted(ranks)
+    for rank in ranks:
+        assert_canonical(rank)
+    steps = {_to_int(after) - _to_int(before) for before, after in zip(ranks, ranks[1:])}
+    assert steps == {RANK_STEP}
+    assert spaced_ranks(0) == []
@@ -0,0 +1,80 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException, Response
+
+from app.utils.pagination import (
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+    parse_datetime,
+    set_next_cursor,
+)
+
+
+def raw_cursor(payload: bytes) -> str:
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+@pytest.mark.parametrize(
+    "values,types",
+    [
+        ((3, uuid.uuid4()), (int, uuid.UUID)),
+        ((datetime(2024, 5, 1, 12, 30, 0, 123456), uuid.uuid4()), (parse_datetime, uuid.UUID)),
+        (("a0i", uuid.uuid4()), (str, uuid.UUID)),
+        ((0.0607927, uuid.uuid4()), (float, uuid.UUID)),
+    ],
+)
+def test_round_trip(values, types):
+    cursor = encode_cursor(values)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, types) == list(values)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "%%%not-base64%%%",
+        "é",
+        raw_cursor(b"\xff\xfe"),
+        raw_cursor(b"not json"),
+        raw_cursor(b'{"position": 1}'),
+        # Faltando ou sobrando chaves
+        raw_cursor(b"[1]"),
+        raw_cursor(json.dumps([1, str(uuid.uuid4()), 2]).encode()),
+        # Tipos errados: UUID de número ou de lista, posição que não é inteiro
+        raw_cursor(b"[1, 5]"),
+        raw_cursor(b"[1, [1, 2]]"),
+        raw_cursor(b'[1, "not-a-uuid"]'),
+        raw_cursor(json.dumps(["x", str(uuid.uuid4())]).encode()),
+        raw_cursor(json.dumps([None, str(uuid.uuid4())]).encode()),
+    ],
+)
+def test_invalid_cursor_is_400(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor, (int, uuid.UUID))
+
+    assert error.value.status_code == 400
+
+
+def test_invalid_datetime_cursor_is_400():
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(encode_cursor(["yesterday", uuid.uuid4()]), (parse_datetime, uuid.UUID))
+
+    assert error.value.status_code == 400
+
+
+def test_next_cursor_only_for_full_pages():
+    rows = [(position, uuid.uuid4()) for position in range(3)]
+
+    response = Response()
+    assert set_next_cursor(response, rows, 4, lambda row: row) is None
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+    cursor = set_next_cursor(response, rows, 3, lambda row: row)
+    assert response.headers[NEXT_CURSOR_HEADER] == cursor
+    assert decode_cursor(cursor, (int, uuid.UUID)) == list(rows[-1])
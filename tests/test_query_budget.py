@@ -0,0 +1,97 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.core.metrics import instrument_engine
+from app.middleware.query_budget import QueryBudgetMiddleware
+from app.middleware.timing import TimingMiddleware
+from app.utils.query_budget import QueryBudgetExceeded, normalize_statement, query_budget
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    instrument_engine(engine, "test")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def client(engine):
+    """Aplicação mínima com a mesma pilha de middlewares de app.main"""
+    app = FastAPI()
+
+    @app.get("/within-budget")
+    @query_budget(2)
+    def within_budget():
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 'a', 'b'"))
+        return {"ok": True}
+
+    @app.get("/over-budget")
+    @query_budget(1)
+    def over_budget():
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 'a', 'b'"))
+        return {"ok": True}
+
+    @app.get("/n-plus-one")
+    def n_plus_one():
+        # Uma query por item, mudando só o parâmetro (relacionamento lazy em loop)
+        with engine.connect() as connection:
+            for item in range(settings.QUERY_REPEAT_THRESHOLD):
+                connection.execute(text("SELECT :item"), {"item": item})
+        return {"ok": True}
+
+    app.add_middleware(
+        QueryBudgetMiddleware,
+        repeat_threshold=settings.QUERY_REPEAT_THRESHOLD,
+        raise_on_violation=settings.QUERY_BUDGET_MODE == "raise",
+    )
+    app.add_middleware(TimingMiddleware, metrics=False)
+    with TestClient(app) as client:
+        yield client
+
+
+def test_suite_runs_in_raise_mode():
+    assert settings.QUERY_BUDGET_MODE == "raise"
+
+
+def test_app_enforces_budgets_in_tests():
+    from app.main import app
+
+    middleware = [item for item in app.user_middleware if item.cls is QueryBudgetMiddleware]
+    assert len(middleware) == 1
+    assert middleware[0].kwargs["raise_on_violation"] is True
+
+
+def test_route_within_budget_passes(client):
+    response = client.get("/within-budget")
+    assert response.status_code == 200
+    assert 'desc="2 queries"' in response.headers["Server-Timing"]
+
+
+def test_route_over_budget_raises(client):
+    with pytest.raises(QueryBudgetExceeded, match="2 queries, budget is 1"):
+        client.get("/over-budget")
+
+
+def test_repeated_statement_raises(client):
+    with pytest.raises(QueryBudgetExceeded, match="possible N\\+1, 3x: SELECT \\?"):
+        client.get("/n-plus-one")
+
+
+def test_normalize_statement_ignores_values():
+    assert normalize_statement("SELECT * FROM t WHERE id = $1::UUID AND n = 5") == (
+        "SELECT * FROM t WHERE id = ? AND n = ?"
+    )
+    assert normalize_statement("SELECT x FROM t WHERE id IN (?, ?, ?)") == (
+        "SELECT x FROM t WHERE id IN (?)"
+    )
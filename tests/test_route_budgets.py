@@ -0,0 +1,165 @@
+import re
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.user_cache import user_cache
+from app.main import app
+from app.utils.query_budget import budget_for
+
+# Rotas com @query_budget, chamadas uma vez cada com o cache de usuários vazio: a
+# query de get_current_user no cache miss faz parte do orçamento de todas elas
+BUDGETED_ROUTES = [
+    ("GET", "/api/projects", None),
+    ("GET", "/api/projects/{project_id}", None),
+    ("GET", "/api/projects/{project_id}/activity", None),
+    ("GET", "/api/boards/project/{project_id}", None),
+    ("GET", "/api/boards/{board_id}", None),
+    ("GET", "/api/boards/{board_id}/full", None),
+    ("GET", "/api/boards/{board_id}/activity", None),
+    ("GET", "/api/columns/board/{board_id}", None),
+    ("GET", "/api/tags/project/{project_id}", None),
+    ("GET", "/api/tasks?column_id={todo_id}", None),
+    ("GET", "/api/tasks/search?q=tarefa&project_id={project_id}", None),
+    ("GET", "/api/tasks/{task_id}", None),
+    ("GET", "/api/tasks/{task_id}/activity", None),
+    ("GET", "/api/tasks/{todo_id}/tasks", None),
+    ("GET", "/api/comments/task/{task_id}", None),
+    ("GET", "/api/comments/task/{task_id}/stream", None),
+    ("POST", "/api/comments", {"task_id": "{task_id}", "content": "Comentário"}),
+    (
+        "POST",
+        "/api/tasks/batch-tag",
+        {"action": "add", "task_ids": ["{task_id}"], "tag_ids": ["{tag_id}"]},
+    ),
+]
+
+_QUERY_COUNT = re.compile(r'desc="(\d+) queries"')
+
+
+def fill(value, ids):
+    if isinstance(value, str):
+        return value.format(**ids)
+    if isinstance(value, list):
+        return [fill(item, ids) for item in value]
+    if isinstance(value, dict):
+        return {key: fill(item, ids) for key, item in value.items()}
+    return value
+
+
+@pytest.fixture(scope="module")
+def api(tmp_path_factory):
+    """app.main sobre SQLite (aiosqlite), com as tabelas criadas no startup"""
+    database = tmp_path_factory.mktemp("db") / "kanban.db"
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(settings, "DATABASE_URL", f"sqlite+aiosqlite:///{database}")
+        patch.setattr(settings, "DB_AUTO_CREATE_TABLES", True)
+        patch.setattr(settings, "DEBUG", False)
+        patch.setattr(settings, "AUTH_MODE", "cache")
+        patch.setattr(settings, "BCRYPT_ROUNDS", 4)
+        with TestClient(app) as client:
+            yield client
+
+
+@pytest.fixture(scope="module")
+def ids(api):
+    """Usuário autenticado com projeto, board, colunas, tarefas, tag e comentário"""
+    username = f"budget_{uuid.uuid4().hex[:8]}"
+    api.post(
+        "/api/auth/register",
+        json={"username": username, "email": f"{username}@example.com", "password": "secret123"},
+    ).raise_for_status()
+    response = api.post("/api/auth/login", json={"username": username, "password": "secret123"})
+    api.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+
+    def create(path, payload):
+        response = api.post(path, json=payload)
+        assert response.status_code == 201, response.text
+        return response.json()["id"]
+
+    ids = {"project_id": create("/api/projects", {"name": "Projeto"})}
+    ids["board_id"] = create("/api/boards", {"name": "Board", "project_id": ids["project_id"]})
+    for name, position in (("todo_id", 0), ("done_id", 1)):
+        ids[name] = create(
+            "/api/columns",
+            {"title": name, "position": position, "board_id": ids["board_id"]},
+        )
+    ids["task_ids"] = [
+        create(
+            "/api/tasks",
+            {"title": f"Tarefa {number}", "description": "descrição", "column_id": ids["todo_id"]},
+        )
+        for number in range(6)
+    ]
+    ids["task_id"] = ids["task_ids"][0]
+    ids["tag_id"] = create(
+        "/api/tags", {"name": "urgente", "color": "#EF4444", "project_id": ids["project_id"]}
+    )
+    create("/api/comments", {"task_id": ids["task_id"], "content": "Primeiro"})
+    return ids
+
+
+def request(api, method, path, payload=None):
+    """Requisição com o cache de usuários vazio (get_current_user consulta o banco)"""
+    user_cache.clear()
+    response = api.request(method, path, json=payload)
+    assert response.status_code < 400, response.text
+    return response
+
+
+def route_for(method, path):
+    """Rota da aplicação que atende a requisição (como o roteador a escolheria)"""
+    path = path.split("?")[0]
+    for route in app.routes:
+        if method in getattr(route, "methods", ()) and route.path_regex.match(path):
+            return route
+
+
+def test_every_budgeted_route_is_covered():
+    covered = [route_for(method, path) for method, path, _ in BUDGETED_ROUTES]
+    covered.append(route_for("POST", "/api/tasks/batch"))
+    missing = [
+        route.path
+        for route in app.routes
+        if budget_for(getattr(route, "endpoint", None)) is not None and route not in covered
+    ]
+    assert missing == []
+
+
+@pytest.mark.parametrize("method,path,payload", BUDGETED_ROUTES)
+def test_route_within_budget_on_user_cache_miss(api, ids, method, path, payload):
+    # QueryBudgetMiddleware em modo raise: acima do orçamento a requisição levanta
+    response = request(api, method, fill(path, ids), fill(payload, ids))
+
+    queries = int(_QUERY_COUNT.search(response.headers["server-timing"]).group(1))
+    assert queries <= budget_for(route_for(method, path).endpoint)
+
+
+def test_malformed_id_is_rejected(api, ids):
+    assert api.get("/api/boards/not-a-uuid").status_code == 422
+
+
+def test_heterogeneous_batch_within_budget(api, ids):
+    first, second, third, fourth, fifth, last = ids["task_ids"]
+    operations = [
+        {"op": "create", "title": "Nova", "column_id": ids["todo_id"]},
+        {"op": "update", "task_id": first, "title": "Só o título"},
+        {"op": "update", "task_id": second, "description": "Só a descrição"},
+        {"op": "update", "task_id": third, "priority": "high", "due_date": None},
+        {"op": "update", "task_id": fourth, "assignee_id": None},
+        {"op": "move", "task_id": fifth, "column_id": ids["done_id"], "position": 0},
+        {"op": "delete", "task_id": last},
+    ]
+    # Cada update com um conjunto de campos diferente: ainda um único UPDATE em lote
+    results = request(api, "POST", "/api/tasks/batch", {"operations": operations}).json()["results"]
+
+    statuses = [item["status"] for item in results]
+    assert statuses == [201, 200, 200, 200, 200, 200, 204]
+    updated = {item["task"]["id"]: item["task"] for item in results[1:5]}
+    assert updated[first]["title"] == "Só o título"
+    assert updated[first]["description"] == "descrição"
+    assert updated[second]["title"] == "Tarefa 1"
+    assert updated[third]["priority"] == "high"
+    assert api.get(f"/api/tasks/{last}").status_code == 404
@@ -0,0 +1,91 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.database import get_async_db
+from app.core.user_cache import UserPrincipal
+from app.main import app
+from app.middleware.auth import get_current_user
+
+USER = UserPrincipal(id=uuid.uuid4(), is_active=True, is_superuser=False)
+
+
+class FakeSession:
+    """Sessão sem banco: o suficiente para list_projects e create_project"""
+
+    def __init__(self, counters):
+        self.counters = counters
+        self.added = []
+
+    async def execute(self, query):
+        self.counters["queries"] += 1
+        return type("Result", (), {"all": lambda self: []})()
+
+    def add(self, instance):
+        self.added.append(instance)
+
+    async def commit(self):
+        pass
+
+    async def refresh(self, instance):
+        now = datetime.now(timezone.utc)
+        instance.id, instance.created_at, instance.updated_at = uuid.uuid4(), now, now
+
+
+@pytest.fixture
+def counters():
+    return {"dispatches": 0, "handler": 0, "queries": 0}
+
+
+@pytest.fixture
+def session(counters):
+    return FakeSession(counters)
+
+
+@pytest.fixture
+def client(monkeypatch, counters, session):
+    """app.main com o banco e a autenticação substituídos, contando dispatches do roteador"""
+
+    async def fake_db():
+        yield session
+
+    # A dependência do usuário é resolvida uma vez por execução do handler
+    async def fake_user():
+        counters["handler"] += 1
+        return USER
+
+    router_app = app.router.middleware_stack
+
+    async def counting_router(scope, receive, send):
+        counters["dispatches"] += 1
+        await router_app(scope, receive, send)
+
+    monkeypatch.setattr(app.router, "middleware_stack", counting_router)
+    monkeypatch.setitem(app.dependency_overrides, get_async_db, fake_db)
+    monkeypatch.setitem(app.dependency_overrides, get_current_user, fake_user)
+    # Sem `with`: o lifespan (pool do banco, workers) não é iniciado
+    yield TestClient(app, follow_redirects=False)
+
+
+@pytest.mark.parametrize("path", ["/api/projects", "/api/projects/"])
+def test_get_dispatches_once(client, counters, path):
+    response = client.get(path)
+
+    assert response.status_code == 200
+    assert response.json() == []
+    assert counters == {"dispatches": 1, "handler": 1, "queries": 1}
+
+
+@pytest.mark.parametrize("path", ["/api/projects", "/api/projects/"])
+def test_post_dispatches_once_with_body(client, counters, session, path):
+    response = client.post(path, json={"name": "Projeto", "description": "com barra"})
+
+    assert response.status_code == 201
+    assert response.json()["name"] == "Projeto"
+    assert [(project.name, project.description) for project in session.added] == [
+        ("Projeto", "com barra")
+    ]
+    assert counters["dispatches"] == 1
+    assert counters["handler"] == 1
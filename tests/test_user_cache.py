@@ -0,0 +1,78 @@
+import uuid
+
+import pytest
+
+from app.core.user_cache import UserCache, UserPrincipal
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def principal():
+    return UserPrincipal(id=uuid.uuid4(), is_active=True, is_superuser=False)
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = UserCache(maxsize=10, ttl_seconds=60, clock=clock)
+    user = principal()
+    cache.set(user)
+
+    clock.now += 60
+    assert cache.get(user.id) == user
+
+    clock.now += 0.001
+    assert cache.get(user.id) is None
+    assert cache.stats()["size"] == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_set_renews_ttl(clock):
+    cache = UserCache(maxsize=10, ttl_seconds=60, clock=clock)
+    user = principal()
+    cache.set(user)
+
+    clock.now += 50
+    cache.set(user)
+    clock.now += 50
+    assert cache.get(user.id) == user
+
+
+def test_least_recently_used_is_evicted(clock):
+    cache = UserCache(maxsize=2, ttl_seconds=60, clock=clock)
+    first, second, third = principal(), principal(), principal()
+    cache.set(first)
+    cache.set(second)
+
+    # Ler o primeiro o torna o mais recente: o segundo é quem sai
+    assert cache.get(str(first.id)) == first
+    cache.set(third)
+
+    assert cache.get(second.id) is None
+    assert cache.get(first.id) == first
+    assert cache.get(third.id) == third
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate_and_disabled_cache(clock):
+    cache = UserCache(maxsize=2, ttl_seconds=60, clock=clock)
+    user = principal()
+    cache.set(user)
+    cache.invalidate(str(user.id))
+    cache.invalidate(user.id)
+
+    assert cache.get(user.id) is None
+    assert cache.stats()["invalidations"] == 1
+
+    disabled = UserCache(maxsize=0, ttl_seconds=60, clock=clock)
+    disabled.set(user)
+    assert disabled.get(user.id) is None